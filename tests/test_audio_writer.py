@@ -0,0 +1,92 @@
+import io
+import os
+import struct
+import tempfile
+import unittest
+import wave
+
+from tts_app.logic.audio_writer import (FsyncPolicy, MemoryAudioWriter, StreamAudioWriter,
+                                        StreamingAudioWriter)
+
+def _wav_segment(pcm: bytes, sample_rate: int = 16000) -> bytes:
+    """A complete WAV file holding pcm, like one synthesized segment"""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as segment:
+        segment.setnchannels(1)
+        segment.setsampwidth(2)
+        segment.setframerate(sample_rate)
+        segment.writeframes(pcm)
+    return buffer.getvalue()
+
+class StreamingAudioWriterTest(unittest.TestCase):
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self._directory.cleanup)
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self._directory.name, name)
+
+    def test_wav_segments_share_one_patched_header(self):
+        path = self._path("out.wav")
+        with StreamingAudioWriter(path, "WAV", FsyncPolicy.NEVER) as writer:
+            writer.write_chunk(_wav_segment(b"\x01\x00" * 100))
+            writer.write_chunk(_wav_segment(b"\x02\x00" * 50))
+
+        with wave.open(path, "rb") as result:
+            self.assertEqual(result.getframerate(), 16000)
+            self.assertEqual(result.getnframes(), 150)
+            self.assertEqual(result.readframes(150), b"\x01\x00" * 100 + b"\x02\x00" * 50)
+        with open(path, "rb") as written:
+            riff_size = struct.unpack("<I", written.read(8)[4:])[0]
+        self.assertEqual(riff_size, os.path.getsize(path) - 8)
+
+    def test_output_appears_only_when_closed(self):
+        path = self._path("out.mp3")
+        writer = StreamingAudioWriter(path).open()
+        writer.write_chunk(b"ID3audio")
+        self.assertFalse(os.path.exists(path))
+        self.assertTrue(os.path.exists(writer.temp_path))
+
+        writer.close()
+        with open(path, "rb") as written:
+            self.assertEqual(written.read(), b"ID3audio")
+        self.assertEqual(os.listdir(self._directory.name), ["out.mp3"])
+
+    def test_failure_discards_partial_output(self):
+        path = self._path("out.mp3")
+        with self.assertRaises(ValueError):
+            with StreamingAudioWriter(path) as writer:
+                writer.write_chunk(b"partial")
+                raise ValueError("synthesis failed")
+
+        self.assertEqual(os.listdir(self._directory.name), [])
+
+    def test_format_follows_extension(self):
+        self.assertEqual(StreamingAudioWriter.format_for_path("a/b.WAV"), "WAV")
+        self.assertEqual(StreamingAudioWriter.format_for_path("b.ogg"), "OGG")
+        self.assertEqual(StreamingAudioWriter.format_for_path("b.mp3"), "MP3")
+
+class InMemoryWritersTest(unittest.TestCase):
+
+    def test_memory_writer_patches_header_with_real_size(self):
+        writer = MemoryAudioWriter("WAV").open()
+        writer.write_chunk(_wav_segment(b"\x03\x00" * 10))
+        writer.close()
+
+        with wave.open(io.BytesIO(writer.content), "rb") as result:
+            self.assertEqual(result.getnframes(), 10)
+
+    def test_stream_writer_announces_unknown_length(self):
+        stream = io.BytesIO()
+        writer = StreamAudioWriter(stream, "WAV").open()
+        writer.write_chunk(_wav_segment(b"\x04\x00" * 10))
+        writer.close()
+
+        content = stream.getvalue()
+        data_size = struct.unpack("<I", content[40:44])[0]
+        self.assertEqual(data_size, StreamAudioWriter.UNKNOWN_DATA_SIZE)
+        self.assertEqual(content[44:], b"\x04\x00" * 10)
+
+if __name__ == "__main__":
+    unittest.main()
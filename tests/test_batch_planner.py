@@ -0,0 +1,79 @@
+import unittest
+
+try:
+    from tts_app.logic.batch_planner import BatchPlanner, LatencyModel
+    from tts_app.logic.synthesis_pipeline import SynthesisPipeline
+    from tts_app.logic.tts_service_manager import TTSServiceManager
+except ImportError as e:
+    raise unittest.SkipTest(f"Synthesis dependencies are not installed: {e}")
+
+from tts_app.models.tts_config import AudioConfig, TTSRequest, VoiceConfig
+
+def _request(text: str, voice_name: str, output_path: str) -> TTSRequest:
+    return TTSRequest(text=text, voice_config=VoiceConfig(language_code="en-US", voice_name=voice_name),
+                      audio_config=AudioConfig(), output_path=output_path)
+
+class LatencyModelTest(unittest.TestCase):
+
+    def test_fit_recovers_overhead_and_cost_per_character(self):
+        points = [(characters, 0.5 + 0.001 * characters) for characters in (100, 500, 1000, 3000)]
+        model = LatencyModel.fit(points)
+
+        self.assertAlmostEqual(model.overhead_seconds, 0.5)
+        self.assertAlmostEqual(model.seconds_per_character, 0.001)
+        self.assertEqual(model.samples, 4)
+        self.assertAlmostEqual(model.predict(2000), 2.5)
+
+    def test_too_few_samples_fall_back_to_defaults(self):
+        self.assertEqual(LatencyModel.fit([(100, 1.0)]), LatencyModel())
+
+    def test_equal_sized_chunks_spread_latency_over_characters(self):
+        model = LatencyModel.fit([(200, 1.0), (200, 1.0)])
+        self.assertEqual(model.overhead_seconds, 0.0)
+        self.assertAlmostEqual(model.predict(200), 1.0)
+
+class BatchPlannerTest(unittest.TestCase):
+
+    def test_cost_is_priced_per_voice_tier(self):
+        requests = [
+            _request("a" * 1000, "en-US-Standard-A", "standard.mp3"),
+            _request("b" * 500, "en-US-Studio-O", "studio.mp3")
+        ]
+        plan = BatchPlanner().plan(requests)
+
+        self.assertEqual(plan.billable_characters, 1500)
+        self.assertAlmostEqual(plan.tiers['Standard'].cost_usd, 1000 * 4.0 / 1_000_000)
+        self.assertAlmostEqual(plan.tiers['Studio'].cost_usd, 500 * 160.0 / 1_000_000)
+        self.assertAlmostEqual(plan.cost_usd, 0.004 + 0.08)
+
+    def test_invalid_requests_are_reported_not_billed(self):
+        plan = BatchPlanner().plan([_request("", "en-US-Standard-A", "empty.mp3")])
+
+        self.assertIn("empty.mp3", plan.invalid)
+        self.assertEqual(plan.rpcs, 0)
+        self.assertEqual(plan.cost_usd, 0.0)
+
+    def test_rate_limit_bounds_wall_clock(self):
+        requests = [_request(f"Request {index}.", "en-US-Standard-A", f"{index}.mp3") for index in range(60)]
+        plan = BatchPlanner().plan(requests, workers=4, requests_per_minute=30)
+
+        self.assertEqual(plan.rpcs, 60)
+        self.assertAlmostEqual(plan.wall_clock_seconds, 120.0)
+
+    def test_configured_concurrency_caps_rpcs_in_flight(self):
+        requests = [_request(f"Request {index}.", "en-US-Standard-A", f"{index}.mp3") for index in range(10)]
+        plan = BatchPlanner().plan(requests, workers=4, max_concurrent_rpcs=2)
+
+        self.assertEqual(plan.concurrency, 2)
+        self.assertAlmostEqual(plan.wall_clock_seconds, plan.rpc_seconds / 2)
+
+    def test_unconfigured_concurrency_starts_at_the_limiter_limit_per_process(self):
+        requests = [_request(f"Request {index}.", "en-US-Standard-A", f"{index}.mp3") for index in range(10)]
+        limit = TTSServiceManager.INITIAL_CONCURRENCY_LIMIT
+
+        self.assertEqual(BatchPlanner().plan(requests, workers=16).concurrency, limit)
+        self.assertEqual(BatchPlanner().plan(requests, workers=16, processes=2).concurrency, 2 * limit)
+        self.assertEqual(BatchPlanner().plan(requests, workers=1).concurrency, SynthesisPipeline.MAX_PARALLEL_CHUNKS)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+
+try:
+    import grpc
+except ImportError:
+    raise unittest.SkipTest("grpc is not installed")
+
+from tts_app.logic.cancellation import CancellationToken, OperationCancelledError
+from tts_app.logic.concurrency_controller import AdaptiveConcurrencyLimiter
+
+class _RpcError(Exception):
+    """RPC error carrying a gRPC status code, like the ones the client raises"""
+
+    def __init__(self, code: grpc.StatusCode):
+        super().__init__(f"RPC failed with {code}")
+        self._code = code
+
+    def code(self) -> grpc.StatusCode:
+        return self._code
+
+class AdaptiveConcurrencyLimiterTest(unittest.TestCase):
+
+    def test_limit_grows_only_while_it_is_the_bottleneck(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2)
+        limiter.acquire()
+        limiter.release(0.1)
+        self.assertEqual(limiter.limit, 2)
+
+        for _ in range(4):
+            limiter.acquire()
+            limiter.acquire()
+            limiter.release(0.1)
+            limiter.release(0.1)
+        self.assertEqual(limiter.limit, 3)
+
+    def test_quota_error_cuts_the_limit_once_per_baseline_latency(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+        limiter.acquire()
+        limiter.release(10.0)
+
+        for _ in range(3):
+            limiter.acquire()
+            limiter.release(0.1, _RpcError(grpc.StatusCode.RESOURCE_EXHAUSTED))
+        self.assertEqual(limiter.limit, 4)
+        self.assertEqual(limiter.metrics()['decreases'], 1)
+
+    def test_latency_inflation_cuts_the_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+        limiter.acquire()
+        limiter.release(0.1)
+        limiter.acquire()
+        limiter.release(1.0)
+        self.assertEqual(limiter.limit, 4)
+
+    def test_cancelled_calls_do_not_cut_the_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+        limiter.acquire()
+        limiter.release(0.1, OperationCancelledError("cancelled"))
+        self.assertEqual(limiter.limit, 8)
+        self.assertEqual(limiter.in_flight, 0)
+
+    def test_blocked_acquire_gives_up_on_cancellation(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+        limiter.acquire()
+        token = CancellationToken()
+        token.cancel()
+
+        with self.assertRaises(OperationCancelledError):
+            limiter.acquire(token)
+        self.assertEqual(limiter.in_flight, 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import time
+import unittest
+
+try:
+    import grpc
+except ImportError:
+    raise unittest.SkipTest("grpc is not installed")
+
+from tts_app.logic.credential_pool import CredentialPool
+
+class _RpcError(Exception):
+    """RPC error carrying a gRPC status code, like the ones the client raises"""
+
+    def __init__(self, code: grpc.StatusCode):
+        super().__init__(f"RPC failed with {code}")
+        self._code = code
+
+    def code(self) -> grpc.StatusCode:
+        return self._code
+
+def _pool(*paths) -> CredentialPool:
+    """Pool whose accounts have a placeholder client each"""
+    return CredentialPool(list(paths), client_factory=lambda path: [object()])
+
+class CredentialPoolTest(unittest.TestCase):
+
+    def test_single_account_is_not_ejected_on_credential_error(self):
+        pool = _pool("only.json")
+        member = pool.acquire(timeout=None)
+        pool.release(member, _RpcError(grpc.StatusCode.UNAUTHENTICATED))
+
+        started = time.monotonic()
+        self.assertIs(pool.acquire(timeout=None), member)
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertFalse(pool.status()[0]['ejected'])
+        self.assertEqual(pool.status()[0]['total_failures'], 1)
+
+    def test_acquire_fails_fast_when_every_account_is_ejected(self):
+        pool = _pool("first.json", "second.json")
+        for code in (grpc.StatusCode.UNAUTHENTICATED, grpc.StatusCode.RESOURCE_EXHAUSTED):
+            pool.release(pool.acquire(timeout=None), _RpcError(code))
+
+        started = time.monotonic()
+        with self.assertRaises(RuntimeError) as raised:
+            pool.acquire(timeout=None)
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertIn("Credentials rejected", str(raised.exception))
+        self.assertIn("Quota exhausted", str(raised.exception))
+
+    def test_failover_skips_ejected_account(self):
+        pool = _pool("first.json", "second.json")
+        first = pool.acquire(timeout=None)
+        pool.release(first, _RpcError(grpc.StatusCode.RESOURCE_EXHAUSTED))
+
+        second = pool.acquire(timeout=None)
+        self.assertIsNot(second, first)
+        with self.assertRaises(RuntimeError):
+            pool.acquire(timeout=None, exclude={second.credentials_path})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+
+from tts_app.logic.hedging import HedgePolicy, LatencyTracker
+
+def _tracker(*latencies) -> LatencyTracker:
+    tracker = LatencyTracker()
+    for seconds in latencies:
+        tracker.record(seconds)
+    return tracker
+
+class HedgePolicyTest(unittest.TestCase):
+
+    def test_no_hedging_until_enough_latencies_are_known(self):
+        policy = HedgePolicy(min_samples=20)
+        self.assertIsNone(policy.hedge_delay(_tracker(*[0.1] * 19)))
+        self.assertIsNotNone(policy.hedge_delay(_tracker(*[0.1] * 20)))
+
+    def test_delay_is_the_tail_percentile(self):
+        latencies = [index / 100 for index in range(1, 101)]
+        policy = HedgePolicy(percentile=95.0)
+        self.assertAlmostEqual(policy.hedge_delay(_tracker(*latencies)), 0.96)
+
+    def test_delay_never_drops_below_the_floor(self):
+        policy = HedgePolicy(min_delay=0.05)
+        self.assertEqual(policy.hedge_delay(_tracker(*[0.001] * 50)), 0.05)
+
+    def test_hedges_stay_within_budget(self):
+        policy = HedgePolicy(max_extra_ratio=0.1)
+        for _ in range(20):
+            policy.record_primary()
+
+        self.assertTrue(policy.try_hedge())
+        self.assertTrue(policy.try_hedge())
+        self.assertFalse(policy.try_hedge())
+        self.assertEqual(policy.hedged_calls, 2)
+
+    def test_tracker_keeps_a_sliding_window(self):
+        tracker = LatencyTracker(window=3)
+        for seconds in (5.0, 0.1, 0.2, 0.3):
+            tracker.record(seconds)
+        self.assertEqual(tracker.sample_count, 3)
+        self.assertEqual(tracker.percentile(100), 0.3)
+
+if __name__ == "__main__":
+    unittest.main()
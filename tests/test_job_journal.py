@@ -0,0 +1,85 @@
+import json
+import os
+import tempfile
+import unittest
+
+from tts_app.logic.job_journal import JobJournal, fingerprint_chunk
+from tts_app.models.job_config import JobStatus
+from tts_app.models.tts_config import AudioConfig, TTSRequest, VoiceConfig
+
+def _request(output_path: str) -> TTSRequest:
+    return TTSRequest(text="Hello there.", voice_config=VoiceConfig(),
+                      audio_config=AudioConfig(), output_path=output_path)
+
+class JobJournalTest(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.journal_path = os.path.join(self.directory, "jobs.jsonl")
+
+    def _journal(self) -> JobJournal:
+        return JobJournal(self.journal_path, fsync=False)
+
+    def test_replay_finds_unfinished_jobs_and_their_chunks(self):
+        journal = self._journal()
+        journal.record_job("running", _request("a.mp3"), JobStatus.RUNNING)
+        journal.record_job("done", _request("b.mp3"), JobStatus.QUEUED)
+        journal.record_status("done", JobStatus.COMPLETED)
+        journal.store_chunk("running", "f" * 64, 0, b"audio", characters=12, seconds=0.5)
+
+        replayed = self._journal()
+        self.assertEqual([job['job_id'] for job in replayed.pending_jobs()], ["running"])
+        self.assertEqual(replayed.load_chunk("running", "f" * 64), b"audio")
+        self.assertEqual(replayed.latency_samples(), [(12, 0.5)])
+
+    def test_torn_last_line_is_ignored(self):
+        self._journal().record_job("job", _request("a.mp3"), JobStatus.RUNNING)
+        with open(self.journal_path, "a", encoding="utf-8") as journal:
+            journal.write('{"type": "status", "job_id": "job", "sta')
+
+        self.assertEqual(self._journal().get_job("job")['status'], JobStatus.RUNNING.value)
+
+    def test_cancelled_job_keeps_no_parts(self):
+        journal = self._journal()
+        journal.record_job("job", _request("a.mp3"), JobStatus.RUNNING)
+        journal.store_chunk("job", "a" * 64, 0, b"first")
+        journal.record_status("job", JobStatus.CANCELLED)
+
+        self.assertFalse(journal.has_chunk("job", "a" * 64))
+        self.assertIsNone(journal.store_chunk("job", "b" * 64, 1, b"late"))
+        self.assertFalse(os.path.exists(os.path.join(journal.parts_dir, "job")))
+
+    def test_failed_job_keeps_parts_for_a_retry(self):
+        journal = self._journal()
+        journal.record_job("job", _request("a.mp3"), JobStatus.RUNNING)
+        journal.store_chunk("job", "a" * 64, 0, b"first")
+        journal.record_status("job", JobStatus.FAILED, "quota")
+
+        self.assertEqual(journal.load_chunk("job", "a" * 64), b"first")
+
+    def test_compact_drops_history_of_finished_jobs(self):
+        journal = self._journal()
+        journal.record_job("done", _request("b.mp3"), JobStatus.RUNNING)
+        journal.store_chunk("done", "c" * 64, 0, b"audio", characters=5, seconds=0.2)
+        journal.record_status("done", JobStatus.COMPLETED)
+        journal.record_job("pending", _request("c.mp3"), JobStatus.QUEUED)
+
+        journal.compact()
+
+        with open(self.journal_path, encoding="utf-8") as compacted:
+            records = [json.loads(line) for line in compacted]
+        self.assertEqual([record['type'] for record in records], ["timing", "job", "job"])
+        self.assertNotIn('request', records[1])
+        self.assertEqual(self._journal().latency_samples(), [(5, 0.2)])
+
+    def test_chunk_fingerprint_covers_voice_and_audio(self):
+        base = fingerprint_chunk("Hi", False, VoiceConfig(), AudioConfig())
+        self.assertEqual(base, fingerprint_chunk("Hi", False, VoiceConfig(), AudioConfig()))
+        self.assertNotEqual(base, fingerprint_chunk("Hi", True, VoiceConfig(), AudioConfig()))
+        self.assertNotEqual(base, fingerprint_chunk("Hi", False, VoiceConfig(voice_name="other"), AudioConfig()))
+        self.assertNotEqual(base, fingerprint_chunk("Hi", False, VoiceConfig(), AudioConfig(speaking_rate=1.5)))
+
+if __name__ == "__main__":
+    unittest.main()
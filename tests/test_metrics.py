@@ -0,0 +1,67 @@
+import unittest
+
+from tts_app.logic.metrics import Histogram, MetricsRegistry
+
+class HistogramTest(unittest.TestCase):
+
+    def test_values_land_in_cumulative_buckets(self):
+        histogram = Histogram((1.0, 2.0, 5.0))
+        for value in (0.5, 1.0, 1.5, 4.0, 10.0):
+            histogram.observe(value)
+
+        self.assertEqual(histogram.cumulative_counts(), [2, 3, 4, 5])
+        self.assertEqual(histogram.count, 5)
+        self.assertAlmostEqual(histogram.sum, 17.0)
+
+    def test_percentile_interpolates_within_a_bucket(self):
+        histogram = Histogram((1.0, 2.0))
+        for value in (1.2, 1.4, 1.6, 1.8):
+            histogram.observe(value)
+
+        self.assertAlmostEqual(histogram.percentile(0.5), 1.5)
+        self.assertAlmostEqual(histogram.percentile(1.0), 2.0)
+        self.assertIsNone(Histogram().percentile(0.5))
+
+    def test_percentile_beyond_last_bound_is_the_last_bound(self):
+        histogram = Histogram((1.0, 2.0))
+        histogram.observe(30.0)
+        self.assertEqual(histogram.percentile(0.99), 2.0)
+
+    def test_since_holds_only_later_values(self):
+        histogram = Histogram((1.0, 2.0))
+        histogram.observe(0.5)
+        earlier = histogram.copy()
+        histogram.observe(1.5)
+
+        delta = histogram.since(earlier)
+        self.assertEqual(delta.count, 1)
+        self.assertEqual(delta.cumulative_counts(), [0, 1, 1])
+        self.assertAlmostEqual(delta.sum, 1.5)
+
+class MetricsRegistryTest(unittest.TestCase):
+
+    def test_state_taken_from_one_registry_merges_into_another(self):
+        worker, parent = MetricsRegistry(), MetricsRegistry()
+        worker.observe('tts_stage_seconds', 0.2, stage="rpc")
+        worker.inc('tts_rpcs_total', 3)
+        parent.observe('tts_stage_seconds', 0.4, stage="rpc")
+
+        parent.merge_state(worker.take_state())
+
+        self.assertEqual(parent.histogram('tts_stage_seconds', stage="rpc").count, 2)
+        self.assertEqual(parent.counter('tts_rpcs_total'), 3)
+        self.assertIsNone(worker.histogram('tts_stage_seconds', stage="rpc"))
+
+    def test_prometheus_export_has_buckets_sum_and_count(self):
+        registry = MetricsRegistry()
+        registry.observe('tts_stage_seconds', 0.2, stage="rpc")
+        registry.register_gauge('tts_concurrency_limit', lambda: 8)
+
+        text = registry.to_prometheus()
+        self.assertIn('# TYPE tts_stage_seconds histogram', text)
+        self.assertIn('tts_stage_seconds_bucket{stage="rpc",le="+Inf"} 1', text)
+        self.assertIn('tts_stage_seconds_count{stage="rpc"} 1', text)
+        self.assertIn('tts_concurrency_limit 8', text)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import threading
+import time
+import unittest
+
+from tts_app.logic.cancellation import CancellationToken, DeadlineExceededError, OperationCancelledError
+from tts_app.logic.request_coalescer import RequestCoalescer
+
+class _SharedCall:
+    """Call that blocks until released, counting how often it is issued"""
+
+    def __init__(self, result="audio"):
+        self.result = result
+        self.calls = 0
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.cancelled = threading.Event()
+
+    def __call__(self, token: CancellationToken):
+        self.calls += 1
+        self.started.set()
+        token.add_callback(self.cancelled.set)
+        while not self.release.wait(0.01):
+            token.raise_if_cancelled()
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+def _in_thread(function, *args, **kwargs):
+    """Run function in a thread; the returned list receives its result or exception"""
+    outcome = []
+
+    def run():
+        try:
+            outcome.append(function(*args, **kwargs))
+        except Exception as e:
+            outcome.append(e)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread, outcome
+
+class RequestCoalescerTest(unittest.TestCase):
+
+    def test_concurrent_identical_calls_share_one_call(self):
+        coalescer = RequestCoalescer()
+        shared = _SharedCall()
+        callers = [_in_thread(coalescer.call, "key", shared) for _ in range(5)]
+        shared.started.wait(1)
+        time.sleep(0.05)
+        shared.release.set()
+        for thread, _ in callers:
+            thread.join(1)
+
+        self.assertEqual([outcome for _, outcome in callers], [["audio"]] * 5)
+        self.assertEqual(shared.calls, 1)
+        self.assertEqual(coalescer.total_saved, 4)
+        self.assertEqual(coalescer.in_flight, 0)
+
+    def test_errors_reach_every_caller(self):
+        coalescer = RequestCoalescer()
+        shared = _SharedCall(ValueError("bad request"))
+        callers = [_in_thread(coalescer.call, "key", shared) for _ in range(2)]
+        shared.started.wait(1)
+        time.sleep(0.05)
+        shared.release.set()
+        for thread, outcome in callers:
+            thread.join(1)
+            self.assertIsInstance(outcome[0], ValueError)
+
+    def test_cancelled_first_caller_returns_while_others_keep_waiting(self):
+        coalescer = RequestCoalescer()
+        shared = _SharedCall()
+        token = CancellationToken()
+        first, first_outcome = _in_thread(coalescer.call, "key", shared, cancel_token=token)
+        shared.started.wait(1)
+        second, second_outcome = _in_thread(coalescer.call, "key", shared, timeout=5)
+        time.sleep(0.05)
+
+        token.cancel()
+        first.join(1)
+        self.assertIsInstance(first_outcome[0], OperationCancelledError)
+        self.assertFalse(shared.cancelled.is_set())
+
+        shared.release.set()
+        second.join(1)
+        self.assertEqual(second_outcome, ["audio"])
+
+    def test_follower_keeps_its_own_longer_deadline(self):
+        coalescer = RequestCoalescer()
+        shared = _SharedCall()
+        first, first_outcome = _in_thread(coalescer.call, "key", shared, timeout=0.05)
+        shared.started.wait(1)
+        second, second_outcome = _in_thread(coalescer.call, "key", shared, timeout=5)
+
+        first.join(1)
+        self.assertIsInstance(first_outcome[0], DeadlineExceededError)
+        shared.release.set()
+        second.join(1)
+        self.assertEqual(second_outcome, ["audio"])
+
+    def test_shared_call_is_cancelled_once_every_caller_gave_up(self):
+        coalescer = RequestCoalescer()
+        shared = _SharedCall()
+
+        with self.assertRaises(DeadlineExceededError):
+            coalescer.call("key", shared, timeout=0.05)
+
+        self.assertTrue(shared.cancelled.wait(1))
+        self.assertEqual(coalescer.in_flight, 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+import xml.etree.ElementTree as ET
+
+from tts_app.logic.text_chunker import TextChunker
+
+def _spoken_text(ssml: str) -> str:
+    """Text of an SSML document as it would be read, with its whitespace"""
+    return "".join(ET.fromstring(ssml).itertext())
+
+class TextSplitTest(unittest.TestCase):
+
+    def test_short_text_is_one_chunk(self):
+        self.assertEqual(TextChunker(100).split("  Hello world.  "), ["Hello world."])
+        self.assertEqual(TextChunker(100).split("   "), [])
+
+    def test_splits_at_sentence_boundaries_within_budget(self):
+        text = " ".join(f"Sentence number {index} ends here." for index in range(40))
+        chunks = TextChunker(200).split(text)
+
+        self.assertGreater(len(chunks), 1)
+        for chunk in chunks:
+            self.assertLessEqual(len(chunk.encode("utf-8")), 200)
+            self.assertTrue(chunk.endswith("ends here."))
+        self.assertEqual(" ".join(chunks), text)
+
+    def test_budget_counts_bytes_not_characters(self):
+        text = "Ünïcödé wörds ärë wïdër. " * 40
+        for chunk in TextChunker(120).split(text):
+            self.assertLessEqual(len(chunk.encode("utf-8")), 120)
+
+    def test_sentence_longer_than_budget_is_split(self):
+        text = "word " * 100
+        chunks = TextChunker(60).split(text)
+
+        self.assertGreater(len(chunks), 1)
+        for chunk in chunks:
+            self.assertLessEqual(len(chunk.encode("utf-8")), 60)
+        self.assertEqual(" ".join(chunks).split(), text.split())
+
+class SSMLSplitTest(unittest.TestCase):
+
+    def test_chunks_keep_root_attributes_and_namespace(self):
+        sentence = '<s>Hello <break time="200ms"/> world.</s>'
+        document = (f'<speak version="1.0" xmlns="http://www.w3.org/2001/10/synthesis" '
+                    f'xml:lang="en-US">{sentence * 40}</speak>')
+
+        chunks = TextChunker(400).split(document, is_ssml=True)
+
+        self.assertGreater(len(chunks), 1)
+        for chunk in chunks:
+            self.assertLessEqual(len(chunk.encode("utf-8")), 400)
+            root = ET.fromstring(chunk)
+            self.assertEqual(root.get("version"), "1.0")
+            self.assertEqual(root.get("{http://www.w3.org/XML/1998/namespace}lang"), "en-US")
+            self.assertNotIn("ns0:", chunk)
+        self.assertEqual(sum(chunk.count("<s>") for chunk in chunks), 40)
+
+    def test_escapes_text_split_out_of_an_element(self):
+        document = f"<speak>{'Fish &amp; chips &lt;hot&gt;. ' * 30}</speak>"
+
+        for chunk in TextChunker(200).split(document, is_ssml=True):
+            self.assertIn("&amp;", chunk)
+            ET.fromstring(chunk)
+
+    def test_inline_elements_keep_surrounding_whitespace(self):
+        sentence = ('Hello <emphasis>big</emphasis> world. '
+                    'I say <say-as interpret-as="characters">ABC</say-as> now. ')
+        document = f"<speak>{sentence * 30}</speak>"
+
+        chunks = TextChunker(500).split(document, is_ssml=True)
+
+        self.assertGreater(len(chunks), 1)
+        spoken = " ".join(_spoken_text(chunk) for chunk in chunks)
+        self.assertNotIn("Hellobig", spoken)
+        self.assertNotIn("bigworld", spoken)
+        self.assertNotIn("sayABC", spoken)
+        self.assertNotIn("ABCnow", spoken)
+        self.assertEqual(spoken.split(), _spoken_text(document).split())
+
+if __name__ == "__main__":
+    unittest.main()
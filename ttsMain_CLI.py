@@ -1,24 +1,603 @@
-from tts_app.logic.tts_core import *
+from concurrent.futures.process import BrokenProcessPool
+import argparse
+import csv
+import json
+import os
+import sys
+import time
 
 # This is the CLI version of the project
-def main():
+def interactive():
+    from tts_app.logic import tts_core
+
     print("Google Cloud Text-to-Speech API Test")
     print(("-" * 60) + "\n")
-    
+
     print("Listing languages:")
-    list_languages()
-    
+    tts_core.list_languages()
+
     language = input("\nSelect the language you want to use the voice for: ")
 
     print(f"\nListing voices for {language}:")
-    list_voices(language_code=language)
-    
+    tts_core.list_voices(language_code=language)
+
     voice_name = input("\nSelect the voice you want to use: ")
     text = input("Enter the text you want to convert to speech: ");
 
     print(f"\nGenerating speech for voice '{voice_name}' with text: {text}...")
-    text_to_wav(voice_name, text)
-    
+    tts_core.text_to_wav(voice_name, text)
+
+def emit(rows, columns, output_format):
+    """Write rows of dictionaries to stdout as an aligned table, JSON or CSV"""
+    try:
+        write_rows(rows, columns, output_format)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # The reader, e.g. head, stopped early; don't fail on the final flush either
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+
+def write_rows(rows, columns, output_format):
+    """Format rows for emit"""
+    if output_format == "json":
+        json.dump(rows, sys.stdout, indent=2, ensure_ascii=False)
+        sys.stdout.write("\n")
+    elif output_format == "csv":
+        writer = csv.DictWriter(sys.stdout, fieldnames=columns, extrasaction="ignore", lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(rows)
+    else:
+        widths = {column: max([len(column)] + [len(str(row.get(column, ""))) for row in rows])
+                  for column in columns}
+        print("  ".join(column.ljust(widths[column]) for column in columns).rstrip())
+        for row in rows:
+            print("  ".join(str(row.get(column, "")).ljust(widths[column]) for column in columns).rstrip())
+
+def catalog_engine(args):
+    """Engine whose voice data comes from the local catalog, fetched only when missing or on --refresh"""
+    from tts_app.logic.tts_engine import TTSEngine
+
+    engine = TTSEngine(catalog_path=args.catalog)
+    if args.refresh or not engine.voices.has_complete_catalog:
+        success, message = engine.initialize(
+            [args.credentials] if args.credentials else None,
+            fake_latency=0.0 if args.fake else None
+        )
+        if not success:
+            print(f"Failed to initialize TTS service: {message}", file=sys.stderr)
+            return None
+        try:
+            engine.voices.fetch_catalog()
+        except Exception as e:
+            print(f"Failed to fetch the voice catalog: {e}", file=sys.stderr)
+            return None
+    return engine
+
+def languages(args):
+    """List the languages in the voice catalog"""
+    engine = catalog_engine(args)
+    if engine is None:
+        return 1
+    rows = [{'code': code, 'name': name} for code, name in engine.languages()]
+    emit(rows, ['code', 'name'], args.format)
+    return 0
+
+def voices(args):
+    """List the voices in the voice catalog, optionally of one language"""
+    engine = catalog_engine(args)
+    if engine is None:
+        return 1
+
+    language_codes = [args.language] if args.language else [code for code, _ in engine.languages()]
+    seen = set()
+    rows = []
+    for language_code in language_codes:
+        for voice in engine.voices_for(language_code):
+            if voice.name in seen:
+                continue
+            if args.gender and voice.gender.upper() != args.gender.upper():
+                continue
+            if args.type and voice.voice_type.lower() != args.type.lower():
+                continue
+            seen.add(voice.name)
+            rows.append(voice.to_dict())
+    rows.sort(key=lambda row: row['name'])
+    emit(rows, ['name', 'language_code', 'gender', 'voice_type', 'display_name'], args.format)
+    return 0
+
+def synth(args):
+    """Synthesize one text or SSML document to a file and describe the result"""
+    from tts_app.models.tts_config import TTSRequest, VoiceConfig, AudioConfig, SSMLConfig
+    from tts_app.logic.tts_engine import TTSEngine
+    from tts_app.logic.audio_cache import AudioCache
+    from tts_app.logic.audio_writer import StreamingAudioWriter
+
+    if args.text is not None:
+        content = args.text
+    elif args.input and args.input != "-":
+        with open(args.input, "r", encoding="utf-8") as source:
+            content = source.read()
+    else:
+        content = sys.stdin.read()
+    is_ssml = args.ssml or content.lstrip().startswith("<speak")
+
+    # The language is the voice name's prefix, e.g. en-US for en-US-Standard-C
+    language_code = args.language or "-".join(args.voice.split("-")[:2])
+    request = TTSRequest(
+        text="" if is_ssml else content,
+        voice_config=VoiceConfig(language_code=language_code, voice_name=args.voice),
+        audio_config=AudioConfig(
+            format=StreamingAudioWriter.format_for_path(args.output),
+            speaking_rate=args.rate,
+            pitch=args.pitch
+        ),
+        output_path=os.path.abspath(args.output),
+        ssml_config=SSMLConfig(enabled=True, ssml_text=content) if is_ssml else None
+    )
+
+    engine = TTSEngine(audio_cache=AudioCache(args.cache) if args.cache else None)
+    success, message = engine.initialize(
+        [args.credentials] if args.credentials else None,
+        fake_latency=args.fake_latency if args.fake else None
+    )
+    if not success:
+        print(f"Failed to initialize TTS service: {message}", file=sys.stderr)
+        return 1
+
+    started = time.monotonic()
+    row = {
+        'output_path': request.output_path,
+        'voice': args.voice,
+        'format': request.audio_config.format,
+        'characters': len(content),
+        'ssml': is_ssml
+    }
+    try:
+        engine.synthesize(request)
+        row.update(status="completed", bytes=os.path.getsize(request.output_path), error="")
+    except Exception as e:
+        row.update(status="failed", bytes=0, error=str(e))
+    row['seconds'] = round(time.monotonic() - started, 3)
+    if args.metrics:
+        engine.metrics.write(args.metrics)
+
+    columns = ['status', 'output_path', 'voice', 'format', 'characters', 'bytes', 'seconds', 'error']
+    emit(row if args.format == "json" else [row], columns, args.format)
+    return 0 if row['status'] == "completed" else 1
+
+def plan(args):
+    """Estimate what a batch manifest or a project build would cost, without calling the API"""
+    from tts_app.logic.job_journal import JobJournal
+    from tts_app.logic.audio_cache import AudioCache
+    from tts_app.logic.batch_planner import BatchPlanner
+
+    journal = None
+    if os.path.isdir(args.source):
+        from tts_app.logic.tts_engine import TTSEngine
+        from tts_app.logic.project_builder import ProjectBuilder
+
+        try:
+            builder = ProjectBuilder(TTSEngine(), args.source)
+        except ValueError as e:
+            print(e, file=sys.stderr)
+            return 1
+        targets = builder.targets()
+        for target in targets:
+            if target.error is not None:
+                print(f"{target.source_path}: {target.error}", file=sys.stderr)
+        requests = [target.request for target in targets
+                    if target.error is None and (args.force or target.is_stale)]
+        if args.journal:
+            journal = JobJournal(args.journal)
+    else:
+        from tts_app.logic.batch_runner import load_manifest
+
+        requests = load_manifest(args.source)
+        journal_path = args.journal or f"{os.path.splitext(args.source)[0]}.journal.jsonl"
+        if os.path.exists(journal_path):
+            journal = JobJournal(journal_path)
+
+    planner = BatchPlanner(journal, AudioCache(args.cache) if args.cache else None)
+    result = planner.plan(
+        requests, workers=args.workers * max(1, args.processes),
+        max_concurrent_rpcs=args.concurrency, requests_per_minute=args.rpm,
+        processes=max(1, args.processes)
+    )
+
+    if args.format == "json":
+        json.dump(result.to_dict(), sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        return 0
+
+    columns = ['voice_type', 'requests', 'chunks', 'rpcs', 'billable_characters', 'cache_hits', 'cost_usd']
+    rows = [dict(vars(tier), cost_usd=round(tier.cost_usd, 4)) for tier in result.tiers.values()]
+    if args.format == "csv":
+        emit(rows, columns, "csv")
+        return 0
+
+    rows.append({
+        'voice_type': "total", 'requests': sum(row['requests'] for row in rows),
+        'chunks': sum(row['chunks'] for row in rows), 'rpcs': result.rpcs,
+        'billable_characters': result.billable_characters, 'cache_hits': result.cache_hits,
+        'cost_usd': round(result.cost_usd, 4)
+    })
+    emit(rows, columns, "table")
+    model = result.latency_model
+    source = f"fitted to {model.samples} journaled chunks" if model.samples else "default, nothing journaled yet"
+    print(f"\n{result.requests} request(s): {result.already_completed} already done, {len(result.invalid)} invalid")
+    for output_path, error_message in result.invalid.items():
+        print(f"  {output_path}: {error_message}")
+    print(f"Latency model: {model.overhead_seconds:.3f}s + {model.seconds_per_character * 1000:.3f}ms/character ({source})")
+    print(f"Projected wall clock: {format_duration(result.wall_clock_seconds)} "
+          f"at {result.concurrency} RPCs in flight ({format_duration(result.rpc_seconds)} of RPC time)")
+    print(f"Projected cost: ${result.cost_usd:.2f} at list prices, before the free tier")
+    return 0
+
+def format_duration(seconds):
+    """Seconds as e.g. 1h 02m 03s"""
+    seconds = int(round(seconds))
+    hours, seconds = divmod(seconds, 3600)
+    minutes, seconds = divmod(seconds, 60)
+    if hours:
+        return f"{hours}h {minutes:02d}m {seconds:02d}s"
+    if minutes:
+        return f"{minutes}m {seconds:02d}s"
+    return f"{seconds}s"
+
+def batch(args):
+    """Synthesize every request in a JSON Lines manifest, resuming an interrupted run"""
+    from tts_app.logic.tts_engine import TTSEngine
+    from tts_app.logic.job_journal import JobJournal
+    from tts_app.logic.audio_cache import AudioCache
+    from tts_app.logic.batch_runner import BatchRunner, ProcessBatchRunner, load_manifest
+
+    requests = load_manifest(args.manifest)
+    credentials_paths = [args.credentials] if args.credentials else None
+    fake_latency = args.fake_latency if args.fake else None
+
+    journal = JobJournal(args.journal or f"{os.path.splitext(args.manifest)[0]}.journal.jsonl")
+    journal.compact()
+
+    tts_service = None
+    if args.processes > 1:
+        # Every worker process connects on its own; check once here that they can
+        runner = ProcessBatchRunner(
+            journal, processes=args.processes, threads_per_process=args.workers,
+            credentials_paths=credentials_paths, cache_dir=args.cache, fake_latency=fake_latency
+        )
+        success, message = runner.check_setup()
+        if not success:
+            print(f"Failed to initialize TTS service: {message}")
+            return 1
+    else:
+        engine = TTSEngine(journal=journal, audio_cache=AudioCache(args.cache) if args.cache else None)
+        tts_service = engine.service
+        success, message = engine.initialize(credentials_paths, fake_latency=fake_latency)
+        if not success:
+            print(f"Failed to initialize TTS service: {message}")
+            return 1
+        runner = BatchRunner(engine, max_workers=args.workers)
+
+    def report(request, status, error_message):
+        line = f"[{status.value}] {request.output_path}"
+        print(f"{line}: {error_message}" if error_message else line)
+
+    try:
+        result = runner.run(requests, on_result=report)
+    except KeyboardInterrupt:
+        runner.cancel()
+        print("Interrupted; rerun the same command to resume.")
+        return 130
+    except BrokenProcessPool as e:
+        print(f"Batch failed: a worker process stopped unexpectedly ({e}). "
+              f"Rerun the same command to resume.", file=sys.stderr)
+        return 1
+    finally:
+        if args.metrics:
+            runner.metrics.write(args.metrics)
+
+    print(f"\n{result.completed} completed, {result.skipped} already done, "
+          f"{result.failed} failed, {result.cancelled} cancelled")
+    if result.elapsed_seconds:
+        print(f"{result.elapsed_seconds:.1f}s: {result.requests_per_second:.2f} requests/s, "
+              f"{result.characters_per_second:.0f} characters/s, "
+              f"{result.audio_megabytes_per_second:.2f} MB/s of audio")
+    if len(result.requests_per_process) > 1:
+        for pid, count in sorted(result.requests_per_process.items()):
+            print(f"  process {pid}: {count} request(s)")
+    if tts_service is not None:
+        if tts_service.concurrency_limiter is not None:
+            print(f"Concurrency limit converged to {tts_service.concurrency_limiter.limit}")
+        if tts_service.coalescer.total_saved:
+            print(f"{tts_service.coalescer.total_saved} duplicate synthesis call(s) shared an identical request")
+    return 1 if result.failed else 0
+
+def build(args):
+    """Build a project directory of SSML and text sources into audio, rebuilding only what changed"""
+    from tts_app.logic.tts_engine import TTSEngine
+    from tts_app.logic.audio_cache import AudioCache
+    from tts_app.logic.project_builder import ProjectBuilder
+
+    engine = TTSEngine(audio_cache=AudioCache(args.cache) if args.cache else None)
+    success, message = engine.initialize(
+        [args.credentials] if args.credentials else None,
+        fake_latency=args.fake_latency if args.fake else None
+    )
+    if not success:
+        print(f"Failed to initialize TTS service: {message}")
+        return 1
+
+    try:
+        builder = ProjectBuilder(engine, args.project, max_workers=args.workers)
+    except ValueError as e:
+        print(e)
+        return 1
+
+    def report(target, error_message):
+        line = f"[{'failed' if error_message else 'built'}] {target.source_path} -> {target.output_path}"
+        print(f"{line}: {error_message}" if error_message else line)
+
+    def summarize(result):
+        print(f"{result.built} built, {result.up_to_date} up to date, "
+              f"{result.failed} failed, {result.cancelled} cancelled")
+        if args.metrics:
+            engine.metrics.write(args.metrics)
+
+    if args.watch:
+        print(f"Watching {builder.project_dir} (Ctrl+C to stop)")
+        try:
+            builder.watch(interval=args.interval, force=args.force, on_result=report, on_build=summarize)
+        except KeyboardInterrupt:
+            builder.cancel()
+        return 0
+
+    try:
+        result = builder.build(force=args.force, on_result=report)
+    except KeyboardInterrupt:
+        builder.cancel()
+        print("Interrupted; outputs already built are kept.")
+        return 130
+    summarize(result)
+    return 1 if result.failed else 0
+
+def stream(args):
+    """Synthesize text piped to stdin as it arrives, to stdout or the speakers"""
+    from tts_app.models.tts_config import VoiceConfig, AudioConfig
+    from tts_app.logic.tts_engine import TTSEngine
+    from tts_app.logic.audio_cache import AudioCache
+    from tts_app.logic.stream_synthesizer import (
+        SentenceSegmenter, StreamSynthesizer, StreamOutputSink, PlaybackSink
+    )
+
+    engine = TTSEngine(audio_cache=AudioCache(args.cache) if args.cache else None)
+    success, message = engine.initialize(
+        [args.credentials] if args.credentials else None,
+        fake_latency=args.fake_latency if args.fake else None
+    )
+    if not success:
+        print(f"Failed to initialize TTS service: {message}", file=sys.stderr)
+        return 1
+
+    voice_config = VoiceConfig(language_code=args.language, voice_name=args.voice)
+    audio_config = AudioConfig(format=args.audio_format, speaking_rate=args.rate)
+
+    if args.play:
+        from tts_app.logic.audio_player_manager import AudioPlayerManager
+        try:
+            sink = PlaybackSink(AudioPlayerManager(), args.audio_format)
+        except RuntimeError as e:
+            print(e, file=sys.stderr)
+            return 1
+    else:
+        sink = StreamOutputSink(sys.stdout.buffer, args.audio_format)
+
+    synthesizer = StreamSynthesizer(
+        engine, voice_config, audio_config,
+        segmenter=SentenceSegmenter(max_wait=args.max_wait), max_ahead=args.ahead
+    )
+
+    def report_error(index, segment, error):
+        print(f"Failed to synthesize \"{segment[:40]}\": {error}", file=sys.stderr)
+
+    try:
+        result = synthesizer.run(sys.stdin, sink, on_error=report_error)
+        sink.close()
+    except KeyboardInterrupt:
+        return 130
+    except BrokenPipeError:
+        # The reader went away; nothing left to do
+        return 0
+
+    print(f"{result.segments} segment(s), {result.characters} characters, {result.failed} failed",
+          file=sys.stderr)
+    return 1 if result.failed else 0
+
+def serve(args):
+    """Serve synthesis, the voice catalog and health over HTTP without the GUI"""
+    from tts_app.logic.tts_engine import TTSEngine
+    from tts_app.logic.audio_cache import AudioCache
+    from tts_app.logic.synthesis_server import SynthesisServer
+
+    engine = TTSEngine(audio_cache=AudioCache(args.cache) if args.cache else None)
+    success, message = engine.initialize(
+        [args.credentials] if args.credentials else None,
+        fake_latency=args.fake_latency if args.fake else None
+    )
+    if not success:
+        print(f"Failed to initialize TTS service: {message}")
+        return 1
+    if not args.fake:
+        engine.start()
+
+    server = SynthesisServer(
+        engine, host=args.host, port=args.port,
+        max_workers=args.workers, max_queue=args.queue
+    )
+    host, port = server.address
+    print(f"{message}\nServing on http://{host}:{port} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        engine.close()
+    return 0
+
+def main():
+    parser = argparse.ArgumentParser(description="Google Cloud Text-to-Speech command line")
+    parser.add_argument("--profile", action="store_true",
+                        help="Profile the run with cProfile and tracemalloc; a report is written on exit "
+                             "and on SIGUSR1 (also enabled by SPEECHGEN_PROFILE=<dir>)")
+    parser.add_argument("--profile-dir", help="Directory for profile reports (default: profiles)")
+    parser.add_argument("--log-level", default=os.environ.get("SPEECHGEN_LOG_LEVEL", "WARNING"),
+                        choices=["DEBUG", "INFO", "WARNING", "ERROR"], type=str.upper,
+                        help="Least severe log messages shown on stderr (default: WARNING)")
+    parser.add_argument("--log-file", help="Also write INFO and above to this file as JSON lines")
+    parser.add_argument("--log-json", action="store_true", help="Log to stderr as JSON lines")
+    subparsers = parser.add_subparsers(dest="command")
+
+    output_formats = ["table", "json", "csv"]
+    catalog_options = argparse.ArgumentParser(add_help=False)
+    catalog_options.add_argument("--format", default="table", choices=output_formats, help="Output format")
+    catalog_options.add_argument("--catalog", default="voice_catalog.json",
+                                 help="Local voice catalog, shared with the app (default: voice_catalog.json)")
+    catalog_options.add_argument("--refresh", action="store_true", help="Fetch the catalog from Google again")
+    catalog_options.add_argument("--credentials", help="Service account JSON file (defaults to the environment)")
+    catalog_options.add_argument("--fake", action="store_true", help="Use the offline fake backend instead of Google")
+
+    subparsers.add_parser(
+        "languages", parents=[catalog_options], help="List available languages from the local voice catalog"
+    )
+
+    voices_parser = subparsers.add_parser(
+        "voices", parents=[catalog_options], help="List available voices from the local voice catalog"
+    )
+    voices_parser.add_argument("language", nargs="?", help="Language code, e.g. en-US (default: all languages)")
+    voices_parser.add_argument("--gender", help="Only voices of this gender, e.g. FEMALE")
+    voices_parser.add_argument("--type", help="Only voices of this type, e.g. WaveNet")
+
+    synth_parser = subparsers.add_parser("synth", help="Synthesize one text or SSML document to an audio file")
+    synth_parser.add_argument("output", help="Audio file to write; the extension picks MP3, WAV or OGG")
+    synth_parser.add_argument("--text", help="Text or SSML to speak (default: read --input)")
+    synth_parser.add_argument("--input", help="File to read the text or SSML from (default: stdin)")
+    synth_parser.add_argument("--ssml", action="store_true", help="Treat the input as SSML even without <speak>")
+    synth_parser.add_argument("--voice", default="en-US-Standard-C", help="Voice name (default: en-US-Standard-C)")
+    synth_parser.add_argument("--language", help="Language code (default: from the voice name)")
+    synth_parser.add_argument("--rate", type=float, default=1.0, help="Speaking rate (default: 1.0)")
+    synth_parser.add_argument("--pitch", type=float, default=0.0, help="Pitch in semitones (default: 0)")
+    synth_parser.add_argument("--format", default="table", choices=output_formats, help="Output format of the summary")
+    synth_parser.add_argument("--credentials", help="Service account JSON file (defaults to the environment)")
+    synth_parser.add_argument("--cache", help="Directory for the rendered audio cache (default: no cache)")
+    synth_parser.add_argument("--fake", action="store_true", help="Use the offline fake backend instead of Google")
+    synth_parser.add_argument("--fake-latency", type=float, default=0.2, help="Seconds per fake synthesis call")
+    synth_parser.add_argument("--metrics", help="Write stage timings and counters here when done "
+                              "(JSON for .json, Prometheus text otherwise)")
+
+    plan_parser = subparsers.add_parser(
+        "plan", help="Estimate RPCs, characters, cache hits, time and cost of a manifest or project, offline"
+    )
+    plan_parser.add_argument("source", help="JSON Lines manifest (as for batch) or project directory (as for build)")
+    plan_parser.add_argument("--journal", help="Journal with completed jobs and chunk timings "
+                                               "(default for manifests: <manifest>.journal.jsonl)")
+    plan_parser.add_argument("--cache", help="Audio cache directory the run would use (default: no cache)")
+    plan_parser.add_argument("--workers", type=int, default=4, help="Requests synthesized in parallel")
+    plan_parser.add_argument("--processes", type=int, default=1, help="Worker processes the batch would use")
+    plan_parser.add_argument("--concurrency", type=int,
+                             help="Most RPCs in flight at once (default: the adaptive limiter's starting limit per process)")
+    plan_parser.add_argument("--rpm", type=float, help="Total requests per minute the credentials allow")
+    plan_parser.add_argument("--force", action="store_true", help="Plan every project output, not only stale ones")
+    plan_parser.add_argument("--format", default="table", choices=output_formats, help="Output format")
+
+    batch_parser = subparsers.add_parser(
+        "batch", help="Synthesize a JSON Lines manifest of TTS requests, resuming from its journal"
+    )
+    batch_parser.add_argument("manifest", help="File with one TTS request (as saved by the app) per line")
+    batch_parser.add_argument("--credentials", help="Service account JSON file (defaults to the environment)")
+    batch_parser.add_argument("--journal", help="Journal file (default: <manifest>.journal.jsonl)")
+    batch_parser.add_argument("--workers", type=int, default=4,
+                              help="Requests synthesized in parallel (per process with --processes)")
+    batch_parser.add_argument("--processes", type=int, default=1,
+                              help="Worker processes, each with its own client (default: 1, no pool)")
+    batch_parser.add_argument("--cache", help="Directory for the rendered audio cache (default: no cache)")
+    batch_parser.add_argument("--fake", action="store_true", help="Use the offline fake backend instead of Google")
+    batch_parser.add_argument("--fake-latency", type=float, default=0.2, help="Seconds per fake synthesis call")
+    batch_parser.add_argument("--metrics", help="Write stage timings and counters here when done "
+                              "(JSON for .json, Prometheus text otherwise)")
+
+    build_parser = subparsers.add_parser(
+        "build", help="Build a directory of .ssml/.txt sources into audio, rebuilding only stale outputs"
+    )
+    build_parser.add_argument("project", help="Project directory, optionally with a speechgen.json configuration")
+    build_parser.add_argument("--credentials", help="Service account JSON file (defaults to the environment)")
+    build_parser.add_argument("--workers", type=int, default=4, help="Outputs synthesized in parallel")
+    build_parser.add_argument("--force", action="store_true", help="Rebuild every output")
+    build_parser.add_argument("--watch", action="store_true", help="Keep running and rebuild on file changes")
+    build_parser.add_argument("--interval", type=float, default=1.0, help="Seconds between checks in --watch mode")
+    build_parser.add_argument("--cache", help="Directory for the rendered audio cache (default: no cache)")
+    build_parser.add_argument("--fake", action="store_true", help="Use the offline fake backend instead of Google")
+    build_parser.add_argument("--fake-latency", type=float, default=0.2, help="Seconds per fake synthesis call")
+    build_parser.add_argument("--metrics", help="Write stage timings and counters here when done "
+                              "(JSON for .json, Prometheus text otherwise)")
+
+    stream_parser = subparsers.add_parser(
+        "stream", help="Synthesize text piped to stdin sentence by sentence, to stdout or the speakers"
+    )
+    stream_parser.add_argument("--voice", default="en-US-Standard-C", help="Voice name (default: en-US-Standard-C)")
+    stream_parser.add_argument("--language", default="en-US", help="Language code (default: en-US)")
+    stream_parser.add_argument("--audio-format", default="MP3", choices=["MP3", "WAV", "OGG"],
+                               help="Audio encoding (default: MP3)")
+    stream_parser.add_argument("--rate", type=float, default=1.0, help="Speaking rate (default: 1.0)")
+    stream_parser.add_argument("--play", action="store_true", help="Play the audio instead of writing it to stdout")
+    stream_parser.add_argument("--max-wait", type=float, default=1.0,
+                               help="Seconds to wait for the end of a sentence before speaking what arrived")
+    stream_parser.add_argument("--ahead", type=int, default=2, help="Segments synthesized ahead of the output")
+    stream_parser.add_argument("--credentials", help="Service account JSON file (defaults to the environment)")
+    stream_parser.add_argument("--cache", help="Directory for the rendered audio cache (default: no cache)")
+    stream_parser.add_argument("--fake", action="store_true", help="Use the offline fake backend instead of Google")
+    stream_parser.add_argument("--fake-latency", type=float, default=0.2, help="Seconds per fake synthesis call")
+
+    serve_parser = subparsers.add_parser(
+        "serve", help="Serve synthesis, voices and health over HTTP without the GUI"
+    )
+    serve_parser.add_argument("--host", default="127.0.0.1", help="Address to bind (default: 127.0.0.1)")
+    serve_parser.add_argument("--port", type=int, default=8080, help="Port to bind (default: 8080)")
+    serve_parser.add_argument("--credentials", help="Service account JSON file (defaults to the environment)")
+    serve_parser.add_argument("--fake", action="store_true", help="Use the offline fake backend instead of Google")
+    serve_parser.add_argument("--fake-latency", type=float, default=0.2, help="Seconds per fake synthesis call")
+    serve_parser.add_argument("--workers", type=int, default=4, help="Requests synthesized at once")
+    serve_parser.add_argument("--queue", type=int, default=16, help="Requests waiting before 429 is returned")
+    serve_parser.add_argument("--cache", help="Directory for the rendered audio cache (default: no cache)")
+
+    args = parser.parse_args()
+    from tts_app.logic.run_profiler import profiler_from_environment
+    from tts_app.logic.structured_logging import configure_logging, LOG_LEVEL_ENV_VAR
+    profiler_from_environment(args.profile, args.profile_dir)
+    # Worker processes log at the same level
+    os.environ[LOG_LEVEL_ENV_VAR] = args.log_level
+    # The log file records INFO and above even when stderr shows less
+    file_level = "INFO" if args.log_file and args.log_level != "DEBUG" else args.log_level
+    configure_logging(file_level, log_file=args.log_file, console_level=args.log_level,
+                      console_json=args.log_json)
+
+    if args.command == "languages":
+        return languages(args)
+    if args.command == "voices":
+        return voices(args)
+    if args.command == "synth":
+        return synth(args)
+    if args.command == "plan":
+        return plan(args)
+    if args.command == "batch":
+        return batch(args)
+    if args.command == "build":
+        return build(args)
+    if args.command == "stream":
+        return stream(args)
+    if args.command == "serve":
+        return serve(args)
+
+    interactive()
+    return 0
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,13 @@
+"""SpeechGen text-to-speech application
+
+The headless engine is importable without PyQt5:
+
+    from tts_app import TTSEngine
+"""
+
+def __getattr__(name):
+    # Imported on first use so importing the package stays cheap
+    if name == "TTSEngine":
+        from tts_app.logic.tts_engine import TTSEngine
+        return TTSEngine
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,145 @@
+from typing import List, Optional
+import os
+import threading
+
+from tts_app.models.tts_config import TTSRequest
+from tts_app.logic.job_journal import fingerprint_chunk
+from tts_app.logic.file_lock import FileLock
+
+def request_fingerprints(request: TTSRequest) -> List[str]:
+    """Fingerprints of the chunks a request is synthesized in"""
+    return [fingerprint_chunk(chunk, request.is_ssml, request.voice_config, request.audio_config)
+            for chunk in request.get_chunks()]
+
+class AudioCache:
+    """Content-addressed store of synthesized chunk audio on local disk
+
+    Chunks are keyed by the fingerprint of their text, voice and audio
+    settings, so text that was rendered before can be served again without
+    the network. Once the cache grows beyond max_bytes, the least recently
+    used chunks are evicted until it is back under the low-water mark.
+    Writes are atomic renames and eviction takes a lock file, so several
+    processes can share one cache directory.
+    """
+
+    # Eviction frees space down to this share of max_bytes, so a full cache is not rescanned on every put
+    LOW_WATER_MARK = 0.9
+
+    def __init__(self, cache_dir: str, max_bytes: int = 512 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._file_lock = FileLock(os.path.join(cache_dir, ".lock"))
+        self._size: Optional[int] = None
+
+    def get(self, fingerprint: str) -> Optional[bytes]:
+        """Get cached audio for a chunk fingerprint"""
+        path = self._path(fingerprint)
+        try:
+            with open(path, "rb") as cached:
+                audio_content = cached.read()
+            os.utime(path)  # mark as recently used
+            return audio_content
+        except OSError:
+            return None
+
+    def contains(self, fingerprint: str) -> bool:
+        """Check if a chunk is cached"""
+        return os.path.exists(self._path(fingerprint))
+
+    def covers(self, request: TTSRequest) -> bool:
+        """Check if every chunk of a request can be served from the cache"""
+        return all(self.contains(fingerprint) for fingerprint in request_fingerprints(request))
+
+    def put(self, fingerprint: str, audio_content: bytes) -> None:
+        """Store a chunk's audio"""
+        if self.max_bytes <= 0:
+            return
+
+        path = self._path(fingerprint)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, "wb") as out:
+                out.write(audio_content)
+        except OSError:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+        try:
+            replaced_size = os.path.getsize(path)
+        except OSError:
+            replaced_size = 0
+        os.replace(temp_path, path)
+
+        with self._lock:
+            if self._size is not None:
+                self._size += len(audio_content) - replaced_size
+        self._evict_if_needed()
+
+    def size_bytes(self) -> int:
+        """Bytes of audio cached, scanning the directory only the first time"""
+        with self._lock:
+            if self._size is None:
+                self._size = sum(entry[1] for entry in self._entries())
+            return self._size
+
+    def clear(self) -> None:
+        """Delete every cached chunk"""
+        with self._lock:
+            for path, _, _ in self._entries():
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self._size = 0
+
+    def _path(self, fingerprint: str) -> str:
+        """File holding a chunk, sharded by fingerprint prefix"""
+        return os.path.join(self.cache_dir, fingerprint[:2], f"{fingerprint}.audio")
+
+    def _entries(self) -> List[tuple]:
+        """(path, size, last used) of every cached chunk"""
+        entries = []
+        if not os.path.isdir(self.cache_dir):
+            return entries
+        for shard in os.listdir(self.cache_dir):
+            shard_dir = os.path.join(self.cache_dir, shard)
+            if not os.path.isdir(shard_dir):
+                continue
+            for name in os.listdir(shard_dir):
+                if not name.endswith(".audio"):
+                    continue
+                path = os.path.join(shard_dir, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _evict_if_needed(self) -> None:
+        """Delete least recently used chunks once the cache is over budget, down to the low-water mark"""
+        with self._lock:
+            if self._size is not None and self._size <= self.max_bytes:
+                return
+
+        with self._lock, self._file_lock:
+            entries = self._entries()
+            size = sum(entry[1] for entry in entries)
+            if size <= self.max_bytes:
+                # Another process already evicted
+                self._size = size
+                return
+            target = int(self.max_bytes * self.LOW_WATER_MARK)
+            for path, entry_size, _ in sorted(entries, key=lambda entry: entry[2]):
+                if size <= target:
+                    break
+                try:
+                    os.remove(path)
+                    size -= entry_size
+                except OSError:
+                    pass
+            self._size = size
@@ -1,61 +1,321 @@
 import pygame
+import io
+import logging
 import os
-from typing import Optional
+import wave
+from enum import Enum
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+class PlaybackQueueState(Enum):
+    """State of the progressive playback queue"""
+    IDLE = "idle"
+    PLAYING = "playing"
+    BUFFERING = "buffering"  # Waiting for the next chunk to be synthesized
+    FINISHED = "finished"
 
 class AudioPlayerManager:
     """Logic manager for audio playback operations"""
-    
+
+    # pygame needs a hint to pick a decoder for file-like sources
+    FORMAT_HINTS = {
+        'MP3': 'mp3',
+        'WAV': 'wav',
+        'LINEAR16': 'wav',
+        'OGG': 'ogg',
+        'OGG_OPUS': 'ogg'
+    }
+
     def __init__(self):
         self._initialized = False
         self._current_file: Optional[str] = None
+        self._buffer: Optional[io.BytesIO] = None
+        self._pcm: Optional[bytes] = None
+        self._pcm_params: Optional[tuple] = None  # (sample_rate, channels, sample_width)
+        self._has_source = False
+        self._start_offset = 0.0
+        self._paused = False
+        self._paused_position = 0.0
+        self._queue_channel = None
+        self._queue_total: Optional[int] = 0  # None while an open-ended queue is still fed
+        self._queue_next = 0
+        self._queue_received = 0
+        self._queue_pending: Dict[int, tuple] = {}  # index -> (audio_content, audio_format)
         self._initialize_pygame()
-    
+
     def _initialize_pygame(self) -> None:
         """Initialize pygame mixer"""
         try:
             pygame.mixer.init()
             self._initialized = True
         except Exception as e:
-            print(f"Failed to initialize audio player: {e}")
+            logger.warning("Failed to initialize audio player: %s", e)
             self._initialized = False
-    
+
     @property
     def is_available(self) -> bool:
         """Check if audio player is available"""
         return self._initialized
-    
+
     def load_file(self, file_path: str) -> bool:
         """Load an audio file"""
         if not self.is_available or not os.path.exists(file_path):
             return False
-        
+
         try:
             pygame.mixer.music.load(file_path)
+            self._reset_source()
             self._current_file = file_path
+            self._has_source = True
             return True
         except Exception as e:
-            print(f"Failed to load audio file: {e}")
+            logger.warning("Failed to load audio file: %s", e)
             return False
-    
+
+    def load_bytes(self, audio_content: bytes, audio_format: str = "MP3") -> bool:
+        """Load encoded audio (MP3, WAV or OGG) directly from memory"""
+        if not self.is_available or not audio_content:
+            return False
+
+        namehint = self.FORMAT_HINTS.get(audio_format.upper(), "")
+
+        # LINEAR16 keeps the raw PCM around so seeking works for every decoder
+        if namehint == "wav":
+            try:
+                with wave.open(io.BytesIO(audio_content), "rb") as wav:
+                    params = (wav.getframerate(), wav.getnchannels(), wav.getsampwidth())
+                    pcm = wav.readframes(wav.getnframes())
+                return self.load_pcm(pcm, *params)
+            except (wave.Error, EOFError):
+                pass
+
+        try:
+            buffer = io.BytesIO(audio_content)
+            pygame.mixer.music.load(buffer, namehint)
+            self._reset_source()
+            # pygame reads lazily from the buffer, so keep it alive while loaded
+            self._buffer = buffer
+            self._has_source = True
+            return True
+        except Exception as e:
+            logger.warning("Failed to load audio buffer: %s", e)
+            return False
+
+    def load_pcm(self, pcm: bytes, sample_rate: int = 24000, channels: int = 1,
+                 sample_width: int = 2) -> bool:
+        """Load raw LINEAR16 PCM samples from memory"""
+        if not self.is_available or not pcm:
+            return False
+
+        try:
+            self._load_pcm_from(pcm, (sample_rate, channels, sample_width), 0.0)
+            self._pcm = pcm
+            self._pcm_params = (sample_rate, channels, sample_width)
+            return True
+        except Exception as e:
+            logger.warning("Failed to load PCM buffer: %s", e)
+            return False
+
     def play(self) -> bool:
         """Play the loaded audio file"""
-        if not self.is_available or not self._current_file:
+        if not self.is_available or not self._has_source:
             return False
-        
+
         try:
+            if self._pcm is not None and self._start_offset:
+                self._load_pcm_from(self._pcm, self._pcm_params, 0.0)
             pygame.mixer.music.play()
+            self._start_offset = 0.0
+            self._paused = False
             return True
         except Exception as e:
-            print(f"Failed to play audio: {e}")
+            logger.warning("Failed to play audio: %s", e)
             return False
-    
+
+    def pause(self) -> None:
+        """Pause playback, keeping the current position"""
+        if self.is_available and self._queue_channel is not None:
+            self._queue_channel.pause()
+            self._paused = True
+        elif self.is_available and self.is_playing():
+            self._paused_position = self.get_position()
+            pygame.mixer.music.pause()
+            self._paused = True
+
+    def resume(self) -> None:
+        """Resume paused playback"""
+        if self.is_available and self._paused:
+            if self._queue_channel is not None:
+                self._queue_channel.unpause()
+            else:
+                pygame.mixer.music.unpause()
+            self._paused = False
+
+    @property
+    def is_paused(self) -> bool:
+        """Check if playback is paused"""
+        return self._paused
+
+    def seek(self, position: float) -> bool:
+        """Continue playback from a position in seconds"""
+        if not self.is_available or not self._has_source:
+            return False
+
+        position = max(0.0, position)
+        try:
+            if self._pcm is not None:
+                # Re-slice the PCM buffer instead of relying on decoder seek support
+                self._load_pcm_from(self._pcm, self._pcm_params, position)
+                pygame.mixer.music.play()
+            else:
+                pygame.mixer.music.play(start=position)
+            self._start_offset = position
+            if self._paused:
+                pygame.mixer.music.pause()
+                self._paused_position = position
+            return True
+        except Exception as e:
+            logger.warning("Failed to seek audio: %s", e)
+            return False
+
+    def get_position(self) -> float:
+        """Get the current playback position in seconds"""
+        if not self.is_available or not self._has_source:
+            return 0.0
+        if self._paused:
+            return self._paused_position
+
+        elapsed_ms = pygame.mixer.music.get_pos()
+        if elapsed_ms < 0:
+            return self._start_offset
+        return self._start_offset + elapsed_ms / 1000.0
+
+    def get_duration(self) -> Optional[float]:
+        """Get the duration in seconds when it is known (PCM sources only)"""
+        if self._pcm is None:
+            return None
+        sample_rate, channels, sample_width = self._pcm_params
+        return len(self._pcm) / float(sample_rate * channels * sample_width)
+
     def stop(self) -> None:
         """Stop audio playback"""
         if self.is_available:
             pygame.mixer.music.stop()
-    
+            self._clear_queue()
+            self._paused = False
+
     def is_playing(self) -> bool:
         """Check if audio is currently playing"""
         if not self.is_available:
             return False
+        if self._queue_channel is not None and self._queue_channel.get_busy():
+            return True
         return pygame.mixer.music.get_busy()
+    
+    def start_queue(self, total_chunks: Optional[int] = None) -> bool:
+        """Start a gapless playback queue for a job split into total_chunks chunks
+
+        Without total_chunks the queue takes chunks until close_queue is called,
+        for streams whose length is not known up front.
+        """
+        if not self.is_available or (total_chunks is not None and total_chunks <= 0):
+            return False
+
+        self.stop()
+        # Reserve a channel so other sounds never steal the queue's playback
+        pygame.mixer.set_reserved(1)
+        self._queue_channel = pygame.mixer.Channel(0)
+        self._queue_total = total_chunks
+        self._queue_next = 0
+        self._queue_received = 0
+        self._queue_pending.clear()
+        return True
+
+    def close_queue(self) -> None:
+        """Mark an open-ended queue complete once the chunks received so far have played"""
+        if self._queue_channel is not None and self._queue_total is None:
+            self._queue_total = self._queue_received
+
+    def enqueue_chunk(self, index: int, audio_content: bytes, audio_format: str) -> None:
+        """Hand a synthesized chunk to the queue, in any order"""
+        if self._queue_channel is None or index < self._queue_next:
+            return
+        self._queue_pending[index] = (audio_content, audio_format)
+        self._queue_received = max(self._queue_received, index + 1)
+        self.update_queue()
+
+    def update_queue(self) -> PlaybackQueueState:
+        """Feed held chunks to the mixer in order; call periodically while a queue is active"""
+        channel = self._queue_channel
+        if channel is None:
+            return PlaybackQueueState.IDLE
+
+        try:
+            # Start playback directly, then keep exactly one chunk queued behind it
+            if not channel.get_busy() and self._queue_next in self._queue_pending:
+                channel.play(self._pop_queued_sound())
+            if channel.get_busy() and channel.get_queue() is None and self._queue_next in self._queue_pending:
+                channel.queue(self._pop_queued_sound())
+        except Exception as e:
+            logger.warning("Failed to queue audio chunk: %s", e)
+            self._clear_queue()
+            return PlaybackQueueState.FINISHED
+
+        if channel.get_busy():
+            return PlaybackQueueState.PLAYING
+        if self._queue_total is not None and self._queue_next >= self._queue_total:
+            self._clear_queue()
+            return PlaybackQueueState.FINISHED
+        return PlaybackQueueState.BUFFERING
+
+    @property
+    def queue_progress(self) -> tuple:
+        """Get (chunks handed to the mixer, total chunks) for the active queue"""
+        return self._queue_next, self._queue_total
+
+    def _pop_queued_sound(self) -> 'pygame.mixer.Sound':
+        """Decode the next chunk in order into a mixer sound"""
+        audio_content, _ = self._queue_pending.pop(self._queue_next)
+        self._queue_next += 1
+        return pygame.mixer.Sound(file=io.BytesIO(audio_content))
+
+    def _clear_queue(self) -> None:
+        """Stop and forget the playback queue"""
+        if self._queue_channel is not None:
+            self._queue_channel.stop()
+        self._queue_channel = None
+        self._queue_total = 0
+        self._queue_next = 0
+        self._queue_received = 0
+        self._queue_pending.clear()
+
+    def _reset_source(self) -> None:
+        """Forget the previously loaded source"""
+        self._current_file = None
+        self._buffer = None
+        self._pcm = None
+        self._pcm_params = None
+        self._start_offset = 0.0
+        self._paused = False
+        self._paused_position = 0.0
+
+    def _load_pcm_from(self, pcm: bytes, params: tuple, position: float) -> None:
+        """Wrap PCM from the given position in a WAV container and load it"""
+        sample_rate, channels, sample_width = params
+        frame_size = channels * sample_width
+        offset = min(len(pcm), int(position * sample_rate) * frame_size)
+
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wav:
+            wav.setnchannels(channels)
+            wav.setsampwidth(sample_width)
+            wav.setframerate(sample_rate)
+            wav.writeframes(memoryview(pcm)[offset:])
+        buffer.seek(0)
+
+        pygame.mixer.music.load(buffer, "wav")
+        if self._pcm is not pcm:
+            self._reset_source()
+        self._buffer = buffer
+        self._has_source = True
@@ -0,0 +1,314 @@
+import io
+import os
+import stat
+import struct
+import tempfile
+from enum import Enum
+from typing import Optional
+
+def _read_umask() -> int:
+    """The process umask; reading it means setting it, so this is done once at import"""
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return umask
+
+# Mode open() gives a new file; mkstemp creates 0600 files, which are widened to this before the rename
+NEW_FILE_MODE = 0o666 & ~_read_umask()
+
+class FsyncPolicy(Enum):
+    """When the writer forces written audio to stable storage"""
+    NEVER = "never"              # Leave flushing to the OS
+    ON_CLOSE = "on_close"        # fsync once before the atomic rename
+    EVERY_CHUNK = "every_chunk"  # fsync after every chunk (slowest, safest)
+
+class StreamingAudioWriter:
+    """Incremental audio writer that commits to the output path with an atomic rename
+
+    Chunks are appended to a temporary file in the destination directory, so
+    peak memory is bounded by the size of a single chunk. For WAV output the
+    RIFF header of every synthesized segment is stripped and a single header
+    is patched with the final sizes when the writer is closed.
+    """
+
+    WAV_HEADER_SIZE = 44
+
+    def __init__(self, output_path: str, audio_format: str = "MP3",
+                 fsync_policy: FsyncPolicy = FsyncPolicy.ON_CLOSE,
+                 sample_rate: int = 24000, channels: int = 1, bits_per_sample: int = 16):
+        self.output_path = output_path
+        self.audio_format = audio_format.upper()
+        self.fsync_policy = fsync_policy
+        self._sample_rate = sample_rate
+        self._channels = channels
+        self._bits_per_sample = bits_per_sample
+        self._file = None
+        self._temp_path: Optional[str] = None
+        self._bytes_written = 0
+        self._data_bytes = 0
+        self._header_written = False
+        self._closed = False
+
+    @classmethod
+    def format_for_path(cls, output_path: str) -> str:
+        """Infer the audio format from the output file extension"""
+        extension = os.path.splitext(output_path)[1].lower()
+        return {'.wav': 'WAV', '.ogg': 'OGG'}.get(extension, 'MP3')
+
+    @property
+    def is_wav(self) -> bool:
+        """Check if the writer produces a WAV container"""
+        return self.audio_format in ('WAV', 'LINEAR16')
+
+    @property
+    def bytes_written(self) -> int:
+        """Total bytes written to the temporary file so far"""
+        return self._bytes_written
+
+    @property
+    def temp_path(self) -> Optional[str]:
+        """Path of the temporary file being written"""
+        return self._temp_path
+
+    def open(self) -> 'StreamingAudioWriter':
+        """Create the temporary file next to the output path"""
+        if self._file is not None:
+            return self
+
+        directory = os.path.dirname(self.output_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+
+        fd, self._temp_path = tempfile.mkstemp(
+            prefix=f".{os.path.basename(self.output_path)}.",
+            suffix=".part",
+            dir=directory or None
+        )
+        self._file = os.fdopen(fd, "wb")
+        return self
+
+    def write_chunk(self, chunk: bytes) -> int:
+        """Append a chunk of audio and return the number of bytes written"""
+        if self._closed:
+            raise RuntimeError("Audio writer is already closed")
+        if self._file is None:
+            self.open()
+        if not chunk:
+            return 0
+
+        payload = memoryview(chunk)
+        written = 0
+
+        if self.is_wav:
+            if bytes(payload[:4]) == b"RIFF":
+                payload = self._strip_wav_header(payload)
+            if not self._header_written:
+                written += self._write(self._build_wav_header(0))
+                self._header_written = True
+            self._data_bytes += len(payload)
+
+        written += self._write(payload)
+
+        if self.fsync_policy == FsyncPolicy.EVERY_CHUNK:
+            self._sync()
+
+        return written
+
+    def close(self) -> str:
+        """Finalize the file, patch the WAV header and rename into place"""
+        if self._closed:
+            return self.output_path
+        if self._file is None:
+            self.open()
+
+        try:
+            if self.is_wav:
+                if not self._header_written:
+                    self._write(self._build_wav_header(0))
+                    self._header_written = True
+                self._patch_wav_header()
+
+            if self.fsync_policy != FsyncPolicy.NEVER:
+                self._sync()
+
+            self._apply_output_mode()
+            self._file.close()
+            os.replace(self._temp_path, self.output_path)
+
+            if self.fsync_policy != FsyncPolicy.NEVER:
+                self._sync_directory()
+        except Exception:
+            self.abort()
+            raise
+
+        self._closed = True
+        return self.output_path
+
+    def abort(self) -> None:
+        """Discard everything written so far"""
+        self._closed = True
+        if self._file is not None and not self._file.closed:
+            self._file.close()
+        if self._temp_path and os.path.exists(self._temp_path):
+            os.remove(self._temp_path)
+
+    def __enter__(self) -> 'StreamingAudioWriter':
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _apply_output_mode(self) -> None:
+        """Give the temporary file the mode of the file it replaces, or of a newly created file"""
+        try:
+            mode = stat.S_IMODE(os.stat(self.output_path).st_mode)
+        except OSError:
+            mode = NEW_FILE_MODE
+        if hasattr(os, "fchmod"):
+            os.fchmod(self._file.fileno(), mode)
+        else:
+            os.chmod(self._temp_path, mode)
+
+    def _write(self, data) -> int:
+        """Write raw bytes to the temporary file"""
+        self._file.write(data)
+        self._bytes_written += len(data)
+        return len(data)
+
+    def _sync(self) -> None:
+        """Flush and fsync the temporary file"""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _sync_directory(self) -> None:
+        """fsync the destination directory so the rename itself is durable"""
+        if not hasattr(os, "O_DIRECTORY"):
+            return
+        directory = os.path.dirname(os.path.abspath(self.output_path))
+        fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def _strip_wav_header(self, payload: memoryview) -> memoryview:
+        """Remove the RIFF container from a synthesized segment, keeping its PCM data"""
+        offset = 12
+        while offset + 8 <= len(payload):
+            chunk_id = bytes(payload[offset:offset + 4])
+            chunk_size = struct.unpack("<I", payload[offset + 4:offset + 8])[0]
+            body_start = offset + 8
+
+            if chunk_id == b"fmt " and not self._header_written:
+                channels, sample_rate = struct.unpack("<HI", payload[body_start + 2:body_start + 8])
+                bits_per_sample = struct.unpack("<H", payload[body_start + 14:body_start + 16])[0]
+                self._channels = channels
+                self._sample_rate = sample_rate
+                self._bits_per_sample = bits_per_sample
+            elif chunk_id == b"data":
+                # Streaming responses may leave the size unset, so take the remainder
+                return payload[body_start:]
+
+            offset = body_start + chunk_size + (chunk_size & 1)
+
+        return payload[self.WAV_HEADER_SIZE:]
+
+    def _build_wav_header(self, data_size: int) -> bytes:
+        """Build a canonical 44-byte PCM WAV header"""
+        block_align = self._channels * self._bits_per_sample // 8
+        byte_rate = self._sample_rate * block_align
+        return struct.pack(
+            "<4sI4s4sIHHIIHH4sI",
+            b"RIFF", 36 + data_size, b"WAVE",
+            b"fmt ", 16, 1, self._channels, self._sample_rate,
+            byte_rate, block_align, self._bits_per_sample,
+            b"data", data_size
+        )
+
+    def _patch_wav_header(self) -> None:
+        """Rewrite the WAV header with the final data size"""
+        self._file.flush()
+        self._file.seek(0)
+        self._file.write(self._build_wav_header(self._data_bytes))
+        self._file.seek(0, os.SEEK_END)
+
+class StreamAudioWriter(StreamingAudioWriter):
+    """Audio writer that sends chunks to a binary stream as they arrive, e.g. a network response
+
+    Nothing can be rewritten once it is sent, so a WAV header carries the
+    maximum sizes, as is conventional for streamed WAV.
+    """
+
+    # Data size announced in a streamed WAV header
+    UNKNOWN_DATA_SIZE = 0xFFFFFFFF - 36
+
+    def __init__(self, stream, audio_format: str = "MP3"):
+        super().__init__("", audio_format, FsyncPolicy.NEVER)
+        self._stream = stream
+
+    def open(self) -> 'StreamAudioWriter':
+        """Start writing to the stream"""
+        self._file = self._stream
+        return self
+
+    def close(self) -> str:
+        """Flush the stream; it stays open for its owner"""
+        if self._closed:
+            return self.output_path
+        if self._file is None:
+            self.open()
+        if self.is_wav and not self._header_written:
+            self._write(self._build_wav_header(0))
+            self._header_written = True
+        self._stream.flush()
+        self._closed = True
+        return self.output_path
+
+    def abort(self) -> None:
+        """Stop writing; whatever was sent stays sent"""
+        self._closed = True
+
+    def _build_wav_header(self, data_size: int) -> bytes:
+        """Build a WAV header announcing an unknown length"""
+        return super()._build_wav_header(self.UNKNOWN_DATA_SIZE)
+
+class MemoryAudioWriter(StreamingAudioWriter):
+    """Audio writer that collects a request's audio in memory, e.g. to play it
+
+    WAV output gets a header with the real sizes, like a file would.
+    """
+
+    def __init__(self, audio_format: str = "MP3"):
+        super().__init__("", audio_format, FsyncPolicy.NEVER)
+        self._buffer = io.BytesIO()
+
+    @property
+    def content(self) -> bytes:
+        """Audio written so far"""
+        return self._buffer.getvalue()
+
+    def open(self) -> 'MemoryAudioWriter':
+        """Start writing to memory"""
+        self._file = self._buffer
+        return self
+
+    def close(self) -> str:
+        """Finish the audio, patching the WAV header"""
+        if self._closed:
+            return self.output_path
+        if self._file is None:
+            self.open()
+        if self.is_wav:
+            if not self._header_written:
+                self._write(self._build_wav_header(0))
+                self._header_written = True
+            self._patch_wav_header()
+        self._closed = True
+        return self.output_path
+
+    def abort(self) -> None:
+        """Discard the audio"""
+        self._closed = True
+        self._buffer = io.BytesIO()
@@ -0,0 +1,211 @@
+from dataclasses import dataclass, field, asdict
+from typing import Dict, List, Optional, Tuple
+
+from tts_app.models.tts_config import TTSRequest
+from tts_app.logic.job_journal import JobJournal, fingerprint_chunk, fingerprint_request
+from tts_app.logic.audio_cache import AudioCache
+from tts_app.logic.voice_data_manager import VoiceDataManager
+from tts_app.logic.synthesis_pipeline import SynthesisPipeline
+from tts_app.logic.tts_service_manager import TTSServiceManager
+
+# List price in USD per million characters of each voice type, before the monthly free tier
+# https://cloud.google.com/text-to-speech/pricing
+PRICE_PER_MILLION_CHARACTERS = {
+    'Standard': 4.0,
+    'WaveNet': 4.0,
+    'Neural2': 16.0,
+    'Polyglot': 16.0,
+    'Chirp3-HD': 30.0,
+    'Studio': 160.0
+}
+
+# Latency assumed when the journal has too few chunk records to measure it
+DEFAULT_RPC_OVERHEAD_SECONDS = 0.4
+DEFAULT_SECONDS_PER_CHARACTER = 0.0008
+
+@dataclass
+class LatencyModel:
+    """Seconds an RPC takes for a chunk: overhead plus a cost per character"""
+    overhead_seconds: float = DEFAULT_RPC_OVERHEAD_SECONDS
+    seconds_per_character: float = DEFAULT_SECONDS_PER_CHARACTER
+    samples: int = 0  # chunk records the model was fitted to, 0 for the defaults
+
+    def predict(self, characters: int) -> float:
+        """Expected seconds for an RPC of a chunk with this many characters"""
+        return self.overhead_seconds + self.seconds_per_character * characters
+
+    @classmethod
+    def fit(cls, points: List[Tuple[int, float]]) -> 'LatencyModel':
+        """Least-squares fit to (characters, seconds) of synthesized chunks"""
+        if len(points) < 2:
+            return cls()
+
+        count = len(points)
+        mean_x = sum(x for x, _ in points) / count
+        mean_y = sum(y for _, y in points) / count
+        variance = sum((x - mean_x) ** 2 for x, _ in points)
+        if variance == 0:
+            # Chunks all the same size: spread their latency over their characters
+            return cls(0.0, mean_y / mean_x, count)
+
+        slope = sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+        slope = max(0.0, slope)
+        return cls(max(0.0, mean_y - slope * mean_x), slope, count)
+
+@dataclass
+class TierEstimate:
+    """Work and cost of the requests using one voice type"""
+    voice_type: str
+    requests: int = 0
+    chunks: int = 0
+    rpcs: int = 0                  # chunks that will actually be sent to the API
+    billable_characters: int = 0   # characters of those chunks
+    cache_hits: int = 0            # chunks served from the audio cache or the journal
+    cost_usd: float = 0.0
+
+@dataclass
+class BatchPlan:
+    """What a batch would do, without doing it"""
+    requests: int = 0
+    already_completed: int = 0
+    invalid: Dict[str, str] = field(default_factory=dict)  # output_path -> error_message
+    tiers: Dict[str, TierEstimate] = field(default_factory=dict)
+    rpc_seconds: float = 0.0          # predicted latency of all RPCs, one after another
+    concurrency: int = 1              # RPCs in flight at once
+    wall_clock_seconds: float = 0.0
+    latency_model: LatencyModel = field(default_factory=LatencyModel)
+
+    @property
+    def rpcs(self) -> int:
+        """RPCs the batch will send"""
+        return sum(tier.rpcs for tier in self.tiers.values())
+
+    @property
+    def billable_characters(self) -> int:
+        """Characters the batch will be billed for"""
+        return sum(tier.billable_characters for tier in self.tiers.values())
+
+    @property
+    def cache_hits(self) -> int:
+        """Chunks the batch will not have to synthesize"""
+        return sum(tier.cache_hits for tier in self.tiers.values())
+
+    @property
+    def cost_usd(self) -> float:
+        """Projected cost at list prices"""
+        return sum(tier.cost_usd for tier in self.tiers.values())
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization"""
+        return {
+            'requests': self.requests,
+            'already_completed': self.already_completed,
+            'invalid': dict(self.invalid),
+            'rpcs': self.rpcs,
+            'billable_characters': self.billable_characters,
+            'cache_hits': self.cache_hits,
+            'cost_usd': round(self.cost_usd, 4),
+            'rpc_seconds': round(self.rpc_seconds, 2),
+            'concurrency': self.concurrency,
+            'wall_clock_seconds': round(self.wall_clock_seconds, 2),
+            'latency_model': asdict(self.latency_model),
+            'tiers': [asdict(tier) for tier in self.tiers.values()]
+        }
+
+class BatchPlanner:
+    """Estimates RPCs, billable characters, cache hits, time and cost of a batch offline
+
+    Runs the same validation and chunking as a real run, and checks every
+    chunk against the audio cache and the journal, but never calls the API.
+    Latency comes from a model fitted to the chunks the journal has timed.
+    """
+
+    def __init__(self, journal: Optional[JobJournal] = None, audio_cache: Optional[AudioCache] = None):
+        self._journal = journal
+        self._audio_cache = audio_cache
+
+    def plan(self, requests: List[TTSRequest], workers: int = 4,
+             max_concurrent_rpcs: Optional[int] = None,
+             requests_per_minute: Optional[float] = None, processes: int = 1) -> BatchPlan:
+        """Plan a batch run with the given number of parallel requests
+
+        workers counts parallel requests across all processes. RPCs in flight
+        are capped at max_concurrent_rpcs when given, otherwise at the
+        concurrency limiter's starting limit in each process, and
+        requests_per_minute is the total rate limit of the credential pool.
+        """
+        latency_model = LatencyModel.fit(self._journal.latency_samples() if self._journal else [])
+        plan = BatchPlan(requests=len(requests), latency_model=latency_model)
+        seen_fingerprints = set()
+        longest_request_seconds = 0.0
+
+        for request in requests:
+            is_valid, error_msg = request.is_valid()
+            if not is_valid:
+                plan.invalid[request.output_path] = error_msg
+                continue
+
+            job_id = fingerprint_request(request)[:16]
+            if self._journal is not None and self._journal.is_completed(job_id):
+                plan.already_completed += 1
+                continue
+
+            voice_type = VoiceDataManager._extract_voice_type(request.voice_config.voice_name)
+            tier = plan.tiers.setdefault(voice_type, TierEstimate(voice_type))
+            tier.requests += 1
+
+            request_seconds = []
+            for chunk in request.get_chunks():
+                fingerprint = fingerprint_chunk(chunk, request.is_ssml,
+                                                request.voice_config, request.audio_config)
+                tier.chunks += 1
+                if self._is_stored(job_id, fingerprint, seen_fingerprints):
+                    tier.cache_hits += 1
+                    continue
+                seen_fingerprints.add(fingerprint)
+
+                tier.rpcs += 1
+                tier.billable_characters += len(chunk)
+                request_seconds.append(latency_model.predict(len(chunk)))
+
+            plan.rpc_seconds += sum(request_seconds)
+            # A request's chunks run MAX_PARALLEL_CHUNKS at a time
+            longest_request_seconds = max(
+                longest_request_seconds,
+                sum(request_seconds) / min(SynthesisPipeline.MAX_PARALLEL_CHUNKS, max(1, len(request_seconds)))
+            )
+
+        for tier in plan.tiers.values():
+            price = PRICE_PER_MILLION_CHARACTERS.get(tier.voice_type, PRICE_PER_MILLION_CHARACTERS['Standard'])
+            tier.cost_usd = tier.billable_characters * price / 1_000_000
+
+        plan.concurrency, plan.wall_clock_seconds = self._project_wall_clock(
+            plan, longest_request_seconds, workers, max_concurrent_rpcs, requests_per_minute, processes
+        )
+        return plan
+
+    def _is_stored(self, job_id: str, fingerprint: str, seen_fingerprints: set) -> bool:
+        """Check if a chunk will be served without an RPC"""
+        if self._journal is not None and self._journal.has_chunk(job_id, fingerprint):
+            return True
+        if self._audio_cache is None:
+            return False
+        # Earlier chunks of the batch are in the cache by the time a duplicate runs
+        return fingerprint in seen_fingerprints or self._audio_cache.contains(fingerprint)
+
+    @staticmethod
+    def _project_wall_clock(plan: BatchPlan, longest_request_seconds: float, workers: int,
+                            max_concurrent_rpcs: Optional[int],
+                            requests_per_minute: Optional[float], processes: int) -> Tuple[int, float]:
+        """Effective concurrency and projected wall-clock seconds of a plan"""
+        concurrency = max(1, workers) * SynthesisPipeline.MAX_PARALLEL_CHUNKS
+        if max_concurrent_rpcs:
+            concurrency = min(concurrency, max_concurrent_rpcs)
+        else:
+            # Each process's limiter starts here and only grows once it has seen the service keep up
+            concurrency = min(concurrency, max(1, processes) * TTSServiceManager.INITIAL_CONCURRENCY_LIMIT)
+
+        seconds = max(plan.rpc_seconds / concurrency, longest_request_seconds)
+        if requests_per_minute:
+            seconds = max(seconds, plan.rpcs * 60.0 / requests_per_minute)
+        return concurrency, seconds
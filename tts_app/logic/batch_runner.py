@@ -0,0 +1,324 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+import json
+import logging
+import multiprocessing
+import multiprocessing.util
+import os
+import signal
+import threading
+import time
+
+from tts_app.models.tts_config import TTSRequest
+from tts_app.models.job_config import JobStatus
+from tts_app.logic.tts_engine import TTSEngine
+from tts_app.logic.cancellation import CancellationToken, OperationCancelledError
+from tts_app.logic.job_journal import JobJournal, fingerprint_request
+from tts_app.logic.audio_cache import AudioCache
+from tts_app.logic.metrics import MetricsRegistry
+from tts_app.logic.run_profiler import profiler_from_environment
+from tts_app.logic.structured_logging import configure_logging, shutdown_logging
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class RequestOutcome:
+    """How one request of a batch ended, with what it produced"""
+    job_id: str
+    status: JobStatus
+    error_message: Optional[str] = None
+    characters: int = 0
+    audio_bytes: int = 0
+    seconds: float = 0.0
+    pid: int = 0  # process that ran the request
+
+@dataclass
+class BatchResult:
+    """Outcome counts and aggregate throughput of a batch run"""
+    completed: int = 0
+    skipped: int = 0
+    failed: int = 0
+    cancelled: int = 0
+    errors: Dict[str, str] = field(default_factory=dict)  # output_path -> error_message
+    characters: int = 0
+    audio_bytes: int = 0
+    elapsed_seconds: float = 0.0
+    requests_per_process: Dict[int, int] = field(default_factory=dict)  # pid -> requests run
+
+    @property
+    def total(self) -> int:
+        """Number of requests in the batch"""
+        return self.completed + self.skipped + self.failed + self.cancelled
+
+    @property
+    def requests_per_second(self) -> float:
+        """Completed requests per second of wall time"""
+        return self.completed / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    @property
+    def characters_per_second(self) -> float:
+        """Characters of completed requests synthesized per second of wall time"""
+        return self.characters / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    @property
+    def audio_megabytes_per_second(self) -> float:
+        """Output written per second of wall time"""
+        return self.audio_bytes / (1024 * 1024) / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def add(self, request: TTSRequest, outcome: RequestOutcome) -> None:
+        """Count the outcome of one request"""
+        if outcome.status == JobStatus.COMPLETED:
+            self.completed += 1
+            self.characters += outcome.characters
+            self.audio_bytes += outcome.audio_bytes
+        elif outcome.status == JobStatus.CANCELLED:
+            self.cancelled += 1
+        else:
+            self.failed += 1
+            self.errors[request.output_path] = outcome.error_message
+        if outcome.status != JobStatus.CANCELLED:
+            self.requests_per_process[outcome.pid] = self.requests_per_process.get(outcome.pid, 0) + 1
+
+def load_manifest(manifest_path: str) -> List[TTSRequest]:
+    """Load a JSON Lines manifest with one TTS request per line
+
+    Relative output paths are resolved against the manifest's directory.
+    """
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    requests = []
+    with open(manifest_path, "r", encoding="utf-8") as manifest:
+        for line_number, line in enumerate(manifest, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                request = TTSRequest.from_dict(json.loads(line))
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{manifest_path}:{line_number}: invalid JSON: {e}")
+            if request.output_path and not os.path.isabs(request.output_path):
+                request.output_path = os.path.join(base_dir, request.output_path)
+            requests.append(request)
+    return requests
+
+class BatchRunner:
+    """Runs many TTS requests, journaling each so an interrupted batch resumes where it stopped
+
+    A request's job id is the fingerprint of its content, voice, audio settings
+    and output path, so rerunning the same manifest skips completed requests
+    and only resynthesizes the chunks that were never finished.
+    """
+
+    def __init__(self, engine: TTSEngine, max_workers: int = 4):
+        if engine.journal is None:
+            raise ValueError("Batch runs need an engine with a journal")
+        self._engine = engine
+        self._journal = engine.journal
+        self._max_workers = max(1, max_workers)
+        self._cancel_token = CancellationToken()
+
+    @property
+    def metrics(self) -> MetricsRegistry:
+        """Stage timings and counters of the batch"""
+        return self._engine.metrics
+
+    def cancel(self) -> None:
+        """Stop the batch; unfinished requests stay resumable"""
+        self._cancel_token.cancel()
+
+    def run(self, requests: List[TTSRequest],
+            on_result: Optional[Callable[[TTSRequest, JobStatus, Optional[str]], None]] = None) -> BatchResult:
+        """Run all requests that the journal does not show as completed"""
+        started = time.monotonic()
+        result = BatchResult()
+        pending = _enqueue_pending(self._journal, requests, result)
+        self.run_pending(pending, result, on_result)
+        result.elapsed_seconds = time.monotonic() - started
+        return result
+
+    def run_pending(self, pending: List[Tuple[str, TTSRequest]], result: BatchResult,
+                    on_result: Optional[Callable[[TTSRequest, JobStatus, Optional[str]], None]] = None
+                    ) -> List[RequestOutcome]:
+        """Run already journaled requests on the thread pool, adding their outcomes to result"""
+        outcomes = []
+        if not pending:
+            return outcomes
+
+        with ThreadPoolExecutor(max_workers=min(self._max_workers, len(pending))) as executor:
+            futures = {executor.submit(self._run_one, job_id, request): request
+                       for job_id, request in pending}
+            for future in as_completed(futures):
+                request = futures[future]
+                outcome = future.result()
+                outcomes.append(outcome)
+                result.add(request, outcome)
+                if on_result:
+                    on_result(request, outcome.status, outcome.error_message)
+
+        return outcomes
+
+    def _run_one(self, job_id: str, request: TTSRequest) -> RequestOutcome:
+        """Run one request and journal its outcome"""
+        if self._cancel_token.is_cancelled:
+            # Left queued in the journal so the next run picks it up
+            return RequestOutcome(job_id, JobStatus.CANCELLED)
+
+        started = time.monotonic()
+        self._journal.record_status(job_id, JobStatus.RUNNING)
+        try:
+            self._engine.synthesize(request, job_id=job_id, cancel_token=self._cancel_token)
+        except OperationCancelledError:
+            return RequestOutcome(job_id, JobStatus.CANCELLED)
+        except Exception as e:
+            self._journal.record_status(job_id, JobStatus.FAILED, str(e))
+            return RequestOutcome(job_id, JobStatus.FAILED, str(e), pid=os.getpid())
+
+        self._journal.record_status(job_id, JobStatus.COMPLETED)
+        return RequestOutcome(
+            job_id, JobStatus.COMPLETED,
+            characters=_request_characters(request),
+            audio_bytes=os.path.getsize(request.output_path),
+            seconds=time.monotonic() - started,
+            pid=os.getpid()
+        )
+
+class ProcessBatchRunner:
+    """Runs a batch across worker processes, each with its own engine and client
+
+    Stitching, WAV header handling and hashing run in the worker processes,
+    so local work scales with cores instead of contending for one
+    interpreter. Requests are handed out in shards of threads_per_process,
+    letting idle processes take more; each shard runs on that many threads.
+    The journal and audio cache are shared on disk and guarded by lock files.
+    """
+
+    def __init__(self, journal: JobJournal, processes: Optional[int] = None,
+                 threads_per_process: int = 4,
+                 credentials_paths: Optional[List[str]] = None,
+                 cache_dir: Optional[str] = None,
+                 fake_latency: Optional[float] = None):
+        self._journal = journal
+        self._processes = max(1, processes or os.cpu_count() or 1)
+        self._threads = max(1, threads_per_process)
+        self._credentials_paths = credentials_paths
+        self._cache_dir = cache_dir
+        self._fake_latency = fake_latency
+        self._context = multiprocessing.get_context("spawn")  # gRPC is not fork-safe
+        self._cancelled = self._context.Event()
+        # Recordings of all worker processes, merged as their shards finish
+        self.metrics = MetricsRegistry()
+
+    def cancel(self) -> None:
+        """Stop the batch; requests in progress finish their current RPC"""
+        self._cancelled.set()
+
+    def check_setup(self) -> Tuple[bool, str]:
+        """Set up the service once in this process, as every worker process will
+
+        A worker that fails to set up breaks the whole pool, so bad
+        credentials are better caught here, before any worker starts.
+        """
+        engine = TTSEngine()
+        try:
+            return engine.initialize(self._credentials_paths, fake_latency=self._fake_latency)
+        finally:
+            engine.close()
+
+    def run(self, requests: List[TTSRequest],
+            on_result: Optional[Callable[[TTSRequest, JobStatus, Optional[str]], None]] = None) -> BatchResult:
+        """Run all requests that the journal does not show as completed
+
+        Raises BrokenProcessPool when a worker process fails to start or dies.
+        """
+        started = time.monotonic()
+        result = BatchResult()
+        pending = _enqueue_pending(self._journal, requests, result)
+        if not pending:
+            return result
+
+        shards = [pending[i:i + self._threads] for i in range(0, len(pending), self._threads)]
+        executor = ProcessPoolExecutor(
+            max_workers=min(self._processes, len(shards)),
+            mp_context=self._context,
+            initializer=_init_worker_process,
+            initargs=(self._journal.journal_path, self._journal.parts_dir, self._journal.fsync,
+                      self._credentials_paths, self._cache_dir, self._fake_latency,
+                      self._threads, self._cancelled)
+        )
+        try:
+            futures = {executor.submit(_run_shard, shard): shard for shard in shards}
+            for future in as_completed(futures):
+                requests_by_job = dict(futures[future])
+                outcomes, metrics_state = future.result()
+                self.metrics.merge_state(metrics_state)
+                for outcome in outcomes:
+                    request = requests_by_job[outcome.job_id]
+                    result.add(request, outcome)
+                    if on_result:
+                        on_result(request, outcome.status, outcome.error_message)
+        except BaseException:
+            self.cancel()
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+        executor.shutdown(wait=True)
+
+        # The workers appended to the journal behind this process's back
+        self._journal.reload()
+        result.elapsed_seconds = time.monotonic() - started
+        return result
+
+# Engine and runner of a batch worker process, set up by _init_worker_process
+_worker_runner: Optional[BatchRunner] = None
+
+def _init_worker_process(journal_path: str, parts_dir: str, fsync: bool,
+                         credentials_paths: Optional[List[str]], cache_dir: Optional[str],
+                         fake_latency: Optional[float], threads: int, cancelled) -> None:
+    """Give a worker process its own engine and client over the shared journal and cache"""
+    global _worker_runner
+    # The parent handles Ctrl+C and tells workers to stop through the cancel event
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    # At the level the parent was started with, from the environment
+    configure_logging()
+    # Pool workers leave through os._exit, which skips atexit but runs multiprocessing finalizers
+    multiprocessing.util.Finalize(None, shutdown_logging, exitpriority=5)
+
+    profiler = profiler_from_environment()
+    if profiler:
+        multiprocessing.util.Finalize(None, profiler.stop, exitpriority=10)
+
+    engine = TTSEngine(
+        journal=JobJournal(journal_path, parts_dir, fsync),
+        audio_cache=AudioCache(cache_dir) if cache_dir else None
+    )
+    success, message = engine.initialize(credentials_paths, fake_latency=fake_latency)
+    if not success:
+        logger.error("Batch worker process could not set up the TTS service: %s", message)
+        raise RuntimeError(message)
+    _worker_runner = BatchRunner(engine, max_workers=threads)
+
+    def watch_cancel():
+        cancelled.wait()
+        _worker_runner.cancel()
+    threading.Thread(target=watch_cancel, name="batch-cancel", daemon=True).start()
+
+def _run_shard(shard: List[Tuple[str, TTSRequest]]) -> Tuple[List[RequestOutcome], dict]:
+    """Run a shard of journaled requests in a worker process, with the metrics it recorded"""
+    outcomes = _worker_runner.run_pending(shard, BatchResult())
+    return outcomes, _worker_runner.metrics.take_state()
+
+def _enqueue_pending(journal: JobJournal, requests: List[TTSRequest],
+                     result: BatchResult) -> List[Tuple[str, TTSRequest]]:
+    """Journal the requests that still need to run, counting the others as skipped"""
+    pending = []
+    for request in requests:
+        job_id = fingerprint_request(request)[:16]
+        if journal.is_completed(job_id):
+            result.skipped += 1
+            continue
+        journal.record_job(job_id, request, JobStatus.QUEUED)
+        pending.append((job_id, request))
+    return pending
+
+def _request_characters(request: TTSRequest) -> int:
+    """Characters of content a request synthesizes"""
+    return len(request.ssml_config.ssml_text) if request.is_ssml else len(request.text)
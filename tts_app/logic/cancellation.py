@@ -0,0 +1,114 @@
+from typing import Callable, List, Optional
+import threading
+import time
+
+class OperationCancelledError(Exception):
+    """Raised when an operation is cancelled before it completes"""
+
+class DeadlineExceededError(OperationCancelledError):
+    """Raised when an operation runs past its deadline"""
+
+class CancellationToken:
+    """Cooperative cancellation signal shared between a job and the calls it makes
+
+    Callbacks registered with add_callback run once when the token is cancelled,
+    either explicitly or because its deadline passed, so in-flight RPCs can be
+    aborted instead of polled. A deadline runs a timer thread until it fires,
+    so whoever creates a token with a timeout calls close() once the work is
+    done.
+    """
+
+    def __init__(self, timeout: Optional[float] = None):
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        self._expired = False
+        self._callbacks: List[Callable[[], None]] = []
+        self._deadline: Optional[float] = None
+        self._timer: Optional[threading.Timer] = None
+
+        if timeout is not None and timeout > 0:
+            self._deadline = time.monotonic() + timeout
+            self._timer = threading.Timer(timeout, self._expire)
+            self._timer.daemon = True
+            self._timer.start()
+
+    @property
+    def is_cancelled(self) -> bool:
+        """Check if the token was cancelled or expired"""
+        return self._cancelled.is_set()
+
+    @property
+    def is_expired(self) -> bool:
+        """Check if the token was cancelled by its deadline"""
+        return self._expired
+
+    def remaining_time(self) -> Optional[float]:
+        """Seconds left before the deadline, or None when there is no deadline"""
+        if self._deadline is None:
+            return None
+        return max(0.0, self._deadline - time.monotonic())
+
+    def cancel(self) -> None:
+        """Cancel the token and run its callbacks"""
+        with self._lock:
+            if self._cancelled.is_set():
+                return
+            self._cancelled.set()
+            callbacks = list(self._callbacks)
+            self._callbacks.clear()
+
+        self.close()
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                pass
+
+    def close(self) -> None:
+        """Stop the deadline timer of a token whose work is done, without cancelling it"""
+        if self._timer is not None:
+            self._timer.cancel()
+
+    def add_callback(self, callback: Callable[[], None]) -> None:
+        """Run callback on cancellation, immediately if already cancelled"""
+        with self._lock:
+            if not self._cancelled.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def child(self) -> 'CancellationToken':
+        """Create a token that is cancelled with this one but can also be cancelled alone
+
+        Call remove_callback(child.cancel) once the child's operation is done.
+        """
+        child = CancellationToken()
+        self.add_callback(child.cancel)
+        return child
+
+    def remove_callback(self, callback: Callable[[], None]) -> None:
+        """Stop tracking a callback once its operation has finished"""
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def raise_if_cancelled(self) -> None:
+        """Raise if the token was cancelled or its deadline passed"""
+        if self._deadline is not None and not self._cancelled.is_set() and self.remaining_time() <= 0:
+            self._expire()
+        if self._expired:
+            raise DeadlineExceededError("Job deadline exceeded")
+        if self._cancelled.is_set():
+            raise OperationCancelledError("Job was cancelled")
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until cancelled or timeout elapses; returns True if cancelled"""
+        return self._cancelled.wait(timeout)
+
+    def _expire(self) -> None:
+        """Cancel the token because its deadline passed"""
+        with self._lock:
+            if self._cancelled.is_set():
+                return
+            self._expired = True
+        self.cancel()
@@ -0,0 +1,114 @@
+from typing import Optional
+import threading
+import time
+
+from tts_app.logic.cancellation import CancellationToken, OperationCancelledError
+from tts_app.logic.rpc_errors import is_quota_error, is_deadline_error
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD limit on synthesis calls in flight, driven by observed latency and errors
+
+    The limit grows by one for every limit's worth of successful calls made
+    while it was the bottleneck, and is cut multiplicatively when the service
+    answers RESOURCE_EXHAUSTED or recent latency inflates well past its
+    long-run baseline. At most one cut happens per baseline latency, so a
+    burst of failures from one overload episode counts once.
+    """
+
+    # How often a blocked acquire rechecks cancellation
+    POLL_INTERVAL = 0.1
+
+    def __init__(self, initial_limit: int = 4, min_limit: int = 1, max_limit: int = 64,
+                 decrease_factor: float = 0.5, latency_tolerance: float = 2.0,
+                 fast_smoothing: float = 0.3, slow_smoothing: float = 0.02):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self._fast_smoothing = fast_smoothing
+        self._slow_smoothing = slow_smoothing
+
+        self._limit = float(max(min_limit, min(initial_limit, max_limit)))
+        self._in_flight = 0
+        self._recent_latency: Optional[float] = None
+        self._baseline_latency: Optional[float] = None
+        self._last_decrease = 0.0
+        self._decreases = 0
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current number of calls allowed in flight"""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently in flight"""
+        return self._in_flight
+
+    def acquire(self, cancel_token: Optional[CancellationToken] = None) -> None:
+        """Wait for a free slot under the current limit"""
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                if cancel_token is not None:
+                    cancel_token.raise_if_cancelled()
+                self._condition.wait(self.POLL_INTERVAL)
+            self._in_flight += 1
+
+    def release(self, latency: float, error: Optional[Exception] = None) -> None:
+        """Free a slot and adjust the limit from the call's outcome"""
+        with self._condition:
+            limited = self._in_flight >= int(self._limit)
+            self._in_flight -= 1
+
+            if error is None:
+                self._record_latency(latency)
+                if self._is_latency_inflated():
+                    self._decrease()
+                elif limited:
+                    self._limit = min(self.max_limit, self._limit + 1.0 / self._limit)
+            elif is_quota_error(error):
+                self._decrease()
+            elif not isinstance(error, OperationCancelledError) and is_deadline_error(error):
+                # Calls timing out under load are another congestion signal
+                self._decrease()
+
+            self._condition.notify_all()
+
+    def metrics(self) -> dict:
+        """Current controller state for monitoring"""
+        with self._condition:
+            return {
+                'limit': int(self._limit),
+                'in_flight': self._in_flight,
+                'recent_latency': self._recent_latency,
+                'baseline_latency': self._baseline_latency,
+                'decreases': self._decreases
+            }
+
+    def _record_latency(self, latency: float) -> None:
+        """Fold a latency into the fast and slow moving averages"""
+        if self._recent_latency is None:
+            self._recent_latency = self._baseline_latency = latency
+            return
+        self._recent_latency += self._fast_smoothing * (latency - self._recent_latency)
+        # The baseline follows improvements quickly and degradations slowly
+        smoothing = self._fast_smoothing if latency < self._baseline_latency else self._slow_smoothing
+        self._baseline_latency += smoothing * (latency - self._baseline_latency)
+
+    def _is_latency_inflated(self) -> bool:
+        """Check if recent latency is well above the baseline"""
+        if self._recent_latency is None or not self._baseline_latency:
+            return False
+        return self._recent_latency > self._baseline_latency * self.latency_tolerance
+
+    def _decrease(self) -> None:
+        """Cut the limit, at most once per baseline latency"""
+        now = time.monotonic()
+        if now - self._last_decrease < (self._baseline_latency or 0.0):
+            return
+        self._last_decrease = now
+        self._decreases += 1
+        self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+        # Judge the reduced limit on fresh samples
+        self._recent_latency = self._baseline_latency
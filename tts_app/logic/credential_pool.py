@@ -0,0 +1,239 @@
+from typing import Callable, List, Optional
+import itertools
+import logging
+import threading
+import time
+import grpc
+
+from google.cloud import texttospeech
+
+from tts_app.logic.cancellation import CancellationToken, OperationCancelledError, DeadlineExceededError
+from tts_app.logic.rpc_errors import is_deadline_error, is_quota_error, is_credential_error
+from tts_app.logic.grpc_transport import shared_transport
+
+logger = logging.getLogger(__name__)
+
+class TokenBucket:
+    """Request rate limiter refilled continuously up to a burst capacity"""
+
+    def __init__(self, requests_per_minute: float, burst: Optional[float] = None):
+        self._rate = requests_per_minute / 60.0
+        self._capacity = burst if burst is not None else max(1.0, requests_per_minute / 60.0)
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens earned since the last refill"""
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def try_take(self) -> bool:
+        """Take a token if one is available"""
+        self._refill(time.monotonic())
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+
+    def seconds_until_available(self) -> float:
+        """Time until the next token can be taken"""
+        self._refill(time.monotonic())
+        if self._tokens >= 1:
+            return 0.0
+        return (1 - self._tokens) / self._rate
+
+class PooledClient:
+    """One service account's clients with its rate limit and health state"""
+
+    def __init__(self, credentials_path: Optional[str], clients: List[texttospeech.TextToSpeechClient],
+                 requests_per_minute: Optional[float] = None):
+        self.credentials_path = credentials_path
+        self.clients = clients
+        self._next_client = itertools.cycle(clients)
+        self.requests_per_minute = requests_per_minute
+        self.bucket = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.in_flight = 0
+        self.total_requests = 0
+        self.total_failures = 0
+        self.consecutive_failures = 0
+        self.ejected_until = 0.0
+        self.ejection_reason: Optional[str] = None
+
+    @property
+    def client(self) -> texttospeech.TextToSpeechClient:
+        """Next client, spreading calls over the account's channels"""
+        return next(self._next_client)
+
+    def is_ejected(self, now: float) -> bool:
+        """Check if the account is temporarily out of rotation"""
+        return now < self.ejected_until
+
+    def to_dict(self) -> dict:
+        """Describe the account's current state"""
+        now = time.monotonic()
+        return {
+            'credentials_path': self.credentials_path,
+            'channels': len(self.clients),
+            'in_flight': self.in_flight,
+            'total_requests': self.total_requests,
+            'total_failures': self.total_failures,
+            'ejected': self.is_ejected(now),
+            'ejected_for_seconds': max(0.0, self.ejected_until - now),
+            'ejection_reason': self.ejection_reason
+        }
+
+class CredentialPool:
+    """Load-balances synthesis calls over clients for several service accounts
+
+    Each call goes to the healthy account with the fewest calls in flight that
+    still has rate budget. Accounts that run out of quota, have their
+    credentials rejected or keep failing are ejected for a cool-down period
+    and rejoin the rotation afterwards. A pool of one account never ejects
+    it, since there is nothing to fail over to, and a call made while every
+    account is ejected fails at once rather than waiting out the cool-down.
+    """
+
+    # Consecutive transient failures before an account is ejected
+    FAILURE_THRESHOLD = 3
+
+    # Cool-downs in seconds; quota windows are per minute
+    QUOTA_COOLDOWN = 60.0
+    CREDENTIAL_COOLDOWN = 600.0
+    FAILURE_COOLDOWN = 15.0
+    MAX_FAILURE_COOLDOWN = 300.0
+
+    # How often a blocked acquire rechecks cancellation
+    POLL_INTERVAL = 0.1
+
+    def __init__(self, credentials_paths: List[Optional[str]], requests_per_minute: Optional[float] = None,
+                 client_factory: Callable[[Optional[str]], List[texttospeech.TextToSpeechClient]] = None):
+        """A None path stands for the application default credentials"""
+        client_factory = client_factory or shared_transport().get_clients
+        if not credentials_paths:
+            raise ValueError("At least one credentials file is required")
+
+        self._members: List[PooledClient] = [
+            PooledClient(path, client_factory(path), requests_per_minute)
+            for path in dict.fromkeys(credentials_paths)
+        ]
+        self._condition = threading.Condition()
+
+    @property
+    def size(self) -> int:
+        """Number of accounts in the pool"""
+        return len(self._members)
+
+    @property
+    def requests_per_minute(self) -> Optional[float]:
+        """Total rate limit of the pool, None when any account is unlimited"""
+        if any(not member.requests_per_minute for member in self._members):
+            return None
+        return sum(member.requests_per_minute for member in self._members)
+
+    @property
+    def primary_client(self) -> texttospeech.TextToSpeechClient:
+        """Client for calls that are not load-balanced, such as listing voices"""
+        return self._members[0].clients[0]
+
+    @property
+    def credentials_paths(self) -> List[Optional[str]]:
+        """Key files of the accounts in the pool"""
+        return [member.credentials_path for member in self._members]
+
+    def acquire(self, timeout: Optional[float] = None,
+                cancel_token: Optional[CancellationToken] = None,
+                exclude: Optional[set] = None) -> PooledClient:
+        """Reserve the best available account, waiting while all are busy
+
+        Raises RuntimeError at once when every account that may be used is ejected.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self._condition:
+            while True:
+                if cancel_token is not None:
+                    cancel_token.raise_if_cancelled()
+
+                member, wait_for = self._select(exclude or set())
+                if member is not None:
+                    member.in_flight += 1
+                    member.total_requests += 1
+                    return member
+
+                wait_for = min(wait_for, self.POLL_INTERVAL)
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise DeadlineExceededError("No credentials became available before the deadline")
+                    wait_for = min(wait_for, remaining)
+                self._condition.wait(wait_for)
+
+    def release(self, member: PooledClient, error: Optional[Exception] = None) -> None:
+        """Return an account after a call, ejecting it if the error is its fault"""
+        with self._condition:
+            member.in_flight -= 1
+            if error is None:
+                member.consecutive_failures = 0
+            elif not self._is_caller_error(error):
+                self._record_failure(member, error)
+            self._condition.notify_all()
+
+    def status(self) -> List[dict]:
+        """Describe every account in the pool"""
+        with self._condition:
+            return [member.to_dict() for member in self._members]
+
+    def _select(self, exclude: set) -> tuple:
+        """Pick the least loaded usable account, or how long until one has rate budget"""
+        now = time.monotonic()
+        wait_for = float("inf")
+        allowed = [member for member in self._members if member.credentials_path not in exclude]
+        candidates = [member for member in allowed if not member.is_ejected(now)]
+
+        if not candidates:
+            if not allowed:
+                raise RuntimeError("Every account in the credential pool has already been tried")
+            reasons = sorted({member.ejection_reason or "Unknown" for member in allowed})
+            raise RuntimeError(f"Every account in the credential pool is out of rotation: {'; '.join(reasons)}")
+
+        for member in sorted(candidates, key=lambda m: m.in_flight):
+            if member.bucket is None or member.bucket.try_take():
+                return member, 0.0
+            wait_for = min(wait_for, member.bucket.seconds_until_available())
+        return None, wait_for
+
+    @staticmethod
+    def _is_caller_error(error: Exception) -> bool:
+        """Check if a call failed because of the caller's cancellation or deadline"""
+        return (isinstance(error, (OperationCancelledError, grpc.FutureCancelledError))
+                or is_deadline_error(error))
+
+    def _record_failure(self, member: PooledClient, error: Exception) -> None:
+        """Update an account's health after a failed call"""
+        member.total_failures += 1
+        now = time.monotonic()
+        if self.size == 1:
+            # Ejecting the only account would just stall every call until the cool-down ends
+            member.consecutive_failures += 1
+            return
+
+        if is_quota_error(error):
+            self._eject(member, now, self.QUOTA_COOLDOWN, "Quota exhausted")
+        elif is_credential_error(error):
+            self._eject(member, now, self.CREDENTIAL_COOLDOWN, "Credentials rejected")
+        else:
+            member.consecutive_failures += 1
+            if member.consecutive_failures >= self.FAILURE_THRESHOLD:
+                # Back off harder each time the account keeps failing
+                extra = member.consecutive_failures - self.FAILURE_THRESHOLD
+                cooldown = min(self.FAILURE_COOLDOWN * (2 ** extra), self.MAX_FAILURE_COOLDOWN)
+                self._eject(member, now, cooldown, f"Failing: {error}")
+
+    @staticmethod
+    def _eject(member: PooledClient, now: float, cooldown: float, reason: str) -> None:
+        """Take an account out of rotation for a while"""
+        member.ejected_until = now + cooldown
+        member.ejection_reason = reason
+        logger.warning("Service account %s out of rotation for %.0fs: %s",
+                       member.credentials_path or "default", cooldown, reason,
+                       extra={'cooldown_seconds': cooldown})
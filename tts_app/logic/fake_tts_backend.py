@@ -0,0 +1,104 @@
+from google.cloud import texttospeech
+from typing import List, Optional
+import struct
+import threading
+import time
+
+class FakeTextToSpeechClient:
+    """Offline stand-in for TextToSpeechClient, for local runs and load tests
+
+    Serves a small fixed voice catalog and answers synthesis with silence
+    whose duration follows the text length, after a simulated latency.
+    LINEAR16 responses are valid WAV files; MP3 and OGG_OPUS responses are
+    placeholder bytes of a plausible size and do not decode.
+    """
+
+    # (name, gender, natural sample rate)
+    VOICES = [
+        ("en-US-Standard-A", texttospeech.SsmlVoiceGender.MALE, 24000),
+        ("en-US-Wavenet-F", texttospeech.SsmlVoiceGender.FEMALE, 24000),
+        ("en-US-Neural2-C", texttospeech.SsmlVoiceGender.FEMALE, 24000),
+        ("en-US-Chirp3-HD-Achird", texttospeech.SsmlVoiceGender.MALE, 24000),
+        ("en-GB-Standard-B", texttospeech.SsmlVoiceGender.MALE, 24000),
+        ("en-GB-Studio-C", texttospeech.SsmlVoiceGender.FEMALE, 24000),
+        ("fr-FR-Wavenet-A", texttospeech.SsmlVoiceGender.FEMALE, 24000),
+        ("de-DE-Neural2-B", texttospeech.SsmlVoiceGender.MALE, 24000),
+        ("ja-JP-Standard-A", texttospeech.SsmlVoiceGender.FEMALE, 24000),
+    ]
+
+    # Seconds of speech per input character
+    SECONDS_PER_CHARACTER = 0.06
+
+    # Encoded bytes per second of speech for the compressed formats
+    COMPRESSED_BYTES_PER_SECOND = 4000
+
+    def __init__(self, latency: float = 0.2, latency_per_character: float = 0.0002):
+        self.latency = latency
+        self.latency_per_character = latency_per_character
+        # No gRPC channel; callers fall back to plain blocking calls
+        self.transport = None
+        self._calls = 0
+        self._lock = threading.Lock()
+
+    @property
+    def calls(self) -> int:
+        """Number of synthesis calls served"""
+        return self._calls
+
+    def list_voices(self, language_code: Optional[str] = None, **kwargs) -> texttospeech.ListVoicesResponse:
+        """List the fixed voice catalog, optionally for one language"""
+        voices = [
+            texttospeech.Voice(
+                name=name,
+                language_codes=[self._language_of(name)],
+                ssml_gender=gender,
+                natural_sample_rate_hertz=sample_rate
+            )
+            for name, gender, sample_rate in self.VOICES
+            if not language_code or self._language_of(name) == language_code
+        ]
+        return texttospeech.ListVoicesResponse(voices=voices)
+
+    def synthesize_speech(self, request: texttospeech.SynthesizeSpeechRequest = None,
+                          timeout: Optional[float] = None, **kwargs) -> texttospeech.SynthesizeSpeechResponse:
+        """Return silence for the request's text after the simulated latency"""
+        characters = len(request.input.text or request.input.ssml)
+        delay = self.latency + self.latency_per_character * characters
+        if timeout is not None and delay > timeout:
+            time.sleep(timeout)
+            raise TimeoutError("Fake synthesis deadline exceeded")
+        time.sleep(delay)
+
+        with self._lock:
+            self._calls += 1
+
+        duration = characters * self.SECONDS_PER_CHARACTER / (request.audio_config.speaking_rate or 1.0)
+        if request.audio_config.audio_encoding == texttospeech.AudioEncoding.LINEAR16:
+            sample_rate = request.audio_config.sample_rate_hertz or 24000
+            audio_content = self._silent_wav(duration, sample_rate)
+        else:
+            audio_content = bytes(int(duration * self.COMPRESSED_BYTES_PER_SECOND))
+        return texttospeech.SynthesizeSpeechResponse(audio_content=audio_content)
+
+    @staticmethod
+    def _language_of(voice_name: str) -> str:
+        """Language code prefix of a voice name"""
+        return "-".join(voice_name.split("-")[:2])
+
+    @staticmethod
+    def _silent_wav(duration: float, sample_rate: int) -> bytes:
+        """Mono 16-bit PCM WAV of silence"""
+        data_size = int(duration * sample_rate) * 2
+        header = struct.pack(
+            "<4sI4s4sIHHIIHH4sI",
+            b"RIFF", 36 + data_size, b"WAVE",
+            b"fmt ", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+            b"data", data_size
+        )
+        return header + bytes(data_size)
+
+def fake_client_factory(latency: float = 0.2, latency_per_character: float = 0.0002):
+    """Client factory for CredentialPool that hands out fake clients"""
+    def create(credentials_path: Optional[str]) -> List[FakeTextToSpeechClient]:
+        return [FakeTextToSpeechClient(latency, latency_per_character)]
+    return create
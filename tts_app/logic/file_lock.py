@@ -0,0 +1,62 @@
+from typing import Optional
+import os
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+class FileLock:
+    """Exclusive lock shared by every thread and process that opens the same lock file
+
+    Used as a context manager around writes to files that several batch
+    worker processes share. The lock file itself stays empty.
+    """
+
+    def __init__(self, lock_path: str):
+        self.lock_path = lock_path
+        self._thread_lock = threading.Lock()
+        self._fd: Optional[int] = None
+
+    def acquire(self) -> None:
+        """Block until this process holds the lock"""
+        self._thread_lock.acquire()
+        try:
+            directory = os.path.dirname(os.path.abspath(self.lock_path))
+            os.makedirs(directory, exist_ok=True)
+            self._fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_EX)
+            else:
+                msvcrt.locking(self._fd, msvcrt.LK_LOCK, 1)
+        except Exception:
+            self._close()
+            self._thread_lock.release()
+            raise
+
+    def release(self) -> None:
+        """Let other threads and processes take the lock"""
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            self._close()
+            self._thread_lock.release()
+
+    def __enter__(self) -> 'FileLock':
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.release()
+
+    def _close(self) -> None:
+        """Close the lock file descriptor"""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
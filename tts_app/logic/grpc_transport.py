@@ -0,0 +1,90 @@
+from dataclasses import astuple
+from typing import Dict, List, Optional
+import threading
+import grpc
+
+from google.cloud import texttospeech
+from google.cloud.texttospeech_v1.services.text_to_speech.transports import TextToSpeechGrpcTransport
+
+from tts_app.models.settings_config import TransportConfig
+
+COMPRESSION = {
+    'none': grpc.Compression.NoCompression,
+    'gzip': grpc.Compression.Gzip,
+    'deflate': grpc.Compression.Deflate
+}
+
+def channel_options(config: TransportConfig) -> List[tuple]:
+    """gRPC channel arguments for a transport configuration"""
+    return [
+        ('grpc.keepalive_time_ms', config.keepalive_time_ms),
+        ('grpc.keepalive_timeout_ms', config.keepalive_timeout_ms),
+        ('grpc.keepalive_permit_without_calls', int(config.keepalive_without_calls)),
+        ('grpc.http2.max_pings_without_data', 0),
+        ('grpc.max_receive_message_length', config.max_receive_message_mb * 1024 * 1024),
+        ('grpc.max_send_message_length', config.max_send_message_mb * 1024 * 1024),
+        # Without this, channels with identical arguments share one connection
+        ('grpc.use_local_subchannel_pool', 1)
+    ]
+
+def load_credentials(credentials_path: Optional[str]):
+    """Load service account credentials, or None for the application default"""
+    if credentials_path is None:
+        return None
+    from google.oauth2 import service_account
+    return service_account.Credentials.from_service_account_file(credentials_path)
+
+class TransportRegistry:
+    """Process-wide cache of tuned gRPC channels and the TTS clients built on them
+
+    Clients are keyed by credentials and transport configuration, so every
+    TTSServiceManager (including short-lived ones) reuses the same pool of
+    connections instead of opening its own.
+    """
+
+    def __init__(self):
+        self._clients: Dict[tuple, List[texttospeech.TextToSpeechClient]] = {}
+        self._channels: Dict[tuple, List[grpc.Channel]] = {}
+        self._lock = threading.Lock()
+
+    def get_clients(self, credentials_path: Optional[str],
+                    config: Optional[TransportConfig] = None) -> List[texttospeech.TextToSpeechClient]:
+        """Get one client per pooled channel for a set of credentials"""
+        config = config or TransportConfig()
+        key = (credentials_path, astuple(config))
+
+        with self._lock:
+            clients = self._clients.get(key)
+            if clients is None:
+                credentials = load_credentials(credentials_path)
+                channels = [self._create_channel(credentials, config)
+                            for _ in range(max(1, config.channel_count))]
+                clients = [texttospeech.TextToSpeechClient(transport=TextToSpeechGrpcTransport(channel=channel))
+                           for channel in channels]
+                self._channels[key] = channels
+                self._clients[key] = clients
+            return list(clients)
+
+    def close(self) -> None:
+        """Close every pooled channel"""
+        with self._lock:
+            for channels in self._channels.values():
+                for channel in channels:
+                    channel.close()
+            self._channels.clear()
+            self._clients.clear()
+
+    @staticmethod
+    def _create_channel(credentials, config: TransportConfig) -> grpc.Channel:
+        """Open one tuned channel to the TTS endpoint"""
+        return TextToSpeechGrpcTransport.create_channel(
+            credentials=credentials,
+            options=channel_options(config),
+            compression=COMPRESSION.get(config.compression, grpc.Compression.NoCompression)
+        )
+
+_registry = TransportRegistry()
+
+def shared_transport() -> TransportRegistry:
+    """Get the process-wide transport registry"""
+    return _registry
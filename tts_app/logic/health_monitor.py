@@ -0,0 +1,165 @@
+from typing import Callable, List, Optional
+import logging
+import threading
+import time
+import grpc
+
+from tts_app.models.health_config import HealthState, HealthStatus
+from tts_app.logic.rpc_errors import rpc_status_code
+
+logger = logging.getLogger(__name__)
+
+class HealthMonitor:
+    """Tracks TTS connectivity in the background from channel state, without RPCs
+
+    The channel's connectivity changes are watched as they happen and the
+    channel is probed periodically with channel_ready_future, which at most
+    opens a connection. Outcomes of real synthesis calls are folded in too.
+    The last status is cached so callers read it instantly; listeners are
+    called on state transitions, from a background thread.
+    """
+
+    # Seconds between background probes
+    CHECK_INTERVAL = 30.0
+
+    # Seconds to wait for the channel to connect during a probe
+    PROBE_TIMEOUT = 3.0
+
+    def __init__(self, channel_provider: Callable[[], Optional[grpc.Channel]],
+                 interval: float = CHECK_INTERVAL):
+        self._channel_provider = channel_provider
+        self.interval = interval
+        self._status = HealthStatus()
+        self._listeners: List[Callable[[HealthStatus], None]] = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._watched_channel: Optional[grpc.Channel] = None
+        self._watch_lock = threading.Lock()
+
+    @property
+    def status(self) -> HealthStatus:
+        """Last known status, without any network activity"""
+        return self._status
+
+    def add_listener(self, listener: Callable[[HealthStatus], None]) -> None:
+        """Call listener whenever the health state changes"""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[HealthStatus], None]) -> None:
+        """Stop notifying a listener"""
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    @property
+    def is_running(self) -> bool:
+        """Check if probes run in the background"""
+        return self._thread is not None and self._thread.is_alive() and not self._stopped.is_set()
+
+    def start(self) -> None:
+        """Start probing in the background"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="tts-health", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop background probing"""
+        self._stopped.set()
+        self._wake.set()
+        self._unwatch()
+
+    def request_check(self) -> None:
+        """Probe again soon, e.g. after the channel was replaced"""
+        self._wake.set()
+
+    def check_now(self, timeout: float = PROBE_TIMEOUT) -> HealthStatus:
+        """Probe the channel and update the cached status"""
+        channel = self._channel_provider()
+        if channel is None:
+            return self._update(HealthState.UNKNOWN, "TTS service not initialized")
+        self._watch(channel)
+
+        started = time.monotonic()
+        ready = grpc.channel_ready_future(channel)
+        try:
+            ready.result(timeout=timeout)
+        except grpc.FutureTimeoutError:
+            # An abandoned future stays subscribed to the channel's connectivity
+            ready.cancel()
+            return self._update(HealthState.OFFLINE, "Cannot reach the Text-to-Speech service")
+        except Exception as e:
+            ready.cancel()
+            return self._update(HealthState.OFFLINE, f"Connection failed: {e}")
+        latency_ms = (time.monotonic() - started) * 1000
+        return self._update(HealthState.ONLINE, "Connected to the Text-to-Speech service", latency_ms)
+
+    def record_success(self) -> None:
+        """Note that a real call just succeeded"""
+        if self._status.state != HealthState.ONLINE:
+            self._update(HealthState.ONLINE, "Connected to the Text-to-Speech service")
+
+    def record_failure(self, error: Exception) -> None:
+        """Note a failed call; only unreachability changes the state"""
+        if rpc_status_code(error) == grpc.StatusCode.UNAVAILABLE:
+            self._update(HealthState.OFFLINE, f"Service unavailable: {error}")
+            self.request_check()
+
+    def _run(self) -> None:
+        """Probe periodically until stopped"""
+        while not self._stopped.is_set():
+            self.check_now()
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+    def _watch(self, channel: grpc.Channel) -> None:
+        """Follow connectivity changes of the current channel"""
+        with self._watch_lock:
+            if channel is self._watched_channel:
+                return
+            self._unsubscribe()
+            self._watched_channel = channel
+            channel.subscribe(self._on_connectivity, try_to_connect=False)
+
+    def _unwatch(self) -> None:
+        """Stop following the previous channel"""
+        with self._watch_lock:
+            self._unsubscribe()
+
+    def _unsubscribe(self) -> None:
+        """Drop the connectivity subscription; caller holds the watch lock"""
+        if self._watched_channel is not None:
+            try:
+                self._watched_channel.unsubscribe(self._on_connectivity)
+            except Exception:
+                pass
+            self._watched_channel = None
+
+    def _on_connectivity(self, connectivity: grpc.ChannelConnectivity) -> None:
+        """Map channel connectivity transitions to health states"""
+        if connectivity == grpc.ChannelConnectivity.READY:
+            self._update(HealthState.ONLINE, "Connected to the Text-to-Speech service")
+        elif connectivity == grpc.ChannelConnectivity.TRANSIENT_FAILURE:
+            self._update(HealthState.OFFLINE, "Connection to the Text-to-Speech service lost")
+
+    def _update(self, state: HealthState, message: str, latency_ms: Optional[float] = None) -> HealthStatus:
+        """Cache a new status and notify listeners if the state changed"""
+        status = HealthStatus(state=state, message=message, latency_ms=latency_ms)
+        with self._lock:
+            changed = state != self._status.state
+            self._status = status
+            listeners = list(self._listeners) if changed else []
+
+        if changed:
+            log_level = logging.WARNING if state == HealthState.OFFLINE else logging.INFO
+            logger.log(log_level, "Text-to-Speech service %s: %s", state.value, message)
+        for listener in listeners:
+            try:
+                listener(status)
+            except Exception:
+                logger.exception("Health listener failed")
+        return status
@@ -0,0 +1,77 @@
+from collections import deque
+from typing import Optional
+import threading
+
+class LatencyTracker:
+    """Sliding window of recent call latencies"""
+
+    def __init__(self, window: int = 200):
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    @property
+    def sample_count(self) -> int:
+        """Number of latencies in the window"""
+        return len(self._samples)
+
+    def record(self, seconds: float) -> None:
+        """Add one observed latency"""
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """Latency below which the given percentage of recent calls finished"""
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        index = min(len(samples) - 1, int(len(samples) * percentile / 100.0))
+        return samples[index]
+
+class HedgePolicy:
+    """Decides when to send a duplicate of a slow call, within a budget of extra calls
+
+    A call still running after the given percentile of recent latencies gets
+    one hedge. Hedges are limited to max_extra_ratio of primary calls so the
+    extra cost stays bounded even when latency degrades across the board.
+    """
+
+    def __init__(self, percentile: float = 95.0, max_extra_ratio: float = 0.05,
+                 min_samples: int = 20, min_delay: float = 0.05):
+        self.percentile = percentile
+        self.max_extra_ratio = max_extra_ratio
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self._primary_calls = 0
+        self._hedged_calls = 0
+        self._lock = threading.Lock()
+
+    @property
+    def hedged_calls(self) -> int:
+        """Number of duplicate calls sent"""
+        return self._hedged_calls
+
+    @property
+    def primary_calls(self) -> int:
+        """Number of calls that were eligible for hedging"""
+        return self._primary_calls
+
+    def hedge_delay(self, latency: LatencyTracker) -> Optional[float]:
+        """Seconds to wait before hedging, or None until enough latencies are known"""
+        if latency.sample_count < self.min_samples:
+            return None
+        delay = latency.percentile(self.percentile)
+        return max(delay, self.min_delay) if delay is not None else None
+
+    def record_primary(self) -> None:
+        """Count a call that could be hedged"""
+        with self._lock:
+            self._primary_calls += 1
+
+    def try_hedge(self) -> bool:
+        """Reserve budget for one duplicate call"""
+        with self._lock:
+            if self._hedged_calls + 1 > self._primary_calls * self.max_extra_ratio:
+                return False
+            self._hedged_calls += 1
+            return True
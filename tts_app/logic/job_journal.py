@@ -0,0 +1,279 @@
+from collections import deque
+from typing import Dict, List, Optional, Set, Tuple
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+
+from tts_app.models.tts_config import TTSRequest, VoiceConfig, AudioConfig
+from tts_app.models.job_config import JobStatus
+from tts_app.logic.file_lock import FileLock
+
+# Job states after which a job is never resumed
+TERMINAL_STATUSES = {status.value for status in JobStatus if status.is_finished}
+
+# Most recent chunk timings kept through compaction, for latency estimates
+MAX_TIMING_SAMPLES = 500
+
+# Terminal states whose completed chunks are kept so a retry only pays for what is missing
+RETRYABLE_STATUSES = {JobStatus.FAILED.value, JobStatus.EXPIRED.value}
+
+def fingerprint_chunk(chunk: str, is_ssml: bool, voice_config: VoiceConfig,
+                      audio_config: AudioConfig) -> str:
+    """Fingerprint of everything that determines a chunk's synthesized audio"""
+    payload = json.dumps({
+        'input': chunk,
+        'ssml': is_ssml,
+        'voice': voice_config.to_dict(),
+        'audio': audio_config.to_dict()
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def fingerprint_request(request: TTSRequest) -> str:
+    """Fingerprint of a whole request, including where its output goes"""
+    payload = json.dumps(request.to_dict(), sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class JobJournal:
+    """Append-only, crash-safe journal of jobs and their completed chunks
+
+    Every state change is appended as one JSON line and fsynced, so after a
+    crash the journal can be replayed to find unfinished jobs. Completed chunk
+    audio is kept in a per-job parts directory until the job's output has been
+    committed, letting a resumed job skip every chunk it already paid for.
+    Appends take a lock file, so worker processes can share one journal.
+    """
+
+    def __init__(self, journal_path: str, parts_dir: Optional[str] = None, fsync: bool = True):
+        self.journal_path = journal_path
+        self.parts_dir = parts_dir or os.path.join(os.path.dirname(os.path.abspath(journal_path)), "journal_parts")
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        self._file_lock = FileLock(f"{journal_path}.lock")
+        self._jobs: Dict[str, dict] = {}                  # job_id -> latest job record
+        self._chunks: Dict[str, Dict[str, dict]] = {}     # job_id -> fingerprint -> chunk record
+        self._timings = deque(maxlen=MAX_TIMING_SAMPLES)  # (characters, seconds) of recent chunks
+        self._discarded: Set[str] = set()                 # jobs whose parts were deleted in this process
+        self._load()
+
+    def record_job(self, job_id: str, request: TTSRequest, status: JobStatus, **extra) -> None:
+        """Record a job with its full request so it can be recreated after a crash"""
+        record = {
+            'type': 'job',
+            'job_id': job_id,
+            'fingerprint': fingerprint_request(request),
+            'status': status.value,
+            'output_path': request.output_path,
+            'request': request.to_dict()
+        }
+        record.update(extra)
+        self._append(record)
+        self._reopen(job_id, status)
+
+    def record_status(self, job_id: str, status: JobStatus, error_message: Optional[str] = None) -> None:
+        """Record a job status change"""
+        record = {'type': 'status', 'job_id': job_id, 'status': status.value}
+        if error_message:
+            record['error_message'] = error_message
+        self._append(record)
+        self._reopen(job_id, status)
+
+        if status.is_finished and status.value not in RETRYABLE_STATUSES:
+            self.discard_parts(job_id)
+
+    def store_chunk(self, job_id: str, fingerprint: str, index: int, audio_content: bytes,
+                    characters: int = 0, seconds: float = 0.0) -> Optional[str]:
+        """Persist a completed chunk's audio and record it
+
+        Returns None without keeping anything when the job's parts were
+        discarded meanwhile, as happens when a job is cancelled while its
+        worker is still finishing a chunk.
+        """
+        directory = os.path.join(self.parts_dir, job_id)
+        os.makedirs(directory, exist_ok=True)
+        part_path = os.path.join(directory, f"{index:05d}-{fingerprint[:16]}.part")
+
+        temp_path = f"{part_path}.tmp"
+        with open(temp_path, "wb") as out:
+            out.write(audio_content)
+            if self.fsync:
+                out.flush()
+                os.fsync(out.fileno())
+        os.replace(temp_path, part_path)
+
+        # Checked after the write: discard_parts marks the job before deleting, so a part is never left behind
+        with self._lock:
+            discarded = job_id in self._discarded
+        if discarded:
+            try:
+                os.remove(part_path)
+                os.rmdir(directory)
+            except OSError:
+                pass
+            return None
+
+        self._append({
+            'type': 'chunk',
+            'job_id': job_id,
+            'fingerprint': fingerprint,
+            'index': index,
+            'status': JobStatus.COMPLETED.value,
+            'output': part_path,
+            'characters': characters,
+            'seconds': round(seconds, 4),
+            'bytes': len(audio_content)
+        })
+        return part_path
+
+    def load_chunk(self, job_id: str, fingerprint: str) -> Optional[bytes]:
+        """Get the audio of a chunk completed before a restart, if it is still on disk"""
+        with self._lock:
+            record = self._chunks.get(job_id, {}).get(fingerprint)
+        if record is None or not os.path.exists(record['output']):
+            return None
+        with open(record['output'], "rb") as part:
+            return part.read()
+
+    def has_chunk(self, job_id: str, fingerprint: str) -> bool:
+        """Check if a chunk completed before a restart is still on disk"""
+        with self._lock:
+            record = self._chunks.get(job_id, {}).get(fingerprint)
+        return record is not None and os.path.exists(record['output'])
+
+    def discard_parts(self, job_id: str) -> None:
+        """Delete the stored chunk audio of a job, and any its worker stores later"""
+        with self._lock:
+            self._discarded.add(job_id)
+            self._chunks.pop(job_id, None)
+        shutil.rmtree(os.path.join(self.parts_dir, job_id), ignore_errors=True)
+
+    def get_job(self, job_id: str) -> Optional[dict]:
+        """Get the latest record of a job"""
+        with self._lock:
+            record = self._jobs.get(job_id)
+            return dict(record) if record else None
+
+    def is_completed(self, job_id: str) -> bool:
+        """Check if a job completed and its output still exists"""
+        record = self.get_job(job_id)
+        return bool(record and record['status'] == JobStatus.COMPLETED.value
+                    and os.path.exists(record['output_path']))
+
+    def pending_jobs(self) -> List[dict]:
+        """Jobs that were queued or running when the journal was last written"""
+        with self._lock:
+            return [dict(record) for record in self._jobs.values()
+                    if record['status'] not in TERMINAL_STATUSES]
+
+    def chunk_records(self) -> List[dict]:
+        """All completed chunk records still in the journal"""
+        with self._lock:
+            return [dict(record) for chunks in self._chunks.values() for record in chunks.values()]
+
+    def latency_samples(self) -> List[Tuple[int, float]]:
+        """(characters, seconds) of the most recently synthesized chunks, including finished jobs'"""
+        with self._lock:
+            return list(self._timings)
+
+    def compact(self, keep_completed: bool = True) -> None:
+        """Rewrite the journal without the history of finished jobs
+
+        Completed jobs are kept as a one-line summary by default, so a rerun of
+        the same batch can still skip them. Failed jobs are kept with their
+        chunks while any of those are still on disk. Recent chunk timings are
+        kept as one line each.
+        """
+        with self._lock, self._file_lock:
+            # Other processes may have appended since this one loaded
+            self._jobs, self._chunks = {}, {}
+            self._timings.clear()
+            self._load()
+
+            jobs = {}
+            for job_id, job in self._jobs.items():
+                if job['status'] not in TERMINAL_STATUSES:
+                    jobs[job_id] = job
+                elif job['status'] in RETRYABLE_STATUSES and self._chunks.get(job_id):
+                    jobs[job_id] = job
+                elif keep_completed and job['status'] == JobStatus.COMPLETED.value:
+                    jobs[job_id] = {key: job[key] for key in
+                                    ('type', 'job_id', 'fingerprint', 'status', 'output_path', 'ts')
+                                    if key in job}
+            chunks = {job_id: {fingerprint: record for fingerprint, record in chunks.items()
+                               if os.path.exists(record['output'])}
+                      for job_id, chunks in self._chunks.items()
+                      if job_id in jobs and jobs[job_id]['status'] != JobStatus.COMPLETED.value}
+
+            temp_path = f"{self.journal_path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as out:
+                for characters, seconds in self._timings:
+                    out.write(json.dumps({'type': 'timing', 'characters': characters, 'seconds': seconds}) + "\n")
+                for job_id, job in jobs.items():
+                    out.write(json.dumps(job) + "\n")
+                    for record in chunks.get(job_id, {}).values():
+                        out.write(json.dumps(record) + "\n")
+                out.flush()
+                os.fsync(out.fileno())
+            os.replace(temp_path, self.journal_path)
+
+            self._jobs = jobs
+            self._chunks = chunks
+
+    def reload(self) -> None:
+        """Replay the journal again to pick up records appended by other processes"""
+        with self._lock, self._file_lock:
+            self._jobs, self._chunks = {}, {}
+            self._timings.clear()
+            self._load()
+
+    def _reopen(self, job_id: str, status: JobStatus) -> None:
+        """Keep the chunks of a job that runs again after its parts were discarded"""
+        if not status.is_finished:
+            with self._lock:
+                self._discarded.discard(job_id)
+
+    def _append(self, record: dict) -> None:
+        """Append one record to the journal and apply it to the in-memory state"""
+        record.setdefault('ts', time.time())
+        line = json.dumps(record) + "\n"
+
+        with self._lock, self._file_lock:
+            with open(self.journal_path, "a", encoding="utf-8") as journal:
+                journal.write(line)
+                if self.fsync:
+                    journal.flush()
+                    os.fsync(journal.fileno())
+            self._apply(record)
+
+    def _apply(self, record: dict) -> None:
+        """Fold a record into the in-memory state"""
+        record_type = record.get('type')
+        job_id = record.get('job_id')
+
+        if record_type == 'job':
+            self._jobs[job_id] = dict(record)
+        elif record_type == 'status' and job_id in self._jobs:
+            self._jobs[job_id]['status'] = record['status']
+            self._jobs[job_id]['error_message'] = record.get('error_message')
+        elif record_type == 'chunk':
+            self._chunks.setdefault(job_id, {})[record['fingerprint']] = record
+
+        if record_type in ('chunk', 'timing') and record.get('characters') and record.get('seconds'):
+            self._timings.append((record['characters'], record['seconds']))
+
+    def _load(self) -> None:
+        """Replay the journal, ignoring a line torn by a crash mid-write"""
+        if not os.path.exists(self.journal_path):
+            return
+
+        with open(self.journal_path, "r", encoding="utf-8") as journal:
+            for line in journal:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    self._apply(json.loads(line))
+                except (json.JSONDecodeError, KeyError):
+                    continue
@@ -0,0 +1,290 @@
+from PyQt5.QtCore import QObject, pyqtSignal
+from typing import Dict, List, Optional
+import heapq
+import itertools
+import time
+import uuid
+
+from tts_app.models.job_config import TTSJob, JobStatus, JobPriority, ProgressSnapshot
+from tts_app.models.tts_config import TTSRequest
+from tts_app.models.health_config import HealthState
+from tts_app.logic.tts_service_manager import TTSServiceManager
+from tts_app.logic.tts_engine import TTSEngine
+from tts_app.logic.tts_worker import TTSWorker
+from tts_app.logic.cancellation import CancellationToken
+
+class JobScheduler(QObject):
+    """Logic manager that queues TTS jobs and runs them on a bounded set of workers"""
+
+    # Signals
+    job_added = pyqtSignal(str)     # job_id
+    job_updated = pyqtSignal(str)   # job_id
+    job_finished = pyqtSignal(str)  # job_id, emitted once the job reaches a terminal state
+    job_audio_ready = pyqtSignal(str, bytes, str)            # job_id, audio_content, audio_format
+    job_chunk_ready = pyqtSignal(str, int, int, bytes, str)  # job_id, index, total, audio_content, audio_format
+
+    def __init__(self, engine: TTSEngine, max_parallel_jobs: int = 2, parent=None):
+        super().__init__(parent)
+        self._engine = engine
+        self._service = engine.service
+        self._journal = engine.journal
+        self._online = True
+        self._max_parallel_jobs = max(1, max_parallel_jobs)
+        self._jobs: Dict[str, TTSJob] = {}
+        self._queue: List[tuple] = []  # heap of (-priority, sequence, job_id)
+        self._sequence = itertools.count()
+        self._workers: Dict[str, TTSWorker] = {}
+        self._running: set = set()
+
+    @property
+    def engine(self) -> TTSEngine:
+        """Engine the jobs are synthesized with"""
+        return self._engine
+
+    @property
+    def tts_service(self) -> TTSServiceManager:
+        """Service the jobs are synthesized with"""
+        return self._service
+
+    @property
+    def is_online(self) -> bool:
+        """Whether jobs that need the network may start"""
+        return self._online
+
+    def set_online(self, online: bool) -> None:
+        """Hold jobs that need new synthesis while offline, and release them when back online"""
+        if online == self._online:
+            return
+        self._online = online
+        if online:
+            for job in self._jobs.values():
+                if job.status == JobStatus.WAITING:
+                    self._requeue(job)
+        self._dispatch()
+
+    @property
+    def max_parallel_jobs(self) -> int:
+        """Maximum number of jobs running at once"""
+        return self._max_parallel_jobs
+
+    def set_max_parallel_jobs(self, max_parallel_jobs: int) -> None:
+        """Change the parallelism; extra capacity is used immediately"""
+        self._max_parallel_jobs = max(1, max_parallel_jobs)
+        self._dispatch()
+
+    def submit(self, request: TTSRequest, priority: JobPriority = JobPriority.NORMAL,
+               deadline_seconds: Optional[float] = None, job_id: Optional[str] = None) -> str:
+        """Queue a TTS request and return its job id"""
+        job = TTSJob(job_id=job_id or uuid.uuid4().hex[:8], request=request, priority=priority,
+                     deadline_seconds=deadline_seconds or None)
+        self._jobs[job.job_id] = job
+        if self._journal is not None:
+            self._journal.record_job(job.job_id, request, JobStatus.QUEUED,
+                                     priority=int(priority), deadline_seconds=job.deadline_seconds)
+        self._push(job)
+        self.job_added.emit(job.job_id)
+        self._dispatch()
+        return job.job_id
+
+    def resume_from_journal(self) -> List[str]:
+        """Requeue jobs the journal shows were unfinished when the app last stopped
+
+        Resumed jobs keep their id, so chunks they completed before the restart
+        are loaded from the journal instead of being synthesized again.
+        """
+        if self._journal is None:
+            return []
+
+        resumed = []
+        for record in self._journal.pending_jobs():
+            job_id = record['job_id']
+            if job_id in self._jobs:
+                continue
+            try:
+                request = TTSRequest.from_dict(record['request'])
+                priority = JobPriority(record.get('priority', JobPriority.NORMAL))
+            except (KeyError, TypeError, ValueError) as e:
+                self._journal.record_status(job_id, JobStatus.FAILED, f"Could not resume job: {e}")
+                continue
+            resumed.append(self.submit(request, priority, record.get('deadline_seconds'), job_id=job_id))
+        return resumed
+
+    def set_priority(self, job_id: str, priority: JobPriority) -> bool:
+        """Change the priority of a job that has not started yet"""
+        job = self._jobs.get(job_id)
+        if job is None or job.status not in (JobStatus.QUEUED, JobStatus.WAITING):
+            return False
+
+        job.priority = priority
+        # The old heap entry becomes stale and is skipped when popped
+        self._push(job)
+        self.job_updated.emit(job_id)
+        return True
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a queued or running job, freeing its slot immediately"""
+        job = self._jobs.get(job_id)
+        if job is None or job.status.is_finished:
+            return False
+
+        worker = self._workers.get(job_id)
+        if worker is not None:
+            # Aborts the in-flight RPC; the worker's late signals are ignored
+            worker.cancel()
+
+        self._finish(job, JobStatus.CANCELLED, "Cancelled by user")
+        self._dispatch()
+        return True
+
+    def cancel_all(self) -> None:
+        """Cancel every queued and running job"""
+        for job in self.active_jobs:
+            self.cancel(job.job_id)
+
+    def shutdown(self, timeout_ms: int = 3000, resumable: bool = False) -> None:
+        """Cancel all jobs and wait for worker threads to exit
+
+        With resumable, the cancellations are not journaled so the unfinished
+        jobs are picked up again by resume_from_journal on the next start.
+        """
+        if resumable:
+            self._journal = None
+        self.cancel_all()
+        for worker in list(self._workers.values()):
+            worker.wait(timeout_ms)
+
+    def get_job(self, job_id: str) -> Optional[TTSJob]:
+        """Get a job by id"""
+        return self._jobs.get(job_id)
+
+    def get_jobs(self) -> List[TTSJob]:
+        """Get all known jobs in submission order"""
+        return list(self._jobs.values())
+
+    @property
+    def active_jobs(self) -> List[TTSJob]:
+        """Jobs that are queued or running"""
+        return [job for job in self._jobs.values() if not job.status.is_finished]
+
+    @property
+    def running_count(self) -> int:
+        """Number of jobs currently running"""
+        return len(self._running)
+
+    def clear_finished(self) -> List[str]:
+        """Forget jobs in a terminal state, returning their ids"""
+        finished = [job_id for job_id, job in self._jobs.items() if job.status.is_finished]
+        for job_id in finished:
+            del self._jobs[job_id]
+        return finished
+
+    def _push(self, job: TTSJob) -> None:
+        """Add a job to the priority queue"""
+        heapq.heappush(self._queue, (-int(job.priority), next(self._sequence), job.job_id, job.priority))
+
+    def _dispatch(self) -> None:
+        """Start queued jobs while there is free capacity"""
+        while self._queue and len(self._running) < self._max_parallel_jobs:
+            _, _, job_id, priority = heapq.heappop(self._queue)
+            job = self._jobs.get(job_id)
+            if job is None or job.status != JobStatus.QUEUED or job.priority != priority:
+                continue
+            if not self._online and not self._can_run_offline(job):
+                # Popped from the queue; set_online pushes it back
+                job.status = JobStatus.WAITING
+                self.job_updated.emit(job_id)
+                continue
+            self._start_job(job)
+
+    def _can_run_offline(self, job: TTSJob) -> bool:
+        """Check if a job can be served entirely from local audio"""
+        return self._engine.is_cached(job.request)
+
+    def _requeue(self, job: TTSJob) -> None:
+        """Put a job back in the queue"""
+        job.status = JobStatus.QUEUED
+        job.progress = 0
+        job.error_message = None
+        self._push(job)
+        self.job_updated.emit(job.job_id)
+
+    def _start_job(self, job: TTSJob) -> None:
+        """Run a job on its own worker thread"""
+        job.status = JobStatus.RUNNING
+        job.started_at = time.time()
+        self._running.add(job.job_id)
+        if self._journal is not None:
+            self._journal.record_status(job.job_id, JobStatus.RUNNING)
+
+        job_id = job.job_id
+        cancel_token = CancellationToken(job.deadline_seconds)
+        worker = TTSWorker(job.request, self._engine, cancel_token, job_id)
+        worker.progress_detail.connect(lambda snapshot: self._on_progress(job_id, snapshot))
+        worker.conversion_finished.connect(lambda _: self._on_finished(job_id, None))
+        worker.conversion_failed.connect(lambda error: self._on_finished(job_id, error))
+        worker.conversion_cancelled.connect(
+            lambda reason: self._on_cancelled(job_id, cancel_token.is_expired, reason))
+        worker.audio_ready.connect(
+            lambda audio, audio_format: self.job_audio_ready.emit(job_id, audio, audio_format))
+        worker.chunk_ready.connect(
+            lambda index, total, audio, audio_format: self.job_chunk_ready.emit(job_id, index, total, audio, audio_format))
+        # Drop the worker only once its thread has fully exited
+        worker.finished.connect(lambda: self._release_worker(job_id))
+        self._workers[job_id] = worker
+
+        self.job_updated.emit(job_id)
+        worker.start()
+
+    def _on_progress(self, job_id: str, snapshot: ProgressSnapshot) -> None:
+        """Record worker progress for a job"""
+        job = self._jobs.get(job_id)
+        if job is None or job.status != JobStatus.RUNNING:
+            return
+        job.progress = snapshot.percent
+        job.progress_detail = snapshot
+        self.job_updated.emit(job_id)
+
+    def _on_finished(self, job_id: str, error_message: Optional[str]) -> None:
+        """Mark a job as done and start the next queued job"""
+        job = self._jobs.get(job_id)
+        if job is not None and job.status == JobStatus.RUNNING:
+            if error_message is None:
+                job.progress = 100
+                self._finish(job, JobStatus.COMPLETED)
+            elif self._service.health_monitor.status.state == HealthState.OFFLINE:
+                # Lost the connection mid-job; its finished chunks stay journaled
+                self._running.discard(job_id)
+                job.status = JobStatus.WAITING
+                job.error_message = error_message
+                self.job_updated.emit(job_id)
+            else:
+                self._finish(job, JobStatus.FAILED, error_message)
+
+        self._dispatch()
+
+    def _on_cancelled(self, job_id: str, expired: bool, reason: str) -> None:
+        """Record a job that stopped because it was cancelled or ran out of time"""
+        job = self._jobs.get(job_id)
+        if job is not None and job.status == JobStatus.RUNNING:
+            self._finish(job, JobStatus.EXPIRED if expired else JobStatus.CANCELLED, reason)
+
+        self._dispatch()
+
+    def _finish(self, job: TTSJob, status: JobStatus, error_message: Optional[str] = None) -> None:
+        """Move a job to a terminal state and release its concurrency slot"""
+        self._running.discard(job.job_id)
+        job.status = status
+        job.error_message = error_message
+        job.finished_at = time.time()
+        if self._journal is not None:
+            self._journal.record_status(job.job_id, status, error_message)
+            # Job ids are not reused here, so nothing would ever retry from these parts
+            self._journal.discard_parts(job.job_id)
+        self.job_updated.emit(job.job_id)
+        self.job_finished.emit(job.job_id)
+
+    def _release_worker(self, job_id: str) -> None:
+        """Dispose of a worker whose thread has exited"""
+        worker = self._workers.pop(job_id, None)
+        if worker is not None:
+            worker.deleteLater()
@@ -0,0 +1,301 @@
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional, Tuple
+import json
+import math
+import os
+import threading
+import time
+
+# Upper bounds, in seconds, of the timing histogram buckets
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Metric names and what they measure, as exported
+METRIC_HELP = {
+    'tts_stage_seconds': "Time spent in each stage of a synthesis",
+    'tts_cache_hits_total': "Chunks served without an RPC, by source",
+    'tts_retries_total': "RPC attempts beyond the first, by kind",
+    'tts_rpc_errors_total': "Failed synthesize RPCs",
+    'tts_rpcs_cancelled_total': "Synthesize RPCs cancelled by their caller or by a hedge that finished first",
+    'tts_rpcs_total': "Synthesize RPCs issued",
+    'tts_characters_total': "Characters sent for synthesis",
+    'tts_audio_bytes_total': "Audio bytes written to outputs",
+    'tts_requests_total': "Synthesis requests run, by outcome",
+    'tts_concurrency_limit': "Current adaptive concurrency limit",
+    'tts_rpcs_in_flight': "Synthesize RPCs currently in flight",
+    'tts_coalesced_calls': "Duplicate synthesize calls that shared an identical request's result"
+}
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+class Histogram:
+    """Distribution of observed values in cumulative buckets, as in Prometheus"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)  # the last bucket is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Record one value"""
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                break
+        else:
+            index = len(self.buckets)
+        self._counts[index] += 1
+        self.sum += value
+        self.count += 1
+
+    def copy(self) -> 'Histogram':
+        """Independent copy of the values recorded so far"""
+        histogram = Histogram(self.buckets)
+        histogram._counts = list(self._counts)
+        histogram.sum = self.sum
+        histogram.count = self.count
+        return histogram
+
+    def since(self, earlier: 'Histogram') -> 'Histogram':
+        """Values observed after earlier, a copy of this histogram taken before"""
+        histogram = Histogram(self.buckets)
+        histogram._counts = [max(0, now - then) for now, then in zip(self._counts, earlier._counts)]
+        histogram.sum = max(0.0, self.sum - earlier.sum)
+        histogram.count = sum(histogram._counts)
+        return histogram
+
+    def cumulative_counts(self) -> list:
+        """Number of values at or below each bucket bound, then the total"""
+        counts, running = [], 0
+        for count in self._counts:
+            running += count
+            counts.append(running)
+        return counts
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Estimate a percentile by interpolating within its bucket; None when empty"""
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        lower, previous = 0.0, 0
+        for bound, cumulative in zip(self.buckets, self.cumulative_counts()):
+            if cumulative >= rank:
+                share = (rank - previous) / (cumulative - previous) if cumulative > previous else 1.0
+                return lower + (bound - lower) * share
+            lower, previous = bound, cumulative
+        # Beyond the last bound nothing is known but that it is larger
+        return self.buckets[-1]
+
+    def snapshot(self) -> dict:
+        """Counts, sum and common percentiles, for JSON export"""
+        return {
+            'count': self.count,
+            'sum': round(self.sum, 6),
+            'mean': round(self.sum / self.count, 6) if self.count else None,
+            'p50': self.percentile(0.5),
+            'p95': self.percentile(0.95),
+            'p99': self.percentile(0.99),
+            'buckets': {str(bound): count for bound, count in zip(self.buckets, self.cumulative_counts())}
+        }
+
+class MetricsRegistry:
+    """Histograms, counters and gauges shared by everything that synthesizes in a process
+
+    Exported as a JSON snapshot or in the Prometheus text format, so timings
+    can be inspected by hand or scraped by monitoring.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, Dict[LabelKey, Histogram]] = {}
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._gauges: Dict[str, Dict[LabelKey, float]] = {}
+        self._gauge_functions: Dict[str, Callable[[], float]] = {}
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        """Record a value in a histogram"""
+        key = self._label_key(labels)
+        with self._lock:
+            family = self._histograms.setdefault(name, {})
+            if key not in family:
+                family[key] = Histogram()
+            family[key].observe(value)
+
+    @contextmanager
+    def timer(self, stage: str) -> Iterator[None]:
+        """Time the enclosed block as a stage of synthesis, whether or not it raises"""
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.observe('tts_stage_seconds', time.monotonic() - started, stage=stage)
+
+    def inc(self, name: str, amount: float = 1, **labels) -> None:
+        """Add to a counter"""
+        key = self._label_key(labels)
+        with self._lock:
+            family = self._counters.setdefault(name, {})
+            family[key] = family.get(key, 0) + amount
+
+    def set_gauge(self, name: str, value: float, **labels) -> None:
+        """Set a gauge to a value"""
+        with self._lock:
+            self._gauges.setdefault(name, {})[self._label_key(labels)] = value
+
+    def register_gauge(self, name: str, function: Callable[[], float]) -> None:
+        """Read a gauge from a function whenever metrics are exported"""
+        with self._lock:
+            self._gauge_functions[name] = function
+
+    def histogram(self, name: str, **labels) -> Optional[Histogram]:
+        """Copy of a histogram recorded so far, if any values were observed"""
+        with self._lock:
+            histogram = self._histograms.get(name, {}).get(self._label_key(labels))
+            return histogram.copy() if histogram else None
+
+    def counter(self, name: str, **labels) -> float:
+        """Current value of a counter"""
+        with self._lock:
+            return self._counters.get(name, {}).get(self._label_key(labels), 0)
+
+    def counter_total(self, name: str) -> float:
+        """Current value of a counter summed over all its labels"""
+        with self._lock:
+            return sum(self._counters.get(name, {}).values())
+
+    def gauge(self, name: str) -> Optional[float]:
+        """Current value of an unlabeled gauge, set or registered"""
+        return self._read_gauges().get(name, {}).get(())
+
+    def take_state(self) -> dict:
+        """Hand over everything recorded so far and start again, for merging into another registry"""
+        with self._lock:
+            state = {
+                'histograms': {name: {key: (histogram.buckets, list(histogram._counts), histogram.sum)
+                                      for key, histogram in family.items()}
+                               for name, family in self._histograms.items()},
+                'counters': {name: dict(family) for name, family in self._counters.items()}
+            }
+            self._histograms.clear()
+            self._counters.clear()
+            return state
+
+    def merge_state(self, state: dict) -> None:
+        """Add recordings taken from another registry, e.g. a worker process's"""
+        with self._lock:
+            for name, family in state.get('histograms', {}).items():
+                for key, (buckets, counts, total) in family.items():
+                    histogram = self._histograms.setdefault(name, {}).setdefault(key, Histogram(buckets))
+                    if histogram.buckets != tuple(buckets):
+                        continue
+                    histogram._counts = [mine + theirs for mine, theirs in zip(histogram._counts, counts)]
+                    histogram.sum += total
+                    histogram.count += sum(counts)
+            for name, family in state.get('counters', {}).items():
+                counters = self._counters.setdefault(name, {})
+                for key, value in family.items():
+                    counters[key] = counters.get(key, 0) + value
+
+    def reset(self) -> None:
+        """Forget everything recorded; registered gauge functions stay"""
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+            self._gauges.clear()
+
+    def snapshot(self) -> dict:
+        """All metrics as a JSON-serializable dictionary"""
+        gauges = self._read_gauges()
+        with self._lock:
+            return {
+                'timestamp': time.time(),
+                'histograms': {name: [dict(labels=dict(key), **histogram.snapshot())
+                                      for key, histogram in family.items()]
+                               for name, family in self._histograms.items()},
+                'counters': {name: [{'labels': dict(key), 'value': value} for key, value in family.items()]
+                             for name, family in self._counters.items()},
+                'gauges': {name: [{'labels': dict(key), 'value': value} for key, value in family.items()]
+                           for name, family in gauges.items()}
+            }
+
+    def to_prometheus(self) -> str:
+        """All metrics in the Prometheus text exposition format"""
+        gauges = self._read_gauges()
+        lines = []
+        with self._lock:
+            for name, family in sorted(self._histograms.items()):
+                self._write_header(lines, name, "histogram")
+                for key, histogram in family.items():
+                    for bound, count in zip(histogram.buckets, histogram.cumulative_counts()):
+                        lines.append(f"{name}_bucket{self._format_labels(key, le=_format_value(bound))} {count}")
+                    lines.append(f"{name}_bucket{self._format_labels(key, le='+Inf')} {histogram.count}")
+                    lines.append(f"{name}_sum{self._format_labels(key)} {_format_value(histogram.sum)}")
+                    lines.append(f"{name}_count{self._format_labels(key)} {histogram.count}")
+            for name, family in sorted(self._counters.items()):
+                self._write_header(lines, name, "counter")
+                for key, value in family.items():
+                    lines.append(f"{name}{self._format_labels(key)} {_format_value(value)}")
+        for name, family in sorted(gauges.items()):
+            self._write_header(lines, name, "gauge")
+            for key, value in family.items():
+                lines.append(f"{name}{self._format_labels(key)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str) -> None:
+        """Write metrics atomically: JSON for a .json path, Prometheus text otherwise
+
+        Prometheus text files suit node_exporter's textfile collector.
+        """
+        if path.lower().endswith(".json"):
+            content = json.dumps(self.snapshot(), indent=2)
+        else:
+            content = self.to_prometheus()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as out:
+            out.write(content)
+        os.replace(temp_path, path)
+
+    def _read_gauges(self) -> Dict[str, Dict[LabelKey, float]]:
+        """Set gauges merged with the current values of registered gauge functions"""
+        with self._lock:
+            gauges = {name: dict(family) for name, family in self._gauges.items()}
+            functions = dict(self._gauge_functions)
+        for name, function in functions.items():
+            try:
+                gauges.setdefault(name, {})[()] = float(function())
+            except Exception:
+                continue
+        return gauges
+
+    @staticmethod
+    def _label_key(labels: dict) -> LabelKey:
+        """Hashable, ordered form of a label set"""
+        return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+    @staticmethod
+    def _format_labels(key: LabelKey, **extra) -> str:
+        """Prometheus label set, e.g. {stage="rpc",le="0.5"}"""
+        pairs = list(key) + list(extra.items())
+        if not pairs:
+            return ""
+        escaped = (value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, value in pairs)
+        return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + "}"
+
+    @staticmethod
+    def _write_header(lines: list, name: str, metric_type: str) -> None:
+        """HELP and TYPE lines of a metric family"""
+        if name in METRIC_HELP:
+            lines.append(f"# HELP {name} {METRIC_HELP[name]}")
+        lines.append(f"# TYPE {name} {metric_type}")
+
+def _format_value(value: float) -> str:
+    """Number in the Prometheus text format"""
+    if isinstance(value, float):
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        if value.is_integer():
+            return str(int(value)) if abs(value) < 1e15 else repr(value)
+        return repr(value)
+    return str(value)
@@ -0,0 +1,120 @@
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Optional, Tuple
+import time
+
+from tts_app.logic.tts_engine import TTSEngine
+from tts_app.logic.metrics import Histogram
+
+# Counters whose rates are shown over the window
+WINDOW_COUNTERS = ('tts_rpcs_total', 'tts_characters_total', 'tts_cache_hits_total',
+                   'tts_rpc_errors_total', 'tts_retries_total')
+
+@dataclass
+class PerformanceSnapshot:
+    """What the engine is doing now, with rates over the last window_seconds"""
+    window_seconds: float = 0.0
+    latency_p50: Optional[float] = None   # RPC seconds, None when no RPC finished in the window
+    latency_p95: Optional[float] = None
+    latency_p99: Optional[float] = None
+    rpcs_per_minute: float = 0.0
+    characters_per_minute: float = 0.0
+    errors_per_minute: float = 0.0
+    retries_per_minute: float = 0.0
+    quota_per_minute: Optional[float] = None  # total rate limit of the credential pool
+    cache_hit_rate: Optional[float] = None    # share of chunks served without an RPC
+    cache_size_bytes: Optional[int] = None
+    cache_max_bytes: Optional[int] = None
+    rpcs_in_flight: int = 0
+    concurrency_limit: int = 0
+    catalog_age_seconds: Optional[float] = None
+
+    @property
+    def quota_utilization(self) -> Optional[float]:
+        """Share of the request quota in use, None when unlimited"""
+        if not self.quota_per_minute:
+            return None
+        return self.rpcs_per_minute / self.quota_per_minute
+
+class PerformanceMonitor:
+    """Turns the engine's cumulative metrics into live rates and percentiles
+
+    Keeps the samples taken over the last window, so latency percentiles,
+    request rates and the cache hit rate describe the recent past rather
+    than the whole session, and saturation shows while it happens. Sampling
+    only reads counters, so it is cheap enough for a UI timer.
+    """
+
+    def __init__(self, engine: TTSEngine, window: float = 60.0):
+        self._engine = engine
+        self.window = window
+        self._samples: Deque[Tuple[float, Optional[Histogram], Dict[str, float]]] = deque()
+        self._samples.append(self._read())
+
+    def sample(self) -> PerformanceSnapshot:
+        """Take a sample and describe the window ending now"""
+        now_sample = self._read()
+        self._samples.append(now_sample)
+        # Keep one sample at or before the start of the window as its baseline
+        while len(self._samples) > 2 and now_sample[0] - self._samples[1][0] >= self.window:
+            self._samples.popleft()
+
+        now, latency, counters = now_sample
+        started, earlier_latency, earlier_counters = self._samples[0]
+        elapsed = now - started
+        per_minute = 60.0 / elapsed if elapsed > 0 else 0.0
+
+        def rate(name: str) -> float:
+            # Counters only go back when the metrics were reset
+            return max(0.0, counters[name] - earlier_counters[name]) * per_minute
+
+        snapshot = PerformanceSnapshot(
+            window_seconds=elapsed,
+            rpcs_per_minute=rate('tts_rpcs_total'),
+            characters_per_minute=rate('tts_characters_total'),
+            errors_per_minute=rate('tts_rpc_errors_total'),
+            retries_per_minute=rate('tts_retries_total')
+        )
+
+        if latency is not None:
+            recent = latency.since(earlier_latency) if earlier_latency is not None else latency
+            snapshot.latency_p50 = recent.percentile(0.5)
+            snapshot.latency_p95 = recent.percentile(0.95)
+            snapshot.latency_p99 = recent.percentile(0.99)
+
+        hits = rate('tts_cache_hits_total')
+        if hits + snapshot.rpcs_per_minute > 0:
+            snapshot.cache_hit_rate = hits / (hits + snapshot.rpcs_per_minute)
+
+        self._describe_capacity(snapshot)
+        return snapshot
+
+    def reset(self) -> None:
+        """Start the window again from now"""
+        self._samples.clear()
+        self._samples.append(self._read())
+
+    def _read(self) -> Tuple[float, Optional[Histogram], Dict[str, float]]:
+        """Current RPC latency histogram and counter values"""
+        metrics = self._engine.metrics
+        return (
+            time.monotonic(),
+            metrics.histogram('tts_stage_seconds', stage="rpc"),
+            {name: metrics.counter_total(name) for name in WINDOW_COUNTERS}
+        )
+
+    def _describe_capacity(self, snapshot: PerformanceSnapshot) -> None:
+        """Fill in the quota, concurrency, cache and catalog state, which are not rates"""
+        metrics = self._engine.metrics
+        snapshot.rpcs_in_flight = int(metrics.gauge('tts_rpcs_in_flight') or 0)
+        snapshot.concurrency_limit = int(metrics.gauge('tts_concurrency_limit') or 0)
+
+        pool = self._engine.service.credential_pool
+        snapshot.quota_per_minute = pool.requests_per_minute if pool else None
+
+        audio_cache = self._engine.audio_cache
+        if audio_cache is not None:
+            snapshot.cache_size_bytes = audio_cache.size_bytes()
+            snapshot.cache_max_bytes = audio_cache.max_bytes
+
+        snapshot.catalog_age_seconds = self._engine.voices.catalog_age
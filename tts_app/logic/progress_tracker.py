@@ -0,0 +1,126 @@
+from typing import Dict, List, Optional
+import threading
+import time
+
+from tts_app.models.job_config import ProgressSnapshot
+
+class ThroughputEstimator:
+    """Smoothed characters-per-second estimate of single synthesis calls, shared across jobs"""
+
+    def __init__(self, smoothing: float = 0.3):
+        self._smoothing = smoothing
+        self._chars_per_second: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def chars_per_second(self) -> Optional[float]:
+        """Current estimate, or None before the first observation"""
+        return self._chars_per_second
+
+    def record(self, characters: int, seconds: float) -> None:
+        """Fold one completed call into the estimate"""
+        if characters <= 0 or seconds <= 0:
+            return
+        observed = characters / seconds
+        with self._lock:
+            if self._chars_per_second is None:
+                self._chars_per_second = observed
+            else:
+                self._chars_per_second += self._smoothing * (observed - self._chars_per_second)
+
+class ProgressTracker:
+    """Derives job progress and ETA from completed characters, chunks and bytes written
+
+    Characters are the unit of work. While a chunk's RPC is in flight its share
+    is interpolated from the observed throughput (capped below completion), so
+    a long single call still moves the progress bar.
+    """
+
+    # Never report an in-flight chunk as more than this fraction done
+    IN_FLIGHT_CAP = 0.9
+
+    def __init__(self, chunk_sizes: List[int], estimator: Optional[ThroughputEstimator] = None,
+                 parallelism: int = 1):
+        self._chunk_sizes = chunk_sizes
+        self._total_chars = max(1, sum(chunk_sizes))
+        self._estimator = estimator or ThroughputEstimator()
+        self._parallelism = max(1, min(parallelism, len(chunk_sizes) or 1))
+        self._started_at = time.monotonic()
+        self._in_flight: Dict[int, float] = {}  # chunk index -> start time
+        self._completed_chunks = 0
+        self._completed_chars = 0
+        self._bytes_written = 0
+        self._lock = threading.Lock()
+
+    def chunk_started(self, index: int) -> None:
+        """Record that the RPC for a chunk was issued"""
+        with self._lock:
+            self._in_flight[index] = time.monotonic()
+
+    def chunk_completed(self, index: int) -> None:
+        """Record that a chunk finished synthesizing"""
+        with self._lock:
+            started = self._in_flight.pop(index, None)
+            self._completed_chunks += 1
+            self._completed_chars += self._chunk_sizes[index]
+        if started is not None:
+            self._estimator.record(self._chunk_sizes[index], time.monotonic() - started)
+
+    def bytes_written(self, count: int) -> None:
+        """Record audio bytes written to the output"""
+        with self._lock:
+            self._bytes_written += count
+
+    def snapshot(self) -> ProgressSnapshot:
+        """Get the current progress, interpolating chunks still in flight"""
+        now = time.monotonic()
+        chars_per_second = self._estimator.chars_per_second
+
+        with self._lock:
+            estimated_chars = float(self._completed_chars)
+            if chars_per_second:
+                for index, started in self._in_flight.items():
+                    expected = (now - started) * chars_per_second
+                    estimated_chars += min(expected, self._chunk_sizes[index] * self.IN_FLIGHT_CAP)
+
+            elapsed = now - self._started_at
+            percent = int(100 * estimated_chars / self._total_chars)
+            if self._completed_chunks < len(self._chunk_sizes):
+                percent = min(percent, 99)
+
+            return ProgressSnapshot(
+                percent=percent,
+                completed_chars=self._completed_chars,
+                total_chars=sum(self._chunk_sizes),
+                completed_chunks=self._completed_chunks,
+                total_chunks=len(self._chunk_sizes),
+                bytes_written=self._bytes_written,
+                elapsed_seconds=elapsed,
+                eta_seconds=self._estimate_eta(estimated_chars, elapsed, chars_per_second)
+            )
+
+    def _estimate_eta(self, estimated_chars: float, elapsed: float,
+                      chars_per_second: Optional[float]) -> Optional[float]:
+        """Estimate seconds remaining from this job's rate, else the shared estimate"""
+        remaining = self._total_chars - estimated_chars
+        if remaining <= 0:
+            return 0.0
+        if self._completed_chars and elapsed > 0:
+            # Observed job throughput already reflects chunk parallelism
+            return remaining / (self._completed_chars / elapsed)
+        if chars_per_second:
+            return remaining / (chars_per_second * self._parallelism)
+        return None
+
+def format_eta(seconds: Optional[float]) -> str:
+    """Format an ETA for display"""
+    if seconds is None:
+        return "estimating..."
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds}s left"
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes}m {seconds:02d}s left"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes:02d}m left"
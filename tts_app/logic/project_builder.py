@@ -0,0 +1,286 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+from tts_app.models.tts_config import TTSRequest, SSMLConfig
+from tts_app.models.build_config import BuildConfig, BuildTarget, BUILD_CONFIG_FILENAME, FORMAT_EXTENSIONS
+from tts_app.logic.tts_engine import TTSEngine
+from tts_app.logic.cancellation import CancellationToken, OperationCancelledError
+
+logger = logging.getLogger(__name__)
+
+# Bumped when the way outputs are produced changes, so every output is rebuilt once
+BUILD_FORMAT_VERSION = 1
+
+@dataclass
+class BuildResult:
+    """Outcome counts of a project build"""
+    built: int = 0
+    up_to_date: int = 0
+    failed: int = 0
+    cancelled: int = 0
+    errors: Dict[str, str] = field(default_factory=dict)  # source_path -> error_message
+
+    @property
+    def total(self) -> int:
+        """Number of targets in the project"""
+        return self.built + self.up_to_date + self.failed + self.cancelled
+
+class ProjectBuilder:
+    """Builds a directory of SSML and text sources into audio, like make
+
+    Each output's fingerprint covers its source content and its voice and
+    audio settings. Fingerprints of built outputs are kept in a state file in
+    the output directory, so a build only resynthesizes outputs that are
+    missing or whose inputs changed, and runs those in parallel.
+    """
+
+    # Fingerprints of built outputs, in the output directory
+    STATE_FILENAME = ".speechgen-build.json"
+
+    def __init__(self, engine: TTSEngine, project_dir: str, max_workers: int = 4):
+        self._engine = engine
+        self.project_dir = os.path.abspath(project_dir)
+        self._max_workers = max(1, max_workers)
+        self._cancel_token = CancellationToken()
+        self._state_lock = threading.Lock()
+        self.config = self.load_config()
+
+    @property
+    def config_path(self) -> str:
+        """Build configuration file of the project"""
+        return os.path.join(self.project_dir, BUILD_CONFIG_FILENAME)
+
+    @property
+    def output_dir(self) -> str:
+        """Directory outputs are built into"""
+        return os.path.join(self.project_dir, self.config.output_dir)
+
+    def load_config(self) -> BuildConfig:
+        """Load the project's build configuration, or the defaults when it has none"""
+        if os.path.exists(self.config_path):
+            return BuildConfig.load(self.config_path)
+        return BuildConfig()
+
+    def cancel(self) -> None:
+        """Stop the current build; outputs already built are kept"""
+        self._cancel_token.cancel()
+
+    def source_paths(self) -> List[str]:
+        """Source files of the project, relative to it"""
+        output_dir = os.path.normpath(self.output_dir)
+        sources = []
+        for directory, subdirectories, filenames in os.walk(self.project_dir):
+            # Never descend into the outputs or hidden directories
+            subdirectories[:] = sorted(
+                name for name in subdirectories
+                if not name.startswith(".") and os.path.normpath(os.path.join(directory, name)) != output_dir
+            )
+            for filename in sorted(filenames):
+                source_path = os.path.relpath(os.path.join(directory, filename), self.project_dir)
+                source_path = source_path.replace(os.sep, "/")
+                if self.config.is_source(source_path):
+                    sources.append(source_path)
+        return sources
+
+    def targets(self) -> List[BuildTarget]:
+        """Every target of the project, with the reason it is stale or cannot be built"""
+        state = self._load_state()
+        targets = []
+        by_output: Dict[str, List[BuildTarget]] = {}
+        for source_path in self.source_paths():
+            target = self._target_for(source_path)
+            targets.append(target)
+            by_output.setdefault(os.path.normcase(target.output_path), []).append(target)
+            if target.error is not None:
+                continue
+            built_fingerprint = state.get(source_path)
+            if not os.path.exists(target.output_path):
+                target.stale_reason = "output missing"
+            elif built_fingerprint is None:
+                target.stale_reason = "never built"
+            elif built_fingerprint != target.fingerprint:
+                target.stale_reason = "inputs changed"
+
+        # Sources differing only in extension, like a.txt and a.ssml, would overwrite each other's output
+        for colliding in by_output.values():
+            if len(colliding) > 1:
+                sources = ", ".join(target.source_path for target in colliding)
+                output_path = os.path.relpath(colliding[0].output_path, self.project_dir).replace(os.sep, "/")
+                for target in colliding:
+                    target.error = target.error or f"Configuration error: {sources} all build {output_path}"
+        return targets
+
+    def build(self, force: bool = False,
+              on_result: Optional[Callable[[BuildTarget, Optional[str]], None]] = None) -> BuildResult:
+        """Build every stale target, or every target with force
+
+        on_result gets each built target with its error message, None on success.
+        Targets that cannot be built, such as unreadable sources or sources
+        whose outputs collide, are reported as failed without stopping the build.
+        """
+        self._cancel_token = CancellationToken()
+        result = BuildResult()
+        targets = self.targets()
+        buildable = [target for target in targets if target.error is None]
+        stale = [target for target in buildable if force or target.is_stale]
+        result.up_to_date = len(buildable) - len(stale)
+        self._prune_state(targets)
+        for target in targets:
+            if target.error is not None:
+                result.failed += 1
+                result.errors[target.source_path] = target.error
+                if on_result:
+                    on_result(target, target.error)
+        if not stale:
+            return result
+
+        cancel_token = self._cancel_token
+        with ThreadPoolExecutor(max_workers=min(self._max_workers, len(stale))) as executor:
+            futures = {executor.submit(self._build_one, target, cancel_token): target for target in stale}
+            for future in as_completed(futures):
+                target = futures[future]
+                error_message = future.result()
+                if error_message is None:
+                    result.built += 1
+                elif cancel_token.is_cancelled:
+                    result.cancelled += 1
+                    continue
+                else:
+                    result.failed += 1
+                    result.errors[target.source_path] = error_message
+                if on_result:
+                    on_result(target, error_message)
+        return result
+
+    def watch(self, interval: float = 1.0, force: bool = False,
+              on_result: Optional[Callable[[BuildTarget, Optional[str]], None]] = None,
+              on_build: Optional[Callable[[BuildResult], None]] = None,
+              stop_event: Optional[threading.Event] = None) -> None:
+        """Build, then rebuild whenever a source or the configuration changes
+
+        Polls file modification times every interval seconds, so it needs no
+        file system notification support. Runs until stop_event is set.
+        """
+        stop_event = stop_event or threading.Event()
+        snapshot = None
+        while not stop_event.is_set():
+            current = self._snapshot()
+            if current != snapshot:
+                if snapshot is not None and current.get(BUILD_CONFIG_FILENAME) != snapshot.get(BUILD_CONFIG_FILENAME):
+                    try:
+                        self.config = self.load_config()
+                    except ValueError as e:
+                        # Keep building with the last good configuration until it is fixed
+                        logger.warning("Keeping the last good build configuration: %s", e)
+                result = self.build(force=force and snapshot is None, on_result=on_result)
+                if on_build:
+                    on_build(result)
+                # Files changed during the build are picked up on the next pass
+                snapshot = current
+            stop_event.wait(interval)
+
+    def _target_for(self, source_path: str) -> BuildTarget:
+        """Build target of a source, with its fingerprint, or with its error when it cannot be read"""
+        voice_config, audio_config = self.config.settings_for(source_path)
+        is_ssml = source_path.lower().endswith(".ssml")
+        output_path = os.path.join(
+            self.output_dir,
+            os.path.splitext(source_path)[0] + FORMAT_EXTENSIONS.get(audio_config.format, ".mp3")
+        )
+
+        try:
+            with open(os.path.join(self.project_dir, source_path), "r", encoding="utf-8") as source:
+                content = source.read()
+        except (OSError, UnicodeDecodeError) as e:
+            request = TTSRequest(text="", voice_config=voice_config, audio_config=audio_config,
+                                 output_path=os.path.normpath(output_path))
+            return BuildTarget(source_path, request, "", error=f"Cannot read source: {e}")
+
+        request = TTSRequest(
+            text="" if is_ssml else content,
+            voice_config=voice_config,
+            audio_config=audio_config,
+            output_path=os.path.normpath(output_path),
+            ssml_config=SSMLConfig(enabled=True, ssml_text=content) if is_ssml else None
+        )
+
+        payload = json.dumps({
+            'version': BUILD_FORMAT_VERSION,
+            'content': content,
+            'ssml': is_ssml,
+            'voice': voice_config.to_dict(),
+            'audio': audio_config.to_dict()
+        }, sort_keys=True)
+        fingerprint = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        return BuildTarget(source_path, request, fingerprint)
+
+    def _build_one(self, target: BuildTarget, cancel_token: CancellationToken) -> Optional[str]:
+        """Synthesize one target and record its fingerprint; the error message on failure"""
+        if cancel_token.is_cancelled:
+            return "Build cancelled"
+
+        is_valid, error_msg = self._engine.validate(target.request)
+        if not is_valid:
+            return error_msg
+        try:
+            os.makedirs(os.path.dirname(target.output_path), exist_ok=True)
+            self._engine.synthesize(target.request, cancel_token=cancel_token)
+        except OperationCancelledError:
+            return "Build cancelled"
+        except Exception as e:
+            return str(e)
+
+        with self._state_lock:
+            state = self._load_state()
+            state[target.source_path] = target.fingerprint
+            self._save_state(state)
+        return None
+
+    def _snapshot(self) -> Dict[str, tuple]:
+        """Modification time and size of every source and the configuration"""
+        snapshot = {}
+        for path in self.source_paths() + [BUILD_CONFIG_FILENAME]:
+            try:
+                stat = os.stat(os.path.join(self.project_dir, path))
+            except OSError:
+                continue
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def _prune_state(self, targets: List[BuildTarget]) -> None:
+        """Forget fingerprints of sources that no longer exist"""
+        with self._state_lock:
+            state = self._load_state()
+            sources = {target.source_path for target in targets}
+            pruned = {path: fingerprint for path, fingerprint in state.items() if path in sources}
+            if pruned != state:
+                self._save_state(pruned)
+
+    def _load_state(self) -> Dict[str, str]:
+        """Fingerprints of built outputs, by source path"""
+        state_path = os.path.join(self.output_dir, self.STATE_FILENAME)
+        if not os.path.exists(state_path):
+            return {}
+        try:
+            with open(state_path, "r", encoding="utf-8") as state_file:
+                return dict(json.load(state_file).get('outputs', {}))
+        except (json.JSONDecodeError, OSError, AttributeError):
+            # A damaged state file only costs a rebuild
+            return {}
+
+    def _save_state(self, state: Dict[str, str]) -> None:
+        """Write the fingerprints of built outputs atomically"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        state_path = os.path.join(self.output_dir, self.STATE_FILENAME)
+        temp_path = f"{state_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as state_file:
+            json.dump({'version': BUILD_FORMAT_VERSION, 'updated': time.time(), 'outputs': state},
+                      state_file, indent=2, sort_keys=True)
+        os.replace(temp_path, state_path)
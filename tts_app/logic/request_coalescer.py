@@ -0,0 +1,155 @@
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, TypeVar
+import threading
+
+from tts_app.logic.cancellation import CancellationToken, DeadlineExceededError
+from tts_app.logic.structured_logging import submit_in_context
+
+T = TypeVar("T")
+
+@dataclass
+class CoalescingStats:
+    """How often identical requests shared one call"""
+    key: str
+    label: str
+    calls: int = 0  # calls actually issued
+    coalesced: int = 0  # requests served by a call already in flight
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for reporting"""
+        return {
+            'key': self.key,
+            'label': self.label,
+            'calls': self.calls,
+            'coalesced': self.coalesced
+        }
+
+class _Flight:
+    """One call in flight and the callers waiting on it"""
+
+    def __init__(self):
+        self.future: Optional[Future] = None
+        self.token = CancellationToken()
+        self.waiters = 1
+
+class RequestCoalescer:
+    """Single-flight layer: identical concurrent requests share one call
+
+    The first caller for a key starts the call; callers arriving with the
+    same key while it is in flight wait for its result instead of issuing
+    their own. The shared call runs on a thread of its own under its own
+    token, so every caller, the first one included, waits with its own
+    timeout and cancellation and returns as soon as it gives up. The shared
+    call has no deadline of its own: it is cancelled once the last caller has
+    given up, which makes it last as long as the most patient caller allows.
+    Results are not kept after the call completes.
+    """
+
+    # Keys whose statistics are remembered, most recent first
+    MAX_TRACKED_KEYS = 1000
+
+    def __init__(self, max_workers: int = 64):
+        self.max_workers = max_workers
+        self._flights: Dict[str, _Flight] = {}
+        self._stats: "OrderedDict[str, CoalescingStats]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def call(self, key: str, fn: Callable[[CancellationToken], T], label: str = "",
+             timeout: Optional[float] = None,
+             cancel_token: Optional[CancellationToken] = None) -> T:
+        """Run fn(token) once for all concurrent callers of key and return its result
+
+        The token passed to fn is cancelled once every caller has given up.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            stats = self._stats_for(key, label)
+            if flight is None:
+                flight = _Flight()
+                self._flights[key] = flight
+                stats.calls += 1
+                flight.future = submit_in_context(self._get_executor(), fn, flight.token)
+                flight.future.add_done_callback(lambda _: self._land(key, flight))
+            else:
+                flight.waiters += 1
+                stats.coalesced += 1
+
+        return self._wait(key, flight, timeout, cancel_token)
+
+    def stats(self) -> List[CoalescingStats]:
+        """Statistics of recently seen keys, most recent first"""
+        with self._lock:
+            return list(reversed(self._stats.values()))
+
+    @property
+    def total_saved(self) -> int:
+        """Calls avoided by sharing an in-flight call"""
+        with self._lock:
+            return sum(stats.coalesced for stats in self._stats.values())
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct calls currently in flight"""
+        return len(self._flights)
+
+    def _wait(self, key: str, flight: _Flight, timeout: Optional[float],
+              cancel_token: Optional[CancellationToken]) -> T:
+        """Wait for the shared result, or leave the flight on cancellation or timeout"""
+        woken = threading.Event()
+        flight.future.add_done_callback(lambda _: woken.set())
+        if cancel_token is not None:
+            cancel_token.add_callback(woken.set)
+        try:
+            woken.wait(timeout)
+        finally:
+            if cancel_token is not None:
+                cancel_token.remove_callback(woken.set)
+
+        if flight.future.done():
+            return flight.future.result()
+
+        self._leave(key, flight)
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+        raise DeadlineExceededError("Synthesis deadline exceeded")
+
+    def _leave(self, key: str, flight: _Flight) -> None:
+        """Drop a caller, cancelling the shared call when nobody waits for it"""
+        with self._lock:
+            flight.waiters -= 1
+            abandoned = flight.waiters <= 0
+            if abandoned:
+                self._forget(key, flight)
+        if abandoned:
+            flight.token.cancel()
+            flight.future.cancel()
+
+    def _land(self, key: str, flight: _Flight) -> None:
+        """Forget a completed call so later requests start a new one"""
+        with self._lock:
+            self._forget(key, flight)
+
+    def _forget(self, key: str, flight: _Flight) -> None:
+        """Stop routing callers to a flight; caller holds the lock"""
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Threads that run shared calls, created on first use; caller holds the lock"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                thread_name_prefix="tts-coalesce")
+        return self._executor
+
+    def _stats_for(self, key: str, label: str) -> CoalescingStats:
+        """Statistics entry for a key; caller holds the lock"""
+        stats = self._stats.pop(key, None)
+        if stats is None:
+            stats = CoalescingStats(key=key, label=label)
+        self._stats[key] = stats
+        while len(self._stats) > self.MAX_TRACKED_KEYS:
+            self._stats.popitem(last=False)
+        return stats
@@ -0,0 +1,28 @@
+from typing import Optional
+import grpc
+
+def rpc_status_code(error: Exception) -> Optional[grpc.StatusCode]:
+    """Get the gRPC status code of an RPC error, if it has one"""
+    # google.api_core errors carry the gRPC code separately from their HTTP code
+    code = getattr(error, "grpc_status_code", None)
+    if code is not None:
+        return code
+    code = getattr(error, "code", None)
+    if callable(code):
+        try:
+            return code()
+        except Exception:
+            return None
+    return None
+
+def is_deadline_error(error: Exception) -> bool:
+    """Check if an RPC error means the deadline passed"""
+    return rpc_status_code(error) == grpc.StatusCode.DEADLINE_EXCEEDED
+
+def is_quota_error(error: Exception) -> bool:
+    """Check if an RPC error means the caller ran out of quota"""
+    return rpc_status_code(error) == grpc.StatusCode.RESOURCE_EXHAUSTED
+
+def is_credential_error(error: Exception) -> bool:
+    """Check if an RPC error means the credentials were rejected"""
+    return rpc_status_code(error) in (grpc.StatusCode.UNAUTHENTICATED, grpc.StatusCode.PERMISSION_DENIED)
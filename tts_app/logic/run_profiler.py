@@ -0,0 +1,217 @@
+from typing import List, Optional, Tuple
+import atexit
+import cProfile
+import io
+import logging
+import os
+import pstats
+import signal
+import sys
+import threading
+import time
+import tracemalloc
+
+logger = logging.getLogger(__name__)
+
+# Set to a directory (or 1 for ./profiles) to profile a run without any command line option
+PROFILE_ENV_VAR = "SPEECHGEN_PROFILE"
+
+# Where reports go when no directory is given
+DEFAULT_PROFILE_DIR = "profiles"
+
+# From Python 3.12 cProfile runs on sys.monitoring, which allows one active profiler per process
+SINGLE_PROFILER = sys.version_info >= (3, 12)
+
+class _StatsSnapshot:
+    """Stats of a profile that keeps running, in the form pstats accepts"""
+
+    def __init__(self, profile: cProfile.Profile):
+        profile.snapshot_stats()
+        self.stats = profile.stats
+
+    def create_stats(self) -> None:
+        """pstats calls this on profiles; the snapshot is already taken"""
+
+class RunProfiler:
+    """Profiles a whole run with cProfile and tracemalloc and writes a report
+
+    Every thread started after start() gets its own profile, merged into one
+    report. The report is written when the process exits and, on POSIX,
+    whenever the process receives SIGUSR1 (profiling carries on), so a
+    slow run can be inspected without stopping it. Next to each text report
+    a .prof file is written for pstats or snakeviz.
+
+    On Python 3.12 and later only one profiler can be active, so a single
+    profile sees every thread instead. Calls running at the same time on
+    different threads overlap in its timings, which makes the cumulative
+    times of concurrent work approximate.
+    """
+
+    def __init__(self, output_dir: str = DEFAULT_PROFILE_DIR, top_functions: int = 40,
+                 top_allocations: int = 25, traceback_frames: int = 10):
+        self.output_dir = output_dir
+        self.top_functions = top_functions
+        self.top_allocations = top_allocations
+        self.traceback_frames = traceback_frames
+        self._profiles: List[Tuple[int, cProfile.Profile]] = []  # thread ident, profile
+        self._lock = threading.Lock()
+        self._started_at = 0.0
+        self._running = False
+        self._dumps = 0
+
+    def start(self) -> 'RunProfiler':
+        """Start profiling this thread and every thread started from now on"""
+        if self._running:
+            return self
+        self._running = True
+        self._started_at = time.monotonic()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.traceback_frames)
+
+        if not SINGLE_PROFILER:
+            threading.setprofile(self._profile_new_thread)
+        self._enable_profile()
+
+        atexit.register(self.stop)
+        if hasattr(signal, "SIGUSR1") and threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGUSR1, lambda signum, frame: self.dump("signal"))
+        return self
+
+    def stop(self) -> Optional[str]:
+        """Stop profiling and write the final report; its path, or None if not running"""
+        if not self._running:
+            return None
+        threading.setprofile(None)
+        with self._lock:
+            for _, profile in self._profiles:
+                profile.disable()
+        path = self.dump("exit")
+        self._running = False
+        tracemalloc.stop()
+        return path
+
+    def dump(self, reason: str = "request") -> str:
+        """Write a report of everything recorded so far and return its path"""
+        # Keep the report's own work out of the report; it is slow under the profiler too
+        own_profile = self._profile_of(threading.get_ident())
+        if own_profile:
+            own_profile.disable()
+        try:
+            return self._write_report(reason)
+        finally:
+            if own_profile and self._running:
+                own_profile.enable()
+
+    def _write_report(self, reason: str) -> str:
+        """Write the text and .prof reports"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        # Before the profiler's own work below allocates anything
+        memory_snapshot = tracemalloc.take_snapshot() if tracemalloc.is_tracing() else None
+        with self._lock:
+            self._dumps += 1
+            snapshots = [_StatsSnapshot(profile) for _, profile in self._profiles]
+            dump_number = self._dumps
+        base_path = os.path.join(
+            self.output_dir, f"profile-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{dump_number}"
+        )
+
+        report = io.StringIO()
+        report.write(f"SpeechGen profile ({reason})\n")
+        report.write(f"Command: {' '.join(sys.argv)}\n")
+        report.write(f"Python {sys.version.split()[0]} on {sys.platform}, pid {os.getpid()}\n")
+        scope = "in one profile of all threads" if SINGLE_PROFILER else f"across {len(snapshots)} thread(s)"
+        report.write(f"Profiled for {time.monotonic() - self._started_at:.1f}s {scope}\n")
+
+        if snapshots:
+            stats = pstats.Stats(snapshots[0], stream=report)
+            for snapshot in snapshots[1:]:
+                stats.add(snapshot)
+            stats.dump_stats(f"{base_path}.prof")
+            stats.strip_dirs()
+            for sort_key, title in (("cumulative", "cumulative time"), ("tottime", "own time")):
+                report.write(f"\n===== Top {self.top_functions} functions by {title} =====\n")
+                stats.sort_stats(sort_key).print_stats(self.top_functions)
+
+        if memory_snapshot is not None:
+            self._write_allocations(report, memory_snapshot)
+
+        report_path = f"{base_path}.txt"
+        with open(report_path, "w", encoding="utf-8") as out:
+            out.write(report.getvalue())
+        logger.info("Profile written to %s", report_path, extra={'reason': reason})
+        return report_path
+
+    def _write_allocations(self, report: io.StringIO, snapshot: tracemalloc.Snapshot) -> None:
+        """Current and peak traced memory and the top allocation sites"""
+        current, peak = tracemalloc.get_traced_memory()
+        report.write(f"\n===== Memory: {current / 1024 / 1024:.1f} MB traced now, "
+                     f"{peak / 1024 / 1024:.1f} MB peak =====\n")
+
+        report.write(f"\n===== Top {self.top_allocations} allocation sites =====\n")
+        for statistic in self._own_statistics(snapshot, "lineno")[:self.top_allocations]:
+            report.write(f"{statistic}\n")
+
+        report.write("\n===== Top 5 allocating call stacks =====\n")
+        for statistic in self._own_statistics(snapshot, "traceback")[:5]:
+            report.write(f"\n{statistic.count} blocks, {statistic.size / 1024:.1f} KiB\n")
+            for line in statistic.traceback.format():
+                report.write(f"{line}\n")
+
+    @staticmethod
+    def _own_statistics(snapshot: tracemalloc.Snapshot, key_type: str) -> List[tracemalloc.Statistic]:
+        """Allocation statistics without the profiler's and the import system's own allocations
+
+        Filters the grouped statistics rather than using Snapshot.filter_traces,
+        which takes seconds on a snapshot of a whole application.
+        """
+        excluded = {tracemalloc.__file__, cProfile.__file__, pstats.__file__}
+        return [
+            statistic for statistic in snapshot.statistics(key_type)
+            if statistic.traceback[0].filename not in excluded
+            and not statistic.traceback[0].filename.startswith("<frozen importlib._bootstrap")
+        ]
+
+    def _profile_of(self, thread_ident: int) -> Optional[cProfile.Profile]:
+        """Profile of a running thread, if it has one"""
+        with self._lock:
+            # Idents are reused after a thread ends, so the latest profile is the live one
+            for ident, profile in reversed(self._profiles):
+                if ident == thread_ident:
+                    return profile
+        return None
+
+    def _enable_profile(self) -> None:
+        """Profile the calling thread"""
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError as e:
+            # Another profiler or a debugger already holds sys.monitoring's profiler slot
+            logger.warning("Not profiling thread %s: %s", threading.current_thread().name, e)
+            return
+        with self._lock:
+            self._profiles.append((threading.get_ident(), profile))
+
+    def _profile_new_thread(self, frame, event, arg) -> None:
+        """Installed by threading.setprofile; swaps itself for a real profile on a thread's first call"""
+        sys.setprofile(None)
+        if self._running:
+            self._enable_profile()
+
+def profiler_from_environment(enabled: bool = False, output_dir: Optional[str] = None) -> Optional[RunProfiler]:
+    """Start the profiler asked for by --profile (enabled, output_dir) or SPEECHGEN_PROFILE
+
+    Returns None when profiling was not asked for. The setting is passed on
+    through the environment, so worker processes profile themselves too.
+    """
+    requested = os.environ.get(PROFILE_ENV_VAR, "").strip()
+    if requested.lower() in ("", "0", "false", "no"):
+        if not (enabled or output_dir):
+            return None
+        requested = ""
+    if requested.lower() in ("1", "true", "yes"):
+        requested = ""
+
+    output_dir = os.path.abspath(output_dir or requested or DEFAULT_PROFILE_DIR)
+    os.environ[PROFILE_ENV_VAR] = output_dir
+    return RunProfiler(output_dir).start()
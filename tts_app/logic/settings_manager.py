@@ -1,7 +1,10 @@
 import json
+import logging
 import os
 from typing import Optional
-from models.settings_config import AppSettings
+from tts_app.models.settings_config import AppSettings
+
+logger = logging.getLogger(__name__)
 
 class SettingsManager:
     """Logic manager for application settings persistence"""
@@ -35,7 +38,7 @@ class SettingsManager:
             self._settings = settings
             return True
         except Exception as e:
-            print(f"Failed to save settings: {e}")
+            logger.error("Failed to save settings to %s: %s", self.settings_file, e)
             return False
     
     def get_settings(self) -> AppSettings:
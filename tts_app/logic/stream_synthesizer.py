@@ -0,0 +1,232 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import BinaryIO, Callable, List, Optional, TextIO, TYPE_CHECKING
+import queue
+import re
+import threading
+import time
+
+from tts_app.models.tts_config import TTSRequest, VoiceConfig, AudioConfig
+from tts_app.logic.tts_engine import TTSEngine
+from tts_app.logic.audio_writer import MemoryAudioWriter, StreamAudioWriter
+from tts_app.logic.cancellation import CancellationToken, OperationCancelledError
+
+if TYPE_CHECKING:
+    # Loaded lazily: pygame is only needed to play the stream
+    from tts_app.logic.audio_player_manager import AudioPlayerManager
+
+class SentenceSegmenter:
+    """Cuts text that arrives piece by piece into segments at sentence boundaries
+
+    Text is held until a sentence ends, a blank line arrives, or nothing new
+    has come in for max_wait seconds, so segments are not cut mid-sentence
+    while the producer is still writing it. Text past max_characters is
+    cut at the last space regardless.
+    """
+
+    # End of a sentence (with closing quotes or brackets) followed by whitespace, or a blank line
+    BOUNDARY_PATTERN = re.compile(r'[.!?。！？]["\'”’)\]]*\s+|\n\s*\n')
+
+    def __init__(self, max_wait: float = 1.0, max_characters: int = 1000):
+        self.max_wait = max_wait
+        self.max_characters = max_characters
+        self._buffer = ""
+        self._last_input = 0.0
+
+    def feed(self, text: str) -> List[str]:
+        """Add text and take the segments it completes"""
+        self._buffer += text
+        self._last_input = time.monotonic()
+
+        segments = []
+        last_boundary = 0
+        for match in self.BOUNDARY_PATTERN.finditer(self._buffer):
+            segments.append(self._buffer[last_boundary:match.end()])
+            last_boundary = match.end()
+        self._buffer = self._buffer[last_boundary:]
+
+        while len(self._buffer) > self.max_characters:
+            cut = self._buffer.rfind(" ", 0, self.max_characters)
+            cut = cut if cut > 0 else self.max_characters
+            segments.append(self._buffer[:cut])
+            self._buffer = self._buffer[cut:]
+
+        return [segment.strip() for segment in segments if segment.strip()]
+
+    def seconds_until_due(self) -> Optional[float]:
+        """Seconds until held text is flushed for lack of new input; None when nothing is held"""
+        if not self._buffer.strip():
+            return None
+        return max(0.0, self._last_input + self.max_wait - time.monotonic())
+
+    def flush(self) -> Optional[str]:
+        """Take whatever text is held, complete or not"""
+        segment, self._buffer = self._buffer.strip(), ""
+        return segment or None
+
+@dataclass
+class StreamResult:
+    """Outcome counts of a streaming session"""
+    segments: int = 0
+    failed: int = 0
+    characters: int = 0
+
+class StreamSynthesizer:
+    """Synthesizes text read from a stream segment by segment, as a pipeline
+
+    Each segment is synthesized as soon as it is complete and handed to the
+    sink strictly in order, so synthesizing the next segments overlaps
+    writing or playing the current one. At most max_ahead segments are
+    synthesized ahead of the sink, which bounds memory when the sink is
+    slower than the service.
+    """
+
+    def __init__(self, engine: TTSEngine, voice_config: VoiceConfig, audio_config: AudioConfig,
+                 segmenter: Optional[SentenceSegmenter] = None, max_ahead: int = 2):
+        self._engine = engine
+        self.voice_config = voice_config
+        self.audio_config = audio_config
+        self.segmenter = segmenter or SentenceSegmenter()
+        self._max_ahead = max(1, max_ahead)
+        self._cancel_token = CancellationToken()
+
+    def cancel(self) -> None:
+        """Stop reading and synthesizing; segments already synthesized are dropped"""
+        self._cancel_token.cancel()
+
+    def run(self, source: TextIO, sink: Callable[[int, bytes], None],
+            on_error: Optional[Callable[[int, str, Exception], None]] = None) -> StreamResult:
+        """Read source until it ends, passing each segment's audio to sink in order"""
+        result = StreamResult()
+        lines: queue.Queue = queue.Queue()
+        ordered: queue.Queue = queue.Queue()
+        slots = threading.Semaphore(self._max_ahead)
+
+        def read_source():
+            for line in iter(source.readline, ""):
+                lines.put(line)
+            lines.put(None)
+
+        def drain():
+            index = 0
+            while True:
+                item = ordered.get()
+                if item is None:
+                    return
+                segment, future = item
+                try:
+                    audio_content = future.result()
+                    if not self._cancel_token.is_cancelled:
+                        sink(index, audio_content)
+                        index += 1
+                except OperationCancelledError:
+                    pass
+                except Exception as e:
+                    result.failed += 1
+                    if on_error:
+                        on_error(index, segment, e)
+                finally:
+                    slots.release()
+
+        threading.Thread(target=read_source, name="stream-reader", daemon=True).start()
+        sink_thread = threading.Thread(target=drain, name="stream-sink")
+        sink_thread.start()
+
+        with ThreadPoolExecutor(max_workers=self._max_ahead, thread_name_prefix="stream-synth") as executor:
+            def submit(segment: str) -> None:
+                # Blocks reading while the sink is max_ahead segments behind
+                slots.acquire()
+                result.segments += 1
+                result.characters += len(segment)
+                ordered.put((segment, executor.submit(self._synthesize, segment)))
+
+            try:
+                while not self._cancel_token.is_cancelled:
+                    try:
+                        line = lines.get(timeout=self.segmenter.seconds_until_due())
+                    except queue.Empty:
+                        segment = self.segmenter.flush()
+                        if segment:
+                            submit(segment)
+                        continue
+
+                    if line is None:
+                        segment = self.segmenter.flush()
+                        if segment:
+                            submit(segment)
+                        break
+                    for segment in self.segmenter.feed(line):
+                        submit(segment)
+            except BaseException:
+                # Don't wait for segments nobody will hear
+                self.cancel()
+                raise
+            finally:
+                ordered.put(None)
+                sink_thread.join()
+
+        return result
+
+    def _synthesize(self, segment: str) -> bytes:
+        """Synthesize one segment into memory"""
+        request = TTSRequest(
+            text=segment,
+            voice_config=self.voice_config,
+            audio_config=self.audio_config,
+            output_path="<stream>"
+        )
+        writer = MemoryAudioWriter(self.audio_config.format)
+        self._engine.synthesize(request, cancel_token=self._cancel_token, writer=writer)
+        return writer.content
+
+class StreamOutputSink:
+    """Writes segments one after another to a binary stream, e.g. stdout
+
+    WAV segments are joined under a single streamed header, so the output
+    plays as one file.
+    """
+
+    def __init__(self, stream: BinaryIO, audio_format: str = "MP3"):
+        self._writer = StreamAudioWriter(stream, audio_format).open()
+        self._stream = stream
+
+    def __call__(self, index: int, audio_content: bytes) -> None:
+        self._writer.write_chunk(audio_content)
+        self._stream.flush()
+
+    def close(self) -> None:
+        """Flush the stream"""
+        self._writer.close()
+
+class PlaybackSink:
+    """Plays segments gaplessly through the audio player's queue
+
+    Returns from each segment once it has been handed to the mixer, which
+    keeps only one segment queued behind the one playing.
+    """
+
+    # Seconds between feeding the player's queue
+    POLL_INTERVAL = 0.05
+
+    def __init__(self, player: 'AudioPlayerManager', audio_format: str = "MP3"):
+        self._player = player
+        self._audio_format = audio_format
+        if not player.start_queue():
+            raise RuntimeError("Audio playback is not available")
+
+    def __call__(self, index: int, audio_content: bytes) -> None:
+        from tts_app.logic.audio_player_manager import PlaybackQueueState
+
+        self._player.enqueue_chunk(index, audio_content, self._audio_format)
+        while self._player.queue_progress[0] <= index:
+            if self._player.update_queue() == PlaybackQueueState.FINISHED:
+                return
+            time.sleep(self.POLL_INTERVAL)
+
+    def close(self) -> None:
+        """Wait for the last segments to finish playing"""
+        from tts_app.logic.audio_player_manager import PlaybackQueueState
+
+        self._player.close_queue()
+        while self._player.update_queue() not in (PlaybackQueueState.FINISHED, PlaybackQueueState.IDLE):
+            time.sleep(self.POLL_INTERVAL)
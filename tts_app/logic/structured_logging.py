@@ -0,0 +1,161 @@
+from concurrent.futures import Executor, Future
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Callable, Iterator, List, Optional, TextIO
+import atexit
+import contextvars
+import copy
+import json
+import logging
+import os
+import queue
+import sys
+import uuid
+
+# Every module logs under this logger, so configuring it configures the whole app
+ROOT_LOGGER_NAME = "tts_app"
+
+# Log level used when none is given, and inherited by worker processes
+LOG_LEVEL_ENV_VAR = "SPEECHGEN_LOG_LEVEL"
+
+# Log files are rotated at this size, keeping this many old files
+LOG_FILE_MAX_BYTES = 10 * 1024 * 1024
+LOG_FILE_BACKUPS = 3
+
+# Correlation ID of the job this thread or task is working on
+_correlation_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("correlation_id", default=None)
+
+# Attributes every log record has; any others were passed with extra= and are logged as fields
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {
+    "message", "asctime", "correlation_id", "correlation"
+}
+
+_listener: Optional[QueueListener] = None
+
+def current_correlation_id() -> Optional[str]:
+    """Correlation ID of the job being worked on in this context, if any"""
+    return _correlation_id.get()
+
+@contextmanager
+def correlation_scope(correlation_id: Optional[str] = None) -> Iterator[str]:
+    """Tag every record logged in this context with a correlation ID
+
+    Uses the given ID, else the enclosing scope's, else a new one.
+    """
+    correlation_id = correlation_id or _correlation_id.get() or uuid.uuid4().hex[:12]
+    token = _correlation_id.set(correlation_id)
+    try:
+        yield correlation_id
+    finally:
+        _correlation_id.reset(token)
+
+def submit_in_context(executor: Executor, function: Callable, *args) -> Future:
+    """Submit work to an executor so it logs under the caller's correlation ID"""
+    return executor.submit(contextvars.copy_context().run, function, *args)
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, with the correlation ID and any extra fields"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'thread': record.threadName
+        }
+        correlation_id = getattr(record, "correlation_id", None)
+        if correlation_id:
+            entry['correlation_id'] = correlation_id
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exception'] = record.exc_text
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+class TextFormatter(logging.Formatter):
+    """Readable single lines for a terminal, with the correlation ID when there is one"""
+
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)-7s %(name)s%(correlation)s: %(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        correlation_id = getattr(record, "correlation_id", None)
+        record.correlation = f" [{correlation_id}]" if correlation_id else ""
+        return super().format(record)
+
+class _ContextQueueHandler(QueueHandler):
+    """Queues records for the listener thread, stamped with the caller's correlation ID"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Runs on the logging thread: capture what only it knows, and leave formatting to the listener
+        record = copy.copy(record)
+        if getattr(record, "correlation_id", None) is None:
+            record.correlation_id = _correlation_id.get()
+        # Arguments and tracebacks may not survive until the listener gets to them
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+def configure_logging(level: Optional[str] = None, log_file: Optional[str] = None,
+                      console: bool = True, console_level: Optional[str] = None,
+                      console_json: bool = False, stream: Optional[TextIO] = None) -> QueueListener:
+    """Route the app's logging through a queue to a background writer thread
+
+    Logging calls only put the record on an unbounded queue, so they never
+    wait on disk or terminal I/O; a listener thread formats and writes
+    them. The log file gets JSON lines and rotates. The console (stderr by
+    default) gets readable lines, or JSON with console_json, at
+    console_level or above. Calling it again replaces the configuration.
+    """
+    global _listener
+    level = (level or os.environ.get(LOG_LEVEL_ENV_VAR) or "INFO").upper()
+
+    handlers: List[logging.Handler] = []
+    if console:
+        console_handler = logging.StreamHandler(stream or sys.stderr)
+        console_handler.setFormatter(JsonFormatter() if console_json else TextFormatter())
+        console_handler.setLevel((console_level or level).upper())
+        handlers.append(console_handler)
+    if log_file:
+        os.makedirs(os.path.dirname(os.path.abspath(log_file)), exist_ok=True)
+        file_handler = RotatingFileHandler(log_file, maxBytes=LOG_FILE_MAX_BYTES,
+                                           backupCount=LOG_FILE_BACKUPS, encoding="utf-8", delay=True)
+        file_handler.setFormatter(JsonFormatter())
+        handlers.append(file_handler)
+
+    shutdown_logging()
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+
+    logger = logging.getLogger(ROOT_LOGGER_NAME)
+    logger.handlers = [_ContextQueueHandler(log_queue)]
+    logger.setLevel(level)
+    logger.propagate = False
+
+    _listener.start()
+    return _listener
+
+def shutdown_logging() -> None:
+    """Write out queued records and stop the listener thread"""
+    global _listener
+    if _listener is None:
+        return
+    listener, _listener = _listener, None
+    # Anything logged from now on goes to Python's default stderr output instead of a dead queue
+    logger = logging.getLogger(ROOT_LOGGER_NAME)
+    logger.handlers = []
+    logger.propagate = True
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+# Flush what is queued when the process exits
+atexit.register(shutdown_logging)
@@ -0,0 +1,211 @@
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, Optional
+import logging
+import time
+
+from tts_app.models.tts_config import TTSRequest
+from tts_app.models.job_config import ProgressSnapshot
+from tts_app.logic.tts_service_manager import TTSServiceManager
+from tts_app.logic.cancellation import CancellationToken, OperationCancelledError
+from tts_app.logic.progress_tracker import ProgressTracker, ThroughputEstimator
+from tts_app.logic.job_journal import JobJournal, fingerprint_chunk
+from tts_app.logic.audio_cache import AudioCache
+from tts_app.logic.audio_writer import StreamingAudioWriter
+from tts_app.logic.structured_logging import correlation_scope, submit_in_context
+
+logger = logging.getLogger(__name__)
+
+class SynthesisPipeline:
+    """Runs one TTS request end to end: validation, chunked synthesis and ordered output
+
+    Has no Qt dependency so the GUI worker and the command line share it.
+    """
+
+    # Chunks synthesized concurrently for long documents
+    MAX_PARALLEL_CHUNKS = 4
+
+    # How often progress is re-estimated while RPCs are in flight
+    PROGRESS_INTERVAL = 0.25
+
+    def __init__(self, tts_service: TTSServiceManager,
+                 throughput: Optional[ThroughputEstimator] = None,
+                 journal: Optional[JobJournal] = None,
+                 audio_cache: Optional[AudioCache] = None):
+        self._service = tts_service
+        self._throughput = throughput or ThroughputEstimator()
+        self._journal = journal
+        self._audio_cache = audio_cache
+
+    def run(self, request: TTSRequest, job_id: Optional[str] = None,
+            cancel_token: Optional[CancellationToken] = None,
+            on_progress: Optional[Callable[[ProgressSnapshot], None]] = None,
+            on_chunk: Optional[Callable[[int, int, bytes, str], None]] = None,
+            writer: Optional[StreamingAudioWriter] = None) -> Optional[bytes]:
+        """Synthesize a request to its output path, or to writer when given
+
+        Chunks are synthesized in parallel and written in document order, so only
+        a few are held in memory at a time. Returns the audio content for
+        single-chunk requests so it can be played from memory. Partial output is
+        discarded if the job fails or is cancelled. With a journal and job id,
+        chunks completed by an earlier run of the same job are not synthesized again;
+        with an audio cache, neither are chunks rendered by any earlier job.
+        Time spent in each stage is recorded in the service's metrics, and
+        everything logged while it runs carries the job id as its correlation ID.
+        """
+        metrics = self._service.metrics
+        started = time.monotonic()
+        fields = {'output_path': request.output_path, 'voice': request.voice_config.voice_name}
+        with correlation_scope(job_id):
+            try:
+                result = self._run(request, job_id, cancel_token or CancellationToken(),
+                                   on_progress, on_chunk, writer)
+            except OperationCancelledError as e:
+                metrics.inc('tts_requests_total', outcome="cancelled")
+                logger.info("Synthesis cancelled: %s", e, extra=dict(fields, outcome="cancelled"))
+                raise
+            except Exception as e:
+                metrics.inc('tts_requests_total', outcome="failed")
+                logger.warning("Synthesis failed: %s", e, extra=dict(fields, outcome="failed"))
+                raise
+            finally:
+                seconds = time.monotonic() - started
+                metrics.observe('tts_stage_seconds', seconds, stage="total")
+            metrics.inc('tts_requests_total', outcome="completed")
+            logger.info("Synthesis completed", extra=dict(fields, outcome="completed", seconds=round(seconds, 3)))
+        return result
+
+    def _run(self, request: TTSRequest, job_id: Optional[str], cancel_token: CancellationToken,
+             on_progress: Optional[Callable[[ProgressSnapshot], None]],
+             on_chunk: Optional[Callable[[int, int, bytes, str], None]],
+             writer: Optional[StreamingAudioWriter]) -> Optional[bytes]:
+        """Run a request; see run"""
+        metrics = self._service.metrics
+
+        with metrics.timer("validation"):
+            is_valid, error_msg = request.is_valid()
+        if not is_valid:
+            raise ValueError(error_msg)
+
+        with metrics.timer("request_build"):
+            # Convert voice and audio configs
+            voice = request.voice_config.to_google_voice()
+            audio_config = request.audio_config.to_google_audio_config()
+
+            chunks = request.get_chunks()
+            synthesis_inputs = request.get_synthesis_inputs()
+            fingerprints = [fingerprint_chunk(chunk, request.is_ssml, request.voice_config, request.audio_config)
+                            for chunk in chunks]
+        cancel_token.raise_if_cancelled()
+
+        total = len(synthesis_inputs)
+        audio_format = request.audio_config.format
+        tracker = ProgressTracker([len(chunk) for chunk in chunks], self._throughput, self.MAX_PARALLEL_CHUNKS)
+        self._emit_progress(tracker, on_progress)
+
+        with metrics.timer("disk_write"):
+            if writer is None:
+                writer = self._service.open_audio_writer(request.output_path, audio_format)
+            else:
+                writer.open()
+        try:
+            with ThreadPoolExecutor(max_workers=min(self.MAX_PARALLEL_CHUNKS, total)) as executor:
+                in_flight = {}
+                held = {}  # finished chunks waiting for an earlier one
+                next_to_submit = 0
+                next_to_write = 0
+                last_audio = None
+
+                while next_to_write < total:
+                    # Keep a bounded window of chunks in flight
+                    while next_to_submit < total and len(in_flight) + len(held) < self.MAX_PARALLEL_CHUNKS:
+                        index = next_to_submit
+                        next_to_submit += 1
+
+                        resumed = self._load_stored_chunk(job_id, fingerprints[index])
+                        if resumed is not None:
+                            # Paid for earlier; not a throughput sample
+                            held[index] = resumed
+                            tracker.chunk_completed(index)
+                            if on_chunk:
+                                on_chunk(index, total, resumed, audio_format)
+                            continue
+
+                        tracker.chunk_started(index)
+                        future = submit_in_context(
+                            executor, self._synthesize_chunk, job_id, index, chunks[index], fingerprints[index],
+                            synthesis_inputs[index], voice, audio_config, cancel_token
+                        )
+                        in_flight[future] = index
+
+                    if in_flight:
+                        done, _ = wait(in_flight, timeout=self.PROGRESS_INTERVAL, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            index = in_flight.pop(future)
+                            held[index] = future.result()
+                            tracker.chunk_completed(index)
+                            if on_chunk:
+                                on_chunk(index, total, held[index], audio_format)
+
+                    while next_to_write in held:
+                        last_audio = held.pop(next_to_write)
+                        with metrics.timer("disk_write"):
+                            written = writer.write_chunk(last_audio)
+                        tracker.bytes_written(written)
+                        metrics.inc('tts_audio_bytes_total', written)
+                        next_to_write += 1
+
+                    self._emit_progress(tracker, on_progress)
+
+            cancel_token.raise_if_cancelled()
+            with metrics.timer("disk_write"):
+                writer.close()
+        except Exception:
+            writer.abort()
+            raise
+
+        self._emit_progress(tracker, on_progress)
+        return last_audio if total == 1 else None
+
+    def _synthesize_chunk(self, job_id: Optional[str], index: int, chunk: str, fingerprint: str,
+                          synthesis_input, voice, audio_config, cancel_token: CancellationToken) -> bytes:
+        """Synthesize one chunk and journal it once it is paid for"""
+        metrics = self._service.metrics
+        started = time.monotonic()
+        audio_content = self._service.synthesize_speech_with_input_type(
+            synthesis_input, voice, audio_config, cancel_token=cancel_token
+        )
+        seconds = time.monotonic() - started
+        metrics.inc('tts_characters_total', len(chunk))
+
+        with metrics.timer("post_processing"):
+            if self._journal is not None and job_id:
+                self._journal.store_chunk(job_id, fingerprint, index, audio_content,
+                                          characters=len(chunk), seconds=seconds)
+            if self._audio_cache is not None:
+                try:
+                    self._audio_cache.put(fingerprint, audio_content)
+                except OSError as e:
+                    # The cache only saves a later RPC; a full or unwritable disk must not fail the job
+                    logger.warning("Could not cache chunk audio: %s", e)
+        return audio_content
+
+    def _load_stored_chunk(self, job_id: Optional[str], fingerprint: str) -> Optional[bytes]:
+        """Get a chunk's audio from an earlier run of the job or the audio cache"""
+        if self._journal is not None and job_id:
+            audio_content = self._journal.load_chunk(job_id, fingerprint)
+            if audio_content is not None:
+                self._service.metrics.inc('tts_cache_hits_total', source="journal")
+                return audio_content
+        if self._audio_cache is not None:
+            audio_content = self._audio_cache.get(fingerprint)
+            if audio_content is not None:
+                self._service.metrics.inc('tts_cache_hits_total', source="cache")
+            return audio_content
+        return None
+
+    @staticmethod
+    def _emit_progress(tracker: ProgressTracker,
+                       on_progress: Optional[Callable[[ProgressSnapshot], None]]) -> None:
+        """Publish the tracker's current progress"""
+        if on_progress:
+            on_progress(tracker.snapshot())
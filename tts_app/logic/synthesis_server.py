@@ -0,0 +1,351 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Tuple
+from urllib.parse import urlparse, parse_qs
+import json
+import logging
+import math
+import threading
+
+from tts_app.models.tts_config import TTSRequest
+from tts_app.models.health_config import HealthState
+from tts_app.logic.tts_engine import TTSEngine
+from tts_app.logic.audio_writer import StreamAudioWriter
+from tts_app.logic.cancellation import CancellationToken, OperationCancelledError, DeadlineExceededError
+from tts_app.logic.structured_logging import correlation_scope
+
+logger = logging.getLogger(__name__)
+
+AUDIO_CONTENT_TYPES = {
+    'MP3': "audio/mpeg",
+    'WAV': "audio/wav",
+    'OGG': "audio/ogg"
+}
+
+class AdmissionController:
+    """Bounded number of syntheses running at once, with a bounded queue in front
+
+    Requests beyond the queue are refused immediately so clients can back
+    off, instead of piling up threads and memory on the server.
+    """
+
+    def __init__(self, max_workers: int = 4, max_queue: int = 16):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._running = 0
+        self._queued = 0
+        self._condition = threading.Condition()
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Take a worker slot, waiting in the queue if there is room; False when refused"""
+        with self._condition:
+            if self._running < self.max_workers:
+                self._running += 1
+                return True
+            if self._queued >= self.max_queue:
+                return False
+
+            self._queued += 1
+            try:
+                admitted = self._condition.wait_for(lambda: self._running < self.max_workers, timeout)
+                if admitted:
+                    self._running += 1
+                return admitted
+            finally:
+                self._queued -= 1
+
+    def release(self) -> None:
+        """Give a worker slot back"""
+        with self._condition:
+            self._running -= 1
+            self._condition.notify()
+
+    def metrics(self) -> dict:
+        """Current occupancy, for the health endpoint"""
+        with self._condition:
+            return {
+                'running': self._running,
+                'queued': self._queued,
+                'max_workers': self.max_workers,
+                'max_queue': self.max_queue
+            }
+
+class _ChunkedResponse:
+    """Binary stream that sends an HTTP/1.1 chunked response
+
+    Headers are only sent with the first chunk, so a request that fails
+    before producing audio can still get a proper error status.
+    """
+
+    def __init__(self, handler: BaseHTTPRequestHandler, content_type: str,
+                 cancel_token: CancellationToken):
+        self._handler = handler
+        self._content_type = content_type
+        self._cancel_token = cancel_token
+        self.started = False
+
+    def write(self, data) -> int:
+        """Send one chunk; a dropped client cancels the synthesis"""
+        if not data:
+            return 0
+        try:
+            self._start()
+            self._handler.wfile.write(f"{len(data):X}\r\n".encode("ascii"))
+            self._handler.wfile.write(data)
+            self._handler.wfile.write(b"\r\n")
+            self._handler.wfile.flush()
+        except OSError:
+            self._cancel_token.cancel()
+            raise
+        return len(data)
+
+    def flush(self) -> None:
+        """Chunks are flushed as they are written"""
+
+    def finish(self) -> None:
+        """Send the terminating chunk"""
+        self._start()
+        self._handler.wfile.write(b"0\r\n\r\n")
+        self._handler.wfile.flush()
+
+    def _start(self) -> None:
+        """Send the status line and headers once"""
+        if self.started:
+            return
+        self.started = True
+        self._handler.send_response(200)
+        self._handler.send_header("Content-Type", self._content_type)
+        self._handler.send_header("Transfer-Encoding", "chunked")
+        self._handler.end_headers()
+
+class _SynthesisRequestHandler(BaseHTTPRequestHandler):
+    """Routes HTTP requests to the synthesis server"""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "SpeechGenHTTP/1.0"
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        server = self.server.synthesis_server
+
+        if url.path == "/v1/health":
+            self._send_json(*server.health())
+        elif url.path == "/v1/languages":
+            self._send_json(*server.languages())
+        elif url.path == "/v1/voices":
+            language_code = query.get("language_code", [""])[0]
+            self._send_json(*server.voices(language_code))
+        elif url.path == "/v1/metrics":
+            self._send_json(200, server.engine.metrics.snapshot())
+        elif url.path == "/metrics":
+            self._send_text(200, server.engine.metrics.to_prometheus(), "text/plain; version=0.0.4")
+        else:
+            self._send_json(404, {'error': f"Unknown endpoint {url.path}"})
+
+    def do_POST(self) -> None:
+        url = urlparse(self.path)
+        server = self.server.synthesis_server
+
+        if url.path != "/v1/synthesize":
+            self._send_json(404, {'error': f"Unknown endpoint {url.path}"})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self.close_connection = True
+            self._send_json(400, {'error': "Invalid Content-Length"})
+            return
+        if length > server.MAX_BODY_BYTES:
+            self.close_connection = True
+            self._send_json(413, {'error': "Request body too large"})
+            return
+
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError as e:
+            self._send_json(400, {'error': f"Invalid JSON: {e}"})
+            return
+        if not isinstance(body, dict):
+            self._send_json(400, {'error': "Request body must be a JSON object"})
+            return
+
+        # Clients can pass their own request id to find the synthesis in the logs
+        with correlation_scope((self.headers.get("X-Request-ID") or "")[:64] or None):
+            server.synthesize(self, body)
+
+    def log_request(self, code="-", size="-") -> None:
+        """Log each response through the app's logging instead of stderr"""
+        logger.info('"%s" %s', self.requestline, code,
+                    extra={'client': self.client_address[0], 'status': getattr(code, "value", code)})
+
+    def log_message(self, format: str, *args) -> None:
+        """Log server errors through the app's logging instead of stderr"""
+        logger.warning("%s: " + format, self.client_address[0], *args)
+
+    def _send_json(self, status: int, payload, headers: Optional[dict] = None) -> None:
+        """Send a complete JSON response"""
+        self._send_text(status, json.dumps(payload), "application/json", headers)
+
+    def _send_text(self, status: int, text: str, content_type: str, headers: Optional[dict] = None) -> None:
+        """Send a complete text response"""
+        data = text.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+class _HTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server that knows its synthesis server"""
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], synthesis_server: 'SynthesisServer'):
+        super().__init__(address, _SynthesisRequestHandler)
+        self.synthesis_server = synthesis_server
+
+class SynthesisServer:
+    """Headless HTTP front end for the TTS engine
+
+    Endpoints:
+        POST /v1/synthesize  TTS request JSON (as saved by the app) -> streamed audio
+        GET  /v1/voices?language_code=xx  voice catalog of a language
+        GET  /v1/languages   available languages
+        GET  /v1/health      connectivity and load; 503 while the service is unreachable
+        GET  /v1/metrics     stage timings and counters as JSON
+        GET  /metrics        the same in the Prometheus text format
+
+    At most max_workers syntheses run at once and up to max_queue more wait
+    for a slot; anything beyond is answered 429 with Retry-After.
+    """
+
+    # Largest accepted request body
+    MAX_BODY_BYTES = 1024 * 1024
+
+    # Seconds a queued request waits for a worker before it is refused
+    QUEUE_TIMEOUT = 30.0
+
+    # Seconds clients are told to wait after a 429
+    RETRY_AFTER = 1
+
+    def __init__(self, engine: TTSEngine, host: str = "127.0.0.1", port: int = 8080,
+                 max_workers: int = 4, max_queue: int = 16):
+        self.engine = engine
+        self.tts_service = engine.service
+        self.admission = AdmissionController(max_workers, max_queue)
+        self._httpd = _HTTPServer((host, port), self)
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """Host and port the server is bound to"""
+        return self._httpd.server_address[:2]
+
+    def serve_forever(self) -> None:
+        """Handle requests until shutdown is called"""
+        self._httpd.serve_forever()
+
+    def shutdown(self) -> None:
+        """Stop serving and close the socket"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def health(self) -> Tuple[int, dict]:
+        """Status code and body of the health endpoint"""
+        status = self.tts_service.health_monitor.status
+        healthy = self.tts_service.is_available and status.state != HealthState.OFFLINE
+        payload = {
+            'status': "ok" if healthy else "unavailable",
+            'state': status.state.value,
+            'message': status.message,
+            'checked_at': status.checked_at,
+            'latency_ms': status.latency_ms,
+            'admission': self.admission.metrics(),
+            'coalesced_calls': self.tts_service.coalescer.total_saved
+        }
+        if self.tts_service.concurrency_limiter is not None:
+            payload['concurrency'] = self.tts_service.concurrency_limiter.metrics()
+        return (200 if healthy else 503), payload
+
+    def languages(self) -> Tuple[int, dict]:
+        """Status code and body of the languages endpoint"""
+        languages = self.engine.languages()
+        return 200, {'languages': [{'code': code, 'name': name} for code, name in languages]}
+
+    def voices(self, language_code: str) -> Tuple[int, dict]:
+        """Status code and body of the voices endpoint"""
+        if not language_code:
+            return 400, {'error': "language_code is required"}
+        voices = self.engine.voices_for(language_code)
+        return 200, {'voices': [voice.to_dict() for voice in voices]}
+
+    def synthesize(self, handler: _SynthesisRequestHandler, body: dict) -> None:
+        """Synthesize a request and stream its audio as it is produced"""
+        body.setdefault('output_path', "<stream>")
+        for name in ('voice_config', 'audio_config', 'ssml_config'):
+            value = body.get(name, {})
+            # Only SSML settings may be left out with null
+            if not isinstance(value, dict) and not (name == 'ssml_config' and value is None):
+                handler._send_json(400, {'error': f"Invalid request: {name} must be an object"})
+                return
+        try:
+            request = TTSRequest.from_dict(body)
+            # Fields of the wrong JSON type only fail once validation uses them
+            is_valid, error_msg = self.engine.validate(request)
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            handler._send_json(400, {'error': f"Invalid request: {e}"})
+            return
+        if not is_valid:
+            handler._send_json(400, {'error': error_msg})
+            return
+        if request.audio_config.format not in AUDIO_CONTENT_TYPES:
+            handler._send_json(400, {'error': f"Unsupported format {request.audio_config.format}"})
+            return
+        deadline_seconds = body.get('deadline_seconds')
+        if deadline_seconds is not None and (isinstance(deadline_seconds, bool)
+                                             or not isinstance(deadline_seconds, (int, float))
+                                             or not 0 < deadline_seconds < math.inf):
+            handler._send_json(400, {'error': "deadline_seconds must be a positive number"})
+            return
+
+        if not self.admission.acquire(self.QUEUE_TIMEOUT):
+            handler._send_json(429, {'error': "Server busy, retry later"},
+                               {'Retry-After': str(self.RETRY_AFTER)})
+            return
+
+        # Everything after admission is inside the try, so the slot is always given back
+        cancel_token = None
+        response = None
+        try:
+            cancel_token = CancellationToken(deadline_seconds)
+            response = _ChunkedResponse(handler, AUDIO_CONTENT_TYPES[request.audio_config.format], cancel_token)
+            writer = StreamAudioWriter(response, request.audio_config.format)
+            self.engine.synthesize(request, cancel_token=cancel_token, writer=writer)
+            response.finish()
+        except Exception as e:
+            if response is not None and response.started:
+                # The status line is gone; a cut-off body is all the client can be told
+                handler.close_connection = True
+            elif not isinstance(e, OSError):
+                handler._send_json(*self._error_response(e))
+        finally:
+            if cancel_token is not None:
+                # Also stops the deadline timer
+                cancel_token.cancel()
+            self.admission.release()
+
+    def _error_response(self, error: Exception) -> Tuple[int, dict]:
+        """Map a synthesis failure to a status code and body"""
+        if isinstance(error, ValueError):
+            return 400, {'error': str(error)}
+        if isinstance(error, DeadlineExceededError):
+            return 504, {'error': str(error)}
+        if isinstance(error, OperationCancelledError):
+            return 499, {'error': str(error)}
+        if not self.tts_service.is_available or \
+                self.tts_service.health_monitor.status.state == HealthState.OFFLINE:
+            return 503, {'error': str(error)}
+        return 502, {'error': str(error)}
@@ -0,0 +1,159 @@
+from typing import List
+import re
+import xml.etree.ElementTree as ET
+
+# Google TTS rejects synthesis inputs larger than 5000 bytes
+MAX_CHUNK_BYTES = 5000
+
+# Serialize SSML elements without an ns0: prefix
+SSML_NAMESPACE = "http://www.w3.org/2001/10/synthesis"
+ET.register_namespace("", SSML_NAMESPACE)
+
+class TextChunker:
+    """Splits long text or SSML documents into chunks the TTS API accepts"""
+
+    SENTENCE_PATTERN = re.compile(r'(?<=[.!?。！？])\s+')
+
+    def __init__(self, max_chunk_bytes: int = MAX_CHUNK_BYTES):
+        self.max_chunk_bytes = max_chunk_bytes
+
+    def split(self, content: str, is_ssml: bool = False) -> List[str]:
+        """Split content into chunks, preserving sentence or element boundaries"""
+        if not content.strip():
+            return []
+        if is_ssml:
+            return self.split_ssml(content)
+        return self.split_text(content)
+
+    def split_text(self, text: str) -> List[str]:
+        """Split plain text at sentence boundaries"""
+        text = text.strip()
+        if self._size(text) <= self.max_chunk_bytes:
+            return [text]
+
+        pieces = []
+        for sentence in self.SENTENCE_PATTERN.split(text):
+            if self._size(sentence) <= self.max_chunk_bytes:
+                pieces.append(sentence)
+            else:
+                pieces.extend(self._split_long_sentence(sentence))
+
+        return self._pack(pieces, " ")
+
+    def split_ssml(self, ssml_text: str) -> List[str]:
+        """Split an SSML document between top-level elements, rewrapping each chunk in its root element"""
+        ssml_text = ssml_text.strip()
+        if self._size(ssml_text) <= self.max_chunk_bytes:
+            return [ssml_text]
+
+        root = ET.fromstring(ssml_text)
+        # Elements in the root's namespace inherit it from the wrapper instead of each declaring it
+        namespace = root.tag[:root.tag.index("}") + 1] if root.tag.startswith("{") else ""
+        if namespace:
+            for element in root.iter():
+                if element is not root and element.tag.startswith(namespace):
+                    element.tag = element.tag[len(namespace):]
+
+        # Every chunk keeps the root's attributes, such as xml:lang and version
+        open_tag, close_tag = self._wrapper_tags(root)
+        budget = self.max_chunk_bytes - self._size(open_tag) - self._size(close_tag)
+        pieces = self._split_element_content(root, budget)
+
+        chunks = []
+        for body in self._pack(pieces, "", budget):
+            if body.strip():
+                chunks.append(f"{open_tag}{body}{close_tag}")
+        return chunks
+
+    def _split_element_content(self, element: ET.Element, budget: int) -> List[str]:
+        """Serialize the children of an element into pieces that fit the budget"""
+        pieces = []
+        if element.text:
+            pieces.extend(self._escape_pieces(element.text, budget))
+
+        for child in element:
+            tail = child.tail
+            child.tail = None
+            markup = ET.tostring(child, encoding="unicode")
+
+            if self._size(markup) <= budget:
+                pieces.append(markup)
+            elif len(child) or (child.text and child.text.strip()):
+                # Too large on its own: split inside it and repeat the wrapper tag
+                open_tag, close_tag = self._wrapper_tags(child)
+                inner_budget = budget - self._size(open_tag) - self._size(close_tag)
+                for inner in self._pack(self._split_element_content(child, inner_budget), "", inner_budget):
+                    pieces.append(f"{open_tag}{inner}{close_tag}")
+            else:
+                pieces.append(markup)
+
+            if tail:
+                pieces.extend(self._escape_pieces(tail, budget))
+
+        return pieces
+
+    def _escape_pieces(self, text: str, budget: int) -> List[str]:
+        """Escape raw text found inside SSML and split it to fit the budget
+
+        Whitespace around the text is kept as one space, since the pieces are
+        packed next to elements without a separator and words would run together.
+        """
+        escaped = text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+        leading = " " if escaped[:1].isspace() else ""
+        trailing = " " if escaped[-1:].isspace() else ""
+        if not escaped.strip():
+            return [" "]
+
+        pieces = TextChunker(budget - len(leading) - len(trailing)).split_text(escaped)
+        pieces[0] = leading + pieces[0]
+        pieces[-1] = pieces[-1] + trailing
+        return pieces
+
+    def _wrapper_tags(self, element: ET.Element) -> tuple:
+        """Get the opening and closing tags of an element"""
+        shell = ET.Element(element.tag, element.attrib)
+        shell.text = "\x00"
+        open_tag, close_tag = ET.tostring(shell, encoding="unicode").split("\x00")
+        return open_tag, close_tag
+
+    def _split_long_sentence(self, sentence: str) -> List[str]:
+        """Split a sentence that exceeds the limit at word boundaries"""
+        pieces = []
+        for word in sentence.split():
+            while self._size(word) > self.max_chunk_bytes:
+                cut = self._byte_safe_cut(word, self.max_chunk_bytes)
+                pieces.append(word[:cut])
+                word = word[cut:]
+            pieces.append(word)
+        return self._pack(pieces, " ")
+
+    def _pack(self, pieces: List[str], separator: str, budget: int = None) -> List[str]:
+        """Greedily combine pieces into chunks no larger than the budget"""
+        if budget is None:
+            budget = self.max_chunk_bytes
+
+        chunks = []
+        current = ""
+        for piece in pieces:
+            candidate = f"{current}{separator}{piece}" if current else piece
+            if self._size(candidate) <= budget:
+                current = candidate
+            else:
+                if current:
+                    chunks.append(current)
+                current = piece
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def _byte_safe_cut(self, text: str, max_bytes: int) -> int:
+        """Find the largest character index whose prefix fits in max_bytes"""
+        cut = min(len(text), max_bytes)
+        while cut > 1 and self._size(text[:cut]) > max_bytes:
+            cut -= 1
+        return cut
+
+    @staticmethod
+    def _size(text: str) -> int:
+        """Size of text as counted by the API (UTF-8 bytes)"""
+        return len(text.encode("utf-8"))
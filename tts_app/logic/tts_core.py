@@ -3,9 +3,14 @@ import sys
 import os
 
 import google.cloud.texttospeech as tts
-from google.oauth2 import service_account
 import langcodes
 
+from tts_app.logic.grpc_transport import shared_transport
+
+def get_client(credentials_path=None):
+    # Same tuned, process-wide channels TTSServiceManager uses
+    return shared_transport().get_clients(credentials_path or None)[0]
+
 def unique_languages_from_voices(voices: Sequence[tts.Voice]):
     language_set = set()
     for voice in voices:
@@ -14,17 +19,16 @@ def unique_languages_from_voices(voices: Sequence[tts.Voice]):
     return language_set
 
 def list_languages():
-    client = tts.TextToSpeechClient()
+    client = get_client()
     response = client.list_voices()
     languages = unique_languages_from_voices(response.voices)
-    print(len)
     print(f" Languages: {len(languages)} ".center(60, "-"))
     for i, language in enumerate(sorted(languages)):
         lan = langcodes.get(language).display_name()
         print(f"{lan}", end="\n" if i % 5 == 4 else "")
 
 def list_voices(language_code=None):
-    client = tts.TextToSpeechClient()
+    client = get_client()
     response = client.list_voices(language_code=language_code)
     voices = sorted(response.voices, key=lambda voice: voice.name)
 
@@ -47,7 +51,6 @@ def get_writable_output_path(filename):
 def text_to_wav(voice_name: str, text: str, ttsFilePath:str, filename:str=None):
     try:
         gcloud_config_path = os.path.expanduser(ttsFilePath)
-        os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = gcloud_config_path
         
         language_code = "-".join(voice_name.split("-")[:2])
         text_input = tts.SynthesisInput(text=text)
@@ -55,7 +58,7 @@ def text_to_wav(voice_name: str, text: str, ttsFilePath:str, filename:str=None):
             language_code=language_code, name=voice_name
         )
         audio_config = tts.AudioConfig(audio_encoding=tts.AudioEncoding.LINEAR16)
-        client = tts.TextToSpeechClient()
+        client = get_client(gcloud_config_path)
         response = client.synthesize_speech(
             input=text_input,
             voice=voice_params,
@@ -71,6 +74,3 @@ def text_to_wav(voice_name: str, text: str, ttsFilePath:str, filename:str=None):
     
     except Exception as e:
         return (0, e)
-
-## Tests:
-list_languages()
@@ -0,0 +1,104 @@
+from typing import BinaryIO, Callable, List, Optional, Tuple
+
+from tts_app.models.tts_config import TTSRequest
+from tts_app.models.job_config import ProgressSnapshot
+from tts_app.models.health_config import HealthStatus
+from tts_app.logic.tts_service_manager import TTSServiceManager
+from tts_app.logic.voice_data_manager import VoiceDataManager, VoiceInfo
+from tts_app.logic.synthesis_pipeline import SynthesisPipeline
+from tts_app.logic.progress_tracker import ThroughputEstimator
+from tts_app.logic.audio_writer import StreamingAudioWriter, StreamAudioWriter
+from tts_app.logic.cancellation import CancellationToken
+from tts_app.logic.job_journal import JobJournal
+from tts_app.logic.audio_cache import AudioCache
+from tts_app.logic.metrics import MetricsRegistry
+
+class TTSEngine:
+    """Headless TTS engine: request validation, synthesis, caching and output writing
+
+    Has no Qt dependency, so servers, scripts and the command line use it
+    directly; the GUI's job scheduler and worker threads are thin adapters
+    over it. One engine is shared by all callers in a process so they pool
+    connections, concurrency limits and cached audio.
+    """
+
+    def __init__(self, tts_service: Optional[TTSServiceManager] = None,
+                 journal: Optional[JobJournal] = None,
+                 audio_cache: Optional[AudioCache] = None,
+                 catalog_path: Optional[str] = None):
+        self.service = tts_service or TTSServiceManager()
+        self.voices = VoiceDataManager(self.service, catalog_path)
+        self.journal = journal
+        self.audio_cache = audio_cache
+        # Observed synthesis speed, shared so new jobs get an ETA before their first chunk lands
+        self.throughput = ThroughputEstimator()
+        self._pipeline = SynthesisPipeline(self.service, self.throughput, journal, audio_cache)
+
+    def initialize(self, credentials_paths: Optional[List[str]] = None,
+                   requests_per_minute: Optional[float] = None,
+                   fake_latency: Optional[float] = None) -> Tuple[bool, str]:
+        """Connect to Google with the given service accounts or the environment's
+
+        With fake_latency, the offline fake backend answers after that many seconds instead.
+        """
+        if fake_latency is not None:
+            return self.service.initialize_fake(fake_latency)
+        if credentials_paths:
+            return self.service.initialize_with_credential_pool(credentials_paths, requests_per_minute)
+        return self.service.initialize_default()
+
+    @property
+    def is_available(self) -> bool:
+        """Check if the engine can synthesize"""
+        return self.service.is_available
+
+    @property
+    def metrics(self) -> MetricsRegistry:
+        """Stage timings and counters of everything this engine synthesized"""
+        return self.service.metrics
+
+    def health(self) -> HealthStatus:
+        """Last known connectivity, without any network activity"""
+        return self.service.health_monitor.status
+
+    def validate(self, request: TTSRequest) -> Tuple[bool, Optional[str]]:
+        """Validate a request without synthesizing it"""
+        return request.is_valid()
+
+    def is_cached(self, request: TTSRequest) -> bool:
+        """Check if every chunk of a request can be served without the network"""
+        return self.audio_cache is not None and self.audio_cache.covers(request)
+
+    def synthesize(self, request: TTSRequest, job_id: Optional[str] = None,
+                   cancel_token: Optional[CancellationToken] = None,
+                   on_progress: Optional[Callable[[ProgressSnapshot], None]] = None,
+                   on_chunk: Optional[Callable[[int, int, bytes, str], None]] = None,
+                   writer: Optional[StreamingAudioWriter] = None) -> Optional[bytes]:
+        """Synthesize a request to its output path, or to writer when given
+
+        Raises ValueError for invalid requests. See SynthesisPipeline.run.
+        """
+        return self._pipeline.run(request, job_id=job_id, cancel_token=cancel_token,
+                                  on_progress=on_progress, on_chunk=on_chunk, writer=writer)
+
+    def synthesize_to_stream(self, request: TTSRequest, stream: BinaryIO,
+                             cancel_token: Optional[CancellationToken] = None) -> None:
+        """Synthesize a request into a binary stream, writing audio as it is produced"""
+        self.synthesize(request, cancel_token=cancel_token,
+                        writer=StreamAudioWriter(stream, request.audio_config.format))
+
+    def languages(self) -> List[Tuple[str, str]]:
+        """Available (language code, display name) pairs"""
+        return self.voices.get_available_languages()
+
+    def voices_for(self, language_code: str) -> List[VoiceInfo]:
+        """Available voices of a language"""
+        return self.voices.get_voices_for_language(language_code)
+
+    def start(self) -> None:
+        """Start background connectivity tracking"""
+        self.service.health_monitor.start()
+
+    def close(self) -> None:
+        """Stop background work"""
+        self.service.health_monitor.stop()
@@ -1,31 +1,89 @@
 from google.cloud import texttospeech
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from typing import Optional, List
-import os
+import hashlib
+import logging
+import threading
+import time
+import grpc
+
+from tts_app.logic.audio_writer import StreamingAudioWriter, FsyncPolicy
+from tts_app.logic.cancellation import CancellationToken, OperationCancelledError, DeadlineExceededError
+from tts_app.logic.credential_pool import CredentialPool
+from tts_app.logic.grpc_transport import shared_transport
+from tts_app.logic.health_monitor import HealthMonitor
+from tts_app.logic.fake_tts_backend import fake_client_factory
+from tts_app.models.settings_config import TransportConfig
+from tts_app.models.health_config import HealthState
+from tts_app.logic.hedging import HedgePolicy, LatencyTracker
+from tts_app.logic.concurrency_controller import AdaptiveConcurrencyLimiter
+from tts_app.logic.request_coalescer import RequestCoalescer
+from tts_app.logic.metrics import MetricsRegistry
+from tts_app.logic.rpc_errors import is_deadline_error, is_quota_error, is_credential_error
+from tts_app.logic.structured_logging import submit_in_context
+
+logger = logging.getLogger(__name__)
 
 class TTSServiceManager:
     """Logic manager for Google Text-to-Speech operations"""
     
+    # Calls in flight the adaptive limiter allows before it has measured anything
+    INITIAL_CONCURRENCY_LIMIT = 8
+    
     def __init__(self):
         self._client: Optional[texttospeech.TextToSpeechClient] = None
+        self._pool: Optional[CredentialPool] = None
         self._credentials_path: Optional[str] = None
         self._is_initialized = False
+        self.fsync_policy = FsyncPolicy.ON_CLOSE
+        # Channel settings; clients for the same settings are shared process-wide
+        self.transport_config = TransportConfig()
+        # Duplicate calls that outlive recent tail latency; None disables hedging
+        self.hedge_policy: Optional[HedgePolicy] = None
+        self._latency = LatencyTracker()
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+        self._hedge_lock = threading.Lock()
+        # Adapts calls in flight to what the service currently sustains
+        self.concurrency_limiter = AdaptiveConcurrencyLimiter(initial_limit=self.INITIAL_CONCURRENCY_LIMIT)
+        # Identical requests in flight at the same time share one call; its
+        # threads never need to outnumber the calls the limiter lets through
+        self.coalescer = RequestCoalescer(max_workers=self.concurrency_limiter.max_limit)
+        # Background connectivity tracking; started by long-lived owners
+        self.health_monitor = HealthMonitor(self._health_channel)
+        # Stage timings and counters of every synthesis through this manager
+        self.metrics = MetricsRegistry()
+        self.metrics.register_gauge('tts_concurrency_limit', lambda: self.concurrency_limiter.limit)
+        self.metrics.register_gauge('tts_rpcs_in_flight', lambda: self.concurrency_limiter.in_flight)
+        self.metrics.register_gauge('tts_coalesced_calls', lambda: self.coalescer.total_saved)
     
-    # TODO: Combine with below one
-    def initialize_with_credentials(self, credentials_path: str) -> tuple[bool, str]:
+    def initialize_with_credentials(self, credentials_path: str,
+                                    requests_per_minute: Optional[float] = None) -> tuple[bool, str]:
         """Initialize TTS client with specific credentials"""
+        return self.initialize_with_credential_pool([credentials_path], requests_per_minute)
+    
+    def initialize_with_credential_pool(self, credentials_paths: List[str],
+                                        requests_per_minute: Optional[float] = None) -> tuple[bool, str]:
+        """Initialize TTS clients for one or more service accounts
+
+        Credentials are passed to each client explicitly, so several accounts
+        can be used side by side and synthesis is load-balanced across them.
+        """
         try:
-            # Set environment variable for Google credentials
-            os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = credentials_path
+            pool = CredentialPool(credentials_paths, requests_per_minute, self._client_factory)
             
-            # Create new client
-            self._client = texttospeech.TextToSpeechClient()
-            self._credentials_path = credentials_path
+            self._pool = pool
+            self._client = pool.primary_client
+            self._credentials_path = pool.credentials_paths[0]
             self._is_initialized = True
+            self.health_monitor.request_check()
 
+            if pool.size > 1:
+                return True, f"TTS service initialized with {pool.size} service accounts"
             return True, "TTS service initialized successfully"
             
         except Exception as e:
             self._client = None
+            self._pool = None
             self._credentials_path = None
             self._is_initialized = False
             return False, f"Failed to initialize TTS service: {str(e)}"
@@ -33,15 +91,32 @@ class TTSServiceManager:
     def initialize_default(self) -> tuple[bool, str]:
         """Initialize with default credentials (environment variable)"""
         try:
-            self._client = texttospeech.TextToSpeechClient()
+            self._pool = CredentialPool([None], client_factory=self._client_factory)
+            self._client = self._pool.primary_client
             self._is_initialized = True
+            self.health_monitor.request_check()
             
             return True, "TTS service initialized with default credentials"
         except Exception as e:
             self._client = None
+            self._pool = None
             self._is_initialized = False
             return False, f"Failed to initialize with default credentials: {str(e)}"
     
+    def initialize_fake(self, latency: float = 0.2) -> tuple[bool, str]:
+        """Initialize with an offline fake backend that answers with silence"""
+        self._pool = CredentialPool([None], client_factory=fake_client_factory(latency))
+        self._client = self._pool.primary_client
+        self._credentials_path = None
+        self._is_initialized = True
+        # There is no channel to watch, so the fake is always reachable
+        self.health_monitor.record_success()
+        return True, "TTS service initialized with the fake backend"
+    
+    def _client_factory(self, credentials_path: Optional[str]) -> List[texttospeech.TextToSpeechClient]:
+        """Get the shared clients for one account under the current transport settings"""
+        return shared_transport().get_clients(credentials_path, self.transport_config)
+    
     @property
     def is_available(self) -> bool:
         """Check if the TTS service is available"""
@@ -52,18 +127,44 @@ class TTSServiceManager:
         """Get current credentials path"""
         return self._credentials_path
     
-    def test_connection(self) -> tuple[bool, str]:
-        """Test the TTS service connection"""
+    @property
+    def credential_pool(self) -> Optional[CredentialPool]:
+        """Get the pool of service accounts, if initialized from key files"""
+        return self._pool
+    
+    @property
+    def latency(self) -> LatencyTracker:
+        """Recent latencies of successful synthesis calls"""
+        return self._latency
+    
+    def _health_channel(self) -> Optional[grpc.Channel]:
+        """Channel of the primary client, watched by the health monitor"""
+        if not self.is_available:
+            return None
+        return getattr(self._client.transport, "grpc_channel", None)
+    
+    def test_connection(self, force: bool = False) -> tuple[bool, str]:
+        """Test the TTS service connection
+
+        Returns the health monitor's cached status. When it is stale or offline
+        and the monitor is running, the monitor probes again in the background
+        and listeners hear of any change, so callers on the UI thread never
+        wait for a probe. Otherwise, when never checked, or when forced, probes
+        the channel here without downloading anything.
+        """
         if not self.is_available:
             return False, "TTS service not initialized"
         
-        try:
-            # Try to list voices as a connection test
-            voices = self._client.list_voices(timeout=2)
-            voice_count = len(voices.voices)
-            return True, f"Connection successful. {voice_count} voices available."
-        except Exception as e:
-            return False, f"Connection failed: {str(e)}"
+        monitor = self.health_monitor
+        status = monitor.status
+        if force or status.state == HealthState.UNKNOWN:
+            status = monitor.check_now()
+        elif not status.is_online or status.age_seconds > monitor.interval:
+            if monitor.is_running:
+                monitor.request_check()
+            else:
+                status = monitor.check_now()
+        return status.is_online, status.message
     
     def get_available_voices(self, language_code: str = None) -> List:
         """Get available voices for a language"""
@@ -81,24 +182,212 @@ class TTSServiceManager:
     
     def synthesize_speech_with_input_type(self, synthesis_input: texttospeech.SynthesisInput,
                                    voice: texttospeech.VoiceSelectionParams, 
-                                   audio_config: texttospeech.AudioConfig) -> bytes:
-        """Synthesize speech from synthesis input (supports both text and SSML)"""
+                                   audio_config: texttospeech.AudioConfig,
+                                   timeout: Optional[float] = None,
+                                   cancel_token: Optional[CancellationToken] = None) -> bytes:
+        """Synthesize speech from synthesis input (supports both text and SSML)
+        
+        The caller stops waiting once the timeout passes or its cancel token
+        fires; the RPC itself is aborted once no caller waits for it. With a hedge policy, a call that runs
+        past recent tail latency is duplicated and the slower copy cancelled.
+        A request identical to one already in flight waits for that call's
+        result instead of issuing its own.
+        """
         if not self.is_available:
             raise RuntimeError("TTS service is not available")
         
-        response = self._client.synthesize_speech(
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+            remaining = cancel_token.remaining_time()
+            if remaining is not None:
+                timeout = remaining if timeout is None else min(timeout, remaining)
+        
+        request = texttospeech.SynthesizeSpeechRequest(
             input=synthesis_input,
             voice=voice,
             audio_config=audio_config
         )
         
+        submitted = time.monotonic()
+        
+        def shared_call(token: CancellationToken) -> texttospeech.SynthesizeSpeechResponse:
+            # Time spent waiting for a coalescer thread counts as queueing
+            self.metrics.observe('tts_stage_seconds', time.monotonic() - submitted, stage="queue_wait")
+            # No deadline of its own: the coalescer cancels the token once every caller gave up
+            return self._synthesize_hedged(request, None, token)
+        
+        try:
+            response = self.coalescer.call(
+                self._request_key(request),
+                shared_call,
+                label=self._request_label(request),
+                timeout=timeout,
+                cancel_token=cancel_token
+            )
+        except grpc.FutureCancelledError:
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+            raise OperationCancelledError("Synthesis was cancelled")
+        except Exception as e:
+            if is_deadline_error(e):
+                raise DeadlineExceededError("Synthesis deadline exceeded") from e
+            if cancel_token is not None and cancel_token.is_cancelled:
+                cancel_token.raise_if_cancelled()
+            raise
+        
         return response.audio_content
     
+    @staticmethod
+    def _request_key(request: texttospeech.SynthesizeSpeechRequest) -> str:
+        """Key identifying requests that produce the same audio"""
+        serialized = texttospeech.SynthesizeSpeechRequest.serialize(request)
+        return hashlib.sha256(serialized).hexdigest()
+    
+    @staticmethod
+    def _request_label(request: texttospeech.SynthesizeSpeechRequest) -> str:
+        """Short human-readable description of a request"""
+        text = request.input.text or request.input.ssml
+        voice = request.voice.name or request.voice.language_code
+        return f"{voice}: {text[:40]}"
+    
+    def _synthesize_hedged(self, request: texttospeech.SynthesizeSpeechRequest,
+                           timeout: Optional[float],
+                           cancel_token: Optional[CancellationToken]) -> texttospeech.SynthesizeSpeechResponse:
+        """Issue the synthesize RPC, racing a duplicate if it is slower than usual"""
+        policy = self.hedge_policy
+        delay = policy.hedge_delay(self._latency) if policy is not None else None
+        if policy is not None:
+            policy.record_primary()
+        
+        if delay is None or (timeout is not None and delay >= timeout):
+            return self._timed_synthesize(request, timeout, cancel_token)
+        
+        parent = cancel_token or CancellationToken()
+        tokens = {}
+        
+        def start_attempt():
+            token = parent.child()
+            future = submit_in_context(self._get_hedge_executor(), self._timed_synthesize, request, timeout, token)
+            tokens[future] = token
+            return future
+        
+        try:
+            pending = {start_attempt()}
+            done, pending = wait(pending, timeout=delay)
+            if not done and policy.try_hedge():
+                self.metrics.inc('tts_retries_total', kind="hedge")
+                logger.debug("Hedging a call slower than %.2fs", delay)
+                pending.add(start_attempt())
+            
+            # Take the first attempt that succeeds; fail only once all have failed
+            error = None
+            while True:
+                for future in done:
+                    if future.exception() is None:
+                        return future.result()
+                    error = error or future.exception()
+                if not pending:
+                    raise error
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        finally:
+            for token in tokens.values():
+                token.cancel()
+                parent.remove_callback(token.cancel)
+    
+    def _timed_synthesize(self, request: texttospeech.SynthesizeSpeechRequest,
+                          timeout: Optional[float],
+                          cancel_token: Optional[CancellationToken]) -> texttospeech.SynthesizeSpeechResponse:
+        """Issue the synthesize RPC under the concurrency limit and record its latency"""
+        limiter = self.concurrency_limiter
+        if limiter is not None:
+            with self.metrics.timer("queue_wait"):
+                limiter.acquire(cancel_token)
+        
+        started = time.monotonic()
+        try:
+            response = self._synthesize_pooled(request, timeout, cancel_token)
+        except Exception as e:
+            if limiter is not None:
+                limiter.release(time.monotonic() - started, e)
+            if self._is_abandoned(e, cancel_token):
+                # Cancelled on purpose, like a hedge that lost the race; the service did nothing wrong
+                self.metrics.inc('tts_rpcs_cancelled_total')
+                raise
+            self.health_monitor.record_failure(e)
+            self.metrics.inc('tts_rpc_errors_total')
+            raise
+        
+        latency = time.monotonic() - started
+        self._latency.record(latency)
+        self.health_monitor.record_success()
+        if limiter is not None:
+            limiter.release(latency)
+        return response
+    
+    @staticmethod
+    def _is_abandoned(error: Exception, cancel_token: Optional[CancellationToken]) -> bool:
+        """Check if a call failed only because its own token cancelled it"""
+        return (cancel_token is not None and cancel_token.is_cancelled and not cancel_token.is_expired
+                and isinstance(error, (grpc.FutureCancelledError, OperationCancelledError)))
+    
+    def _get_hedge_executor(self) -> ThreadPoolExecutor:
+        """Threads that run hedged attempts, created on first use"""
+        with self._hedge_lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="tts-hedge")
+            return self._hedge_executor
+    
+    def _synthesize_pooled(self, request: texttospeech.SynthesizeSpeechRequest,
+                           timeout: Optional[float],
+                           cancel_token: Optional[CancellationToken]) -> texttospeech.SynthesizeSpeechResponse:
+        """Issue the synthesize RPC on a pooled account, moving to another if this one is exhausted"""
+        if self._pool is None:
+            return self._call_synthesize(self._client, request, timeout, cancel_token)
+        
+        tried = set()
+        while True:
+            with self.metrics.timer("rate_limit_wait"):
+                member = self._pool.acquire(timeout, cancel_token, exclude=tried)
+            try:
+                response = self._call_synthesize(member.client, request, timeout, cancel_token)
+            except Exception as e:
+                self._pool.release(member, e)
+                tried.add(member.credentials_path)
+                # Quota and credential errors belong to the account, not the request
+                if (is_quota_error(e) or is_credential_error(e)) and len(tried) < self._pool.size:
+                    self.metrics.inc('tts_retries_total', kind="account_failover")
+                    logger.warning("Retrying on another service account after: %s", e)
+                    continue
+                raise
+            self._pool.release(member)
+            return response
+    
+    def _call_synthesize(self, client: texttospeech.TextToSpeechClient,
+                         request: texttospeech.SynthesizeSpeechRequest,
+                         timeout: Optional[float],
+                         cancel_token: Optional[CancellationToken]) -> texttospeech.SynthesizeSpeechResponse:
+        """Issue the synthesize RPC, through a cancellable future when possible"""
+        self.metrics.inc('tts_rpcs_total')
+        stub = getattr(client.transport, "synthesize_speech", None)
+        with self.metrics.timer("rpc"):
+            if cancel_token is None or not hasattr(stub, "future"):
+                return client.synthesize_speech(request=request, timeout=timeout)
+            
+            call = stub.future(request, timeout=timeout)
+            cancel_token.add_callback(call.cancel)
+            try:
+                return call.result()
+            finally:
+                cancel_token.remove_callback(call.cancel)
+    
+    def open_audio_writer(self, output_path: str, audio_format: str = None) -> StreamingAudioWriter:
+        """Open a streaming writer that accepts audio chunks incrementally"""
+        if audio_format is None:
+            audio_format = StreamingAudioWriter.format_for_path(output_path)
+        writer = StreamingAudioWriter(output_path, audio_format, self.fsync_policy)
+        return writer.open()
+    
     def save_audio(self, audio_content: bytes, output_path: str) -> None:
         """Save audio content to file"""
-        directory = os.path.dirname(output_path)
-        if directory and not os.path.exists(directory):
-            os.makedirs(directory)
-        
-        with open(output_path, "wb") as out:
-            out.write(audio_content)
+        with self.open_audio_writer(output_path) as writer:
+            writer.write_chunk(audio_content)
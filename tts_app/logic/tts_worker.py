@@ -1,51 +1,66 @@
 from PyQt5.QtCore import QThread, pyqtSignal
-from models.tts_config import TTSRequest
-from logic.tts_service_manager import TTSServiceManager
+from typing import Optional
+from tts_app.models.tts_config import TTSRequest
+from tts_app.logic.tts_engine import TTSEngine
+from tts_app.logic.cancellation import CancellationToken, OperationCancelledError
 
 class TTSWorker(QThread):
-    """Worker thread for TTS conversion to prevent UI blocking"""
-    
+    """Worker thread for TTS conversion to prevent UI blocking
+
+    Runs one request on the headless engine and relays its callbacks as signals.
+    """
+
     # Signals
     progress_updated = pyqtSignal(int)
+    progress_detail = pyqtSignal(object)   # ProgressSnapshot
     conversion_finished = pyqtSignal(str)  # output_path
     conversion_failed = pyqtSignal(str)    # error_message
-    
-    def __init__(self, tts_request: TTSRequest, tts_service: TTSServiceManager):
+    conversion_cancelled = pyqtSignal(str) # reason
+    audio_ready = pyqtSignal(bytes, str)   # audio_content, audio_format
+    chunk_ready = pyqtSignal(int, int, bytes, str)  # index, total, audio_content, audio_format
+
+    def __init__(self, tts_request: TTSRequest, engine: TTSEngine,
+                 cancel_token: Optional[CancellationToken] = None,
+                 job_id: Optional[str] = None):
         super().__init__()
         self._request = tts_request
-        self._service = tts_service
+        self._engine = engine
+        self._cancel_token = cancel_token or CancellationToken()
+        self._job_id = job_id
+
+    @property
+    def cancel_token(self) -> CancellationToken:
+        """Token that cancels this conversion"""
+        return self._cancel_token
+
+    def cancel(self) -> None:
+        """Abort the conversion, including any RPC in flight"""
+        self._cancel_token.cancel()
 
     def run(self) -> None:
         """Execute the TTS conversion"""
         try:
-            # Validate request
-            is_valid, error_msg = self._request.is_valid()
-            if not is_valid:
-                self.conversion_failed.emit(error_msg)
-                return
-            
-            self.progress_updated.emit(25)
-            
-            # Convert voice and audio configs
-            voice = self._request.voice_config.to_google_voice()
-            audio_config = self._request.audio_config.to_google_audio_config()
-            
-            self.progress_updated.emit(50)
-            
-            synthesis_input = self._request.get_synthesis_input()
-                        
-            # Synthesize speech
-            audio_content = self._service.synthesize_speech_with_input_type(
-                synthesis_input, voice, audio_config
+            audio_content = self._engine.synthesize(
+                self._request, job_id=self._job_id, cancel_token=self._cancel_token,
+                on_progress=self._emit_progress, on_chunk=self.chunk_ready.emit
             )
-            
-            self.progress_updated.emit(75)
-            
-            # Save audio file
-            self._service.save_audio(audio_content, self._request.output_path)
-            
-            self.progress_updated.emit(100)
+
+            if audio_content is not None:
+                self.audio_ready.emit(audio_content, self._request.audio_config.format)
             self.conversion_finished.emit(self._request.output_path)
-            
+
+        except OperationCancelledError as e:
+            self.conversion_cancelled.emit(str(e))
         except Exception as e:
-            self.conversion_failed.emit(str(e))
+            if self._cancel_token.is_cancelled:
+                self.conversion_cancelled.emit(str(e))
+            else:
+                self.conversion_failed.emit(str(e))
+        finally:
+            # Nothing is left for the deadline to cancel
+            self._cancel_token.close()
+
+    def _emit_progress(self, snapshot) -> None:
+        """Publish the pipeline's current progress"""
+        self.progress_detail.emit(snapshot)
+        self.progress_updated.emit(snapshot.percent)
@@ -1,8 +1,15 @@
-from google.cloud import texttospeech
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
+import json
+import logging
+import os
+import time
 import langcodes
 
+from tts_app.models.health_config import HealthState
+
+logger = logging.getLogger(__name__)
+
 @dataclass
 class VoiceInfo:
     """Information about a TTS voice"""
@@ -11,23 +18,50 @@ class VoiceInfo:
     gender: str
     voice_type: str  # Chirp3-HD, WaveNet, Studio, Standard, Neural2, Polyglot
     display_name: str
+    
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization"""
+        return asdict(self)
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'VoiceInfo':
+        """Create from dictionary"""
+        return cls(
+            name=data['name'],
+            language_code=data['language_code'],
+            gender=data.get('gender', ""),
+            voice_type=data.get('voice_type', "Standard"),
+            display_name=data.get('display_name', data['name'])
+        )
 
 class VoiceDataManager:
-    """Logic manager for fetching and managing voice data from Google TTS"""
+    """Logic manager for fetching and managing voice data from Google TTS
+    
+    Fetched voices are persisted to a local catalog, which is served instead
+    of the API while the service is offline.
+    """
     
-    def __init__(self, tts_service_manager):
+    def __init__(self, tts_service_manager, catalog_path: Optional[str] = None):
         self.tts_service = tts_service_manager
+        self.catalog_path = catalog_path
         self._languages_cache: Optional[List[Tuple[str, str]]] = None
         self._voices_cache: Dict[str, List[VoiceInfo]] = {}
+        self._catalog_complete = False  # every language's voices are cached
+    
+    @property
+    def is_offline(self) -> bool:
+        """Check if voice data has to come from the local catalog"""
+        return (not self.tts_service.is_available
+                or self.tts_service.health_monitor.status.state == HealthState.OFFLINE)
     
     def get_available_languages(self) -> List[Tuple[str, str]]:
         """Get list of available languages from Google TTS"""
-        if not self.tts_service.is_available:
-            return []
-        
         if self._languages_cache is not None:
             return self._languages_cache
         
+        if self.is_offline:
+            return self._load_catalog()
+        
         try:
             # Get all voices to extract unique languages
             voices = self.tts_service.get_available_voices()
@@ -37,71 +71,159 @@ class VoiceDataManager:
             for voice in voices:
                 language_set.add(voice.language_codes[0])
             
-            # Create language list with display names
-            languages = []
-            for lang_code in sorted(language_set):
-                display_name = langcodes.get(lang_code).display_name()
-                languages.append((lang_code, display_name))
-            
+            languages = self._language_list(language_set)
             self._languages_cache = languages
+            self._save_catalog()
             return languages
             
         except Exception as e:
-            print(f"Failed to fetch languages from Google TTS: {e}")
-            return []
+            logger.warning("Failed to fetch languages from Google TTS: %s", e)
+            return self._load_catalog()
     
     def get_voices_for_language(self, language_code: str) -> List[VoiceInfo]:
         """Get available voices for a specific language"""
-        if not self.tts_service.is_available:
-            return []
-        
         # Check cache first
         if language_code in self._voices_cache:
             return self._voices_cache[language_code]
         
+        if self.is_offline:
+            self._load_catalog()
+            return self._voices_cache.get(language_code, [])
+        
         try:
             # Get voices for specific language
             voices = self.tts_service.get_available_voices(language_code)
             
-            voice_infos = []
-            for voice in voices:
-                # Extract voice type from name (e.g., "en-US-Wavenet-A" -> "Wavenet")
-                voice_type = self._extract_voice_type(voice.name)
-                
-                # Create display name
-                display_name = self._create_voice_display_name(voice.name)
-                
-                voice_info = VoiceInfo(
-                    name=voice.name,
-                    language_code=voice.language_codes[0],
-                    gender=voice.ssml_gender.name,
-                    voice_type=voice_type,
-                    display_name=display_name
-                )
-                voice_infos.append(voice_info)
+            voice_infos = [self._voice_info(voice) for voice in voices]
             
             # Sort voices by type and name
             voice_infos.sort(key=lambda v: (v.name))
             
             # Cache the results
             self._voices_cache[language_code] = voice_infos
+            self._save_catalog()
             return voice_infos
             
         except Exception as e:
-            print(f"Failed to fetch voices for {language_code}: {e}")
-            return []
+            logger.warning("Failed to fetch voices for %s: %s", language_code, e)
+            self._load_catalog()
+            return self._voices_cache.get(language_code, [])
+    
+    def fetch_catalog(self) -> None:
+        """Fetch every voice in one call and persist them all as the catalog
+
+        Raises when the service cannot be reached, leaving the stored catalog as it was.
+        """
+        voices = self.tts_service.get_available_voices()
+        
+        voices_by_language: Dict[str, List[VoiceInfo]] = {}
+        for voice in voices:
+            voice_info = self._voice_info(voice)
+            # Listed under every language it speaks, as the API filters by language
+            for language_code in voice.language_codes:
+                voices_by_language.setdefault(language_code, []).append(voice_info)
+        
+        self._languages_cache = self._language_list({voice.language_codes[0] for voice in voices})
+        self._voices_cache = {language_code: sorted(voice_infos, key=lambda v: v.name)
+                              for language_code, voice_infos in voices_by_language.items()}
+        self._catalog_complete = True
+        self._save_catalog()
+    
+    @property
+    def has_complete_catalog(self) -> bool:
+        """Check if the stored catalog lists the voices of every language"""
+        return bool(self._read_catalog().get('complete'))
+    
+    @property
+    def catalog_age(self) -> Optional[float]:
+        """Seconds since the stored catalog was last saved; None without one"""
+        if not self.catalog_path:
+            return None
+        try:
+            return max(0.0, time.time() - os.path.getmtime(self.catalog_path))
+        except OSError:
+            return None
     
     def clear_cache(self) -> None:
         """Clear cached voice data"""
         self._languages_cache = None
         self._voices_cache.clear()
+        self._catalog_complete = False
     
     def refresh_data(self) -> None:
         """Refresh voice data from Google TTS"""
+        if self.is_offline:
+            # Keep serving the catalog rather than dropping it
+            return
         self.clear_cache()
         self.get_available_languages()
     
-    def _extract_voice_type(self, voice_name: str) -> str:
+    def _save_catalog(self) -> None:
+        """Persist the voice data fetched so far, merged with the stored catalog"""
+        if not self.catalog_path or self._languages_cache is None:
+            return
+        
+        stored = self._read_catalog()
+        stored_voices = stored.get('voices', {})
+        stored_voices.update({
+            language_code: [voice.to_dict() for voice in voices]
+            for language_code, voices in self._voices_cache.items()
+        })
+        catalog = {
+            'saved_at': time.time(),
+            'complete': self._catalog_complete or bool(stored.get('complete')),
+            'languages': [list(language) for language in self._languages_cache],
+            'voices': stored_voices
+        }
+        
+        try:
+            temp_path = f"{self.catalog_path}.tmp"
+            with open(temp_path, 'w') as f:
+                json.dump(catalog, f)
+            os.replace(temp_path, self.catalog_path)
+        except OSError as e:
+            logger.warning("Failed to save voice catalog: %s", e)
+    
+    def _load_catalog(self) -> List[Tuple[str, str]]:
+        """Fill the caches from the stored catalog and return its languages"""
+        catalog = self._read_catalog()
+        if not catalog:
+            return []
+        
+        self._languages_cache = [tuple(language) for language in catalog.get('languages', [])]
+        for language_code, voices in catalog.get('voices', {}).items():
+            self._voices_cache.setdefault(
+                language_code, [VoiceInfo.from_dict(voice) for voice in voices]
+            )
+        return self._languages_cache
+    
+    def _read_catalog(self) -> dict:
+        """Read the stored catalog, if any"""
+        if not self.catalog_path or not os.path.exists(self.catalog_path):
+            return {}
+        try:
+            with open(self.catalog_path, 'r') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return {}
+    
+    def _voice_info(self, voice) -> VoiceInfo:
+        """Describe a voice returned by the API"""
+        return VoiceInfo(
+            name=voice.name,
+            language_code=voice.language_codes[0],
+            gender=voice.ssml_gender.name,
+            # Extract voice type from name (e.g., "en-US-Wavenet-A" -> "Wavenet")
+            voice_type=self._extract_voice_type(voice.name),
+            display_name=self._create_voice_display_name(voice.name)
+        )
+    
+    def _language_list(self, language_codes) -> List[Tuple[str, str]]:
+        """Sorted (language code, display name) pairs"""
+        return [(lang_code, langcodes.get(lang_code).display_name()) for lang_code in sorted(language_codes)]
+    
+    @staticmethod
+    def _extract_voice_type(voice_name: str) -> str:
         """
             Extract voice type from voice name (This is for the pricings) \n
             The pricings are found on this page: https://cloud.google.com/text-to-speech/pricing?hl=en
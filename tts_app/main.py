@@ -1,11 +1,35 @@
+import argparse
+import os
 import sys
+
+# Run as a script from tts_app/, so make the tts_app package importable
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtCore import QTimer
 from PyQt5.QtWidgets import QApplication
-from main_window import MainWindow
+from tts_app.main_window import MainWindow
+from tts_app.logic.run_profiler import profiler_from_environment
+from tts_app.logic.structured_logging import configure_logging
 # from qt_material import apply_stylesheet
 
 def main():
-    app = QApplication(sys.argv)
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--profile", action="store_true")
+    parser.add_argument("--profile-dir")
+    parser.add_argument("--log-level")
+    # Everything else is left for Qt
+    args, qt_argv = parser.parse_known_args()
+    # JSON lines next to the settings file; only problems reach the terminal
+    configure_logging(args.log_level, log_file="tts_app.log", console_level="WARNING")
+    profiler = profiler_from_environment(args.profile, args.profile_dir)
+
+    app = QApplication([sys.argv[0]] + qt_argv)
     app.setStyle("Fusion")
+    if profiler:
+        # Python signal handlers only run between Python calls, so wake up for SIGUSR1 now and then
+        signal_timer = QTimer()
+        signal_timer.timeout.connect(lambda: None)
+        signal_timer.start(500)
     window = MainWindow()
     # apply_stylesheet(app, theme='dark_teal.xml')
     window.show()
@@ -13,4 +37,4 @@ def main():
     # return main
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,43 +1,77 @@
 from PyQt5.QtWidgets import (QMainWindow, QVBoxLayout, QHBoxLayout, QWidget, 
-                           QPushButton, QLabel, QMessageBox, QProgressBar, QTabWidget)
-from PyQt5.QtCore import Qt
+                           QPushButton, QLabel, QMessageBox, QProgressBar, QTabWidget,
+                           QCheckBox)
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 from PyQt5.QtGui import QFont
 import os
+from typing import Dict, Optional, Tuple
 
-from ui.voice_settings_component import VoiceSettingsComponent
-from ui.audio_settings_component import AudioSettingsComponent
-from ui.text_input_component import TextInputComponent
-from ui.file_settings_component import FileSettingsComponent
-from ui.settings_tab_component import SettingsTabComponent
-from ui.ssml_editor_component import SSMLEditorComponent
-from logic.tts_worker import TTSWorker
-from logic.tts_service_manager import TTSServiceManager
-from logic.audio_player_manager import AudioPlayerManager
-from logic.settings_manager import SettingsManager
-from logic.voice_data_manager import VoiceDataManager
-from logic.ssml_manager import SSMLManager
-from models.tts_config import TTSRequest
-from models.settings_config import AppSettings
-from models.tts_config import SSMLConfig
+from tts_app.ui.voice_settings_component import VoiceSettingsComponent
+from tts_app.ui.audio_settings_component import AudioSettingsComponent
+from tts_app.ui.text_input_component import TextInputComponent
+from tts_app.ui.file_settings_component import FileSettingsComponent
+from tts_app.ui.settings_tab_component import SettingsTabComponent
+from tts_app.ui.ssml_editor_component import SSMLEditorComponent
+from tts_app.ui.job_queue_component import JobQueueComponent
+from tts_app.ui.performance_panel_component import PerformancePanelComponent
+from tts_app.logic.job_scheduler import JobScheduler
+from tts_app.logic.performance_monitor import PerformanceMonitor
+from tts_app.logic.job_journal import JobJournal
+from tts_app.logic.audio_cache import AudioCache
+from tts_app.logic.tts_engine import TTSEngine
+from tts_app.logic.audio_player_manager import AudioPlayerManager, PlaybackQueueState
+from tts_app.logic.settings_manager import SettingsManager
+from tts_app.logic.ssml_manager import SSMLManager
+from tts_app.models.tts_config import TTSRequest
+from tts_app.models.settings_config import AppSettings
+from tts_app.models.tts_config import SSMLConfig
+from tts_app.models.job_config import JobStatus
+from tts_app.logic.progress_tracker import format_eta
+from tts_app.logic.hedging import HedgePolicy
+from tts_app.models.health_config import HealthState, HealthStatus
 
 class MainWindow(QMainWindow):
     """Main application window with organized UI and Logic separation"""
     
+    # Emitted from the health monitor's thread, delivered on the UI thread
+    health_changed = pyqtSignal(object)  # HealthStatus
+    
     def __init__(self):
         super().__init__()
+        self._playback_job_id: Optional[str] = None
+        self._job_audio: Dict[str, Tuple[bytes, str]] = {}  # job_id -> (audio_content, audio_format)
         self._setup_logic_managers()
         self._setup_ui()
         self._setup_connections()
         self._load_settings()
         self._current_audio_path = None
+        self._current_audio: Optional[Tuple[bytes, str]] = None  # (audio_content, audio_format)
     
     def _setup_logic_managers(self) -> None:
         """Initialize logic managers"""
-        self.tts_manager = TTSServiceManager()
         self.audio_manager = AudioPlayerManager()
         self.settings_manager = SettingsManager()
-        self.voice_data_manager = VoiceDataManager(self.tts_manager)
         self.ssml_manager = SSMLManager()
+
+        # Journal, voice catalog and audio cache are kept next to the settings file
+        settings_dir = os.path.dirname(os.path.abspath(self.settings_manager.settings_file))
+        self.job_journal = JobJournal(os.path.join(settings_dir, "tts_journal.jsonl"))
+        self.job_journal.compact()
+
+        settings = self.settings_manager.get_settings()
+        self.audio_cache = AudioCache(
+            os.path.join(settings_dir, "audio_cache"), settings.audio_cache_mb * 1024 * 1024
+        )
+
+        # The headless engine does the work; the GUI schedules and displays it
+        self.engine = TTSEngine(
+            journal=self.job_journal, audio_cache=self.audio_cache,
+            catalog_path=os.path.join(settings_dir, "voice_catalog.json")
+        )
+        self.tts_manager = self.engine.service
+        self.voice_data_manager = self.engine.voices
+
+        self.job_scheduler = JobScheduler(self.engine, settings.max_parallel_jobs)
     
     def _setup_ui(self) -> None:
         """Setup the user interface"""
@@ -64,8 +98,19 @@ class MainWindow(QMainWindow):
         # TTS Tab
         self._setup_tts_tab()
         
+        # Job Queue Tab
+        self._setup_queue_tab()
+        
         # Settings Tab
         self._setup_settings_tab()
+        
+        # Diagnostics Tab
+        self._setup_performance_tab()
+        
+        # Connectivity indicator
+        self.health_label = QLabel()
+        self.statusBar().addPermanentWidget(self.health_label)
+        self._show_health(self.tts_manager.health_monitor.status)
     
     def _setup_tts_tab(self) -> None:
         """Setup the main TTS conversion tab"""
@@ -91,17 +136,33 @@ class MainWindow(QMainWindow):
         self.progress_bar.setVisible(False)
         tts_layout.addWidget(self.progress_bar)
         
+        # Progressive playback status
+        self.playback_status_label = QLabel()
+        self.playback_status_label.setVisible(False)
+        self.playback_status_label.setStyleSheet("color: #666; font-size: 11px;")
+        tts_layout.addWidget(self.playback_status_label)
+        
         # Buttons
         self._setup_tts_buttons(tts_layout)
         
         # Add tab
         self.tab_widget.addTab(tts_widget, "Text-to-Speech")
     
+    def _setup_queue_tab(self) -> None:
+        """Setup the job queue tab"""
+        self.job_queue_component = JobQueueComponent(self.job_scheduler)
+        self.tab_widget.addTab(self.job_queue_component, "Queue")
+    
     def _setup_settings_tab(self) -> None:
         """Setup the settings tab"""
         self.settings_component = SettingsTabComponent()
         self.tab_widget.addTab(self.settings_component, "Settings")
     
+    def _setup_performance_tab(self) -> None:
+        """Setup the live performance diagnostics tab"""
+        self.performance_panel = PerformancePanelComponent(PerformanceMonitor(self.engine), self.job_scheduler)
+        self.tab_widget.addTab(self.performance_panel, "Diagnostics")
+    
     def _setup_tts_buttons(self, layout: QVBoxLayout) -> None:
         """Setup TTS action buttons"""
         button_layout = QHBoxLayout()
@@ -132,6 +193,11 @@ class MainWindow(QMainWindow):
         self.play_button.clicked.connect(self._play_audio)
         self.play_button.setEnabled(False)
         
+        # Pause / resume button
+        self.pause_button = QPushButton("Pause")
+        self.pause_button.clicked.connect(self._toggle_pause_audio)
+        self.pause_button.setEnabled(False)
+        
         # Stop button
         self.stop_button = QPushButton("Stop Audio")
         self.stop_button.clicked.connect(self._stop_audio)
@@ -139,18 +205,40 @@ class MainWindow(QMainWindow):
         
         button_layout.addWidget(self.convert_button)
         button_layout.addWidget(self.play_button)
+        button_layout.addWidget(self.pause_button)
         button_layout.addWidget(self.stop_button)
         
+        # Start playback as soon as the first chunk is synthesized
+        self.play_while_converting_checkbox = QCheckBox("Play while converting")
+        button_layout.addWidget(self.play_while_converting_checkbox)
+        
         layout.addLayout(button_layout)
+        
+        # Feeds synthesized chunks to the playback queue
+        self.playback_timer = QTimer(self)
+        self.playback_timer.setInterval(100)
+        self.playback_timer.timeout.connect(self._update_playback_queue)
     
     def _setup_connections(self) -> None:
         """Setup signal connections between UI and Logic"""
         # Settings connections
         self.settings_component.credentials_updated.connect(self._on_credentials_updated)
+        self.settings_component.credential_pool_changed.connect(self._on_credential_pool_changed)
         self.settings_component.settings_changed.connect(self._save_current_settings)
 
         # Voice selection connections
         self.voice_component.voice_changed.connect(self._on_voice_changed)
+        
+        # Job scheduler connections
+        self.job_scheduler.job_updated.connect(self._update_overall_progress)
+        self.job_scheduler.job_finished.connect(self._on_job_finished)
+        self.job_scheduler.job_audio_ready.connect(self._on_job_audio_ready)
+        self.job_scheduler.job_chunk_ready.connect(self._on_job_chunk_ready)
+        self.job_queue_component.queue_changed.connect(self._on_queue_changed)
+        
+        # Connectivity transitions from the background health monitor
+        self.health_changed.connect(self._on_health_changed)
+        self.tts_manager.health_monitor.add_listener(self.health_changed.emit)
 
     def _on_voice_changed(self, voice_name: str) -> None:
         """Handle voice selection change"""
@@ -164,40 +252,96 @@ class MainWindow(QMainWindow):
         """Load application settings"""
         settings = self.settings_manager.load_settings()
         
+        # Transport settings apply to every client created from here on
+        self.tts_manager.transport_config = settings.transport
+        
         # Load settings into settings component
         self.settings_component.load_settings_data(settings)
+        self._apply_hedging_settings(settings)
         
         # Initialize TTS service if credentials are available
         if settings.google_credentials.credentials_path and settings.google_credentials.is_valid:
-            success, message = self.tts_manager.initialize_with_credentials(
-                settings.google_credentials.credentials_path
+            success, message = self.tts_manager.initialize_with_credential_pool(
+                settings.google_credentials.all_credentials_paths,
+                settings.google_credentials.requests_per_minute or None
             )
 
-            # Testing Internet connection
+            # Testing Internet connection; later changes arrive from the health monitor
             internet_connected, connection_message = self.tts_manager.test_connection()
+            self.tts_manager.health_monitor.start()
 
-            if success & internet_connected:
-                # Enable voice component and refresh data
+            if success:
+                # Enable voice component; offline it is filled from the stored catalog
                 self.voice_component.set_credentials_available(True)
                 self.voice_component._refresh_data()
-            else:
-                if not success:
-                    QMessageBox.warning(self, "TTS Initialization", 
-                                    f"Failed to initialize TTS service: {message}")
                 if not internet_connected:
-                    QMessageBox.warning(self, "Internet Connection", 
-                                    f"Failed to connect to the internet: {connection_message}")
+                    self.job_scheduler.set_online(False)
+                    self.statusBar().showMessage(
+                        f"Working offline: {connection_message}. "
+                        "New conversions will run once the connection is back", 10000
+                    )
+            else:
+                QMessageBox.warning(self, "TTS Initialization", 
+                                f"Failed to initialize TTS service: {message}")
                 self.voice_component.set_credentials_available(False)
         else:
             # Try default initialization
             success, message = self.tts_manager.initialize_default()
             if success:
+                self.tts_manager.health_monitor.start()
                 self.voice_component.set_credentials_available(True)
                 self.voice_component._refresh_data()
             else:
                 # Show info message about needing to configure credentials
                 self.voice_component.set_credentials_available(False)
                 self._show_credentials_info()
+
+        self._resume_journaled_jobs()
+
+    def _resume_journaled_jobs(self) -> None:
+        """Requeue jobs left unfinished by the previous session once TTS is available"""
+        if not self.tts_manager.is_available:
+            return
+
+        resumed = self.job_scheduler.resume_from_journal()
+        if resumed:
+            self.statusBar().showMessage(
+                f"Resumed {len(resumed)} unfinished job(s) from the previous session", 10000
+            )
+    
+    def _on_health_changed(self, status: HealthStatus) -> None:
+        """React to the TTS service going offline or coming back"""
+        self._show_health(status)
+        
+        if status.state == HealthState.ONLINE:
+            if self.tts_manager.is_available and not self.voice_component.isEnabled():
+                self.voice_component.set_credentials_available(True)
+                self.voice_component._refresh_data()
+            waiting = [job for job in self.job_scheduler.active_jobs
+                       if job.status == JobStatus.WAITING]
+            self.job_scheduler.set_online(True)
+            if waiting:
+                self.statusBar().showMessage(
+                    f"Connection to Google TTS restored, running {len(waiting)} waiting job(s)", 5000
+                )
+            else:
+                self.statusBar().showMessage("Connection to Google TTS restored", 5000)
+        elif status.state == HealthState.OFFLINE:
+            self.job_scheduler.set_online(False)
+            self.statusBar().showMessage(
+                f"{status.message}. Cached audio still plays; new conversions will wait", 10000
+            )
+    
+    def _show_health(self, status: HealthStatus) -> None:
+        """Show the cached connectivity state in the status bar"""
+        colors = {
+            HealthState.ONLINE: "#388e3c",
+            HealthState.OFFLINE: "#d32f2f",
+            HealthState.UNKNOWN: "#666666"
+        }
+        self.health_label.setText(f"● {status.state.value}")
+        self.health_label.setStyleSheet(f"color: {colors[status.state]}; font-size: 11px;")
+        self.health_label.setToolTip(status.message)
     
     def _show_credentials_info(self) -> None:
         """Show information about configuring credentials"""
@@ -207,15 +351,35 @@ class MainWindow(QMainWindow):
             "Please go to the Settings tab to configure your Google Cloud credentials."
         )
     
+    def _initialize_credential_pool(self, credentials_path: str) -> tuple[bool, str]:
+        """Initialize the TTS service with the primary and additional service accounts"""
+        paths = [credentials_path] + self.settings_component.get_additional_credentials_paths()
+        requests_per_minute = self.settings_component.requests_per_minute_spin.value()
+        return self.tts_manager.initialize_with_credential_pool(paths, requests_per_minute or None)
+    
+    def _on_credential_pool_changed(self) -> None:
+        """Rebuild the credential pool after accounts were added or removed"""
+        credentials_path = self.settings_component.get_settings_data()['credentials_path']
+        if not credentials_path:
+            return
+        
+        success, message = self._initialize_credential_pool(credentials_path)
+        if success:
+            self.statusBar().showMessage(message, 5000)
+        else:
+            QMessageBox.warning(self, "Error", f"Failed to initialize TTS service:\n{message}")
+    
     def _on_credentials_updated(self, credentials_path: str) -> None:
         """Handle credentials update from UI"""
-        success, message = self.tts_manager.initialize_with_credentials(credentials_path)
+        success, message = self._initialize_credential_pool(credentials_path)
         
         if success:
             # Enable voice component and refresh data
             self.voice_component.set_credentials_available(True)
+            self.tts_manager.health_monitor.start()
             self.voice_component._refresh_data()
             QMessageBox.information(self, "Success", "TTS service initialized successfully!")
+            self._resume_journaled_jobs()
         else:
             self.voice_component.set_credentials_available(False)
             QMessageBox.warning(self, "Error", f"Failed to initialize TTS service:\n{message}")
@@ -233,12 +397,50 @@ class MainWindow(QMainWindow):
                 settings_data['credentials_path']
             )
         
+        settings.google_credentials.additional_credentials_paths = settings_data['additional_credentials_paths']
+        settings.google_credentials.requests_per_minute = settings_data['requests_per_minute']
         settings.last_output_directory = settings_data['output_directory']
         settings.remember_settings = settings_data['remember_settings']
+        settings.max_parallel_jobs = settings_data['max_parallel_jobs']
+        settings.job_deadline_seconds = settings_data['job_deadline_seconds']
+        settings.audio_cache_mb = settings_data['audio_cache_mb']
+        self.audio_cache.max_bytes = settings.audio_cache_mb * 1024 * 1024
+        settings.hedging_enabled = settings_data['hedging_enabled']
+        settings.hedging_percentile = settings_data['hedging_percentile']
+        settings.hedging_max_extra_percent = settings_data['hedging_max_extra_percent']
+        self.job_scheduler.set_max_parallel_jobs(settings.max_parallel_jobs)
+        self._apply_hedging_settings(settings)
+        
+        if settings_data['transport'] != settings.transport:
+            settings.transport = settings_data['transport']
+            self._apply_transport_settings(settings.transport)
         
         # Save settings
         self.settings_manager.save_settings(settings)
     
+    def _apply_transport_settings(self, transport_config) -> None:
+        """Rebuild the TTS clients on channels with new transport settings"""
+        self.tts_manager.transport_config = transport_config
+        if not self.tts_manager.is_available:
+            return
+        
+        if self.tts_manager.credentials_path:
+            success, message = self._initialize_credential_pool(self.tts_manager.credentials_path)
+        else:
+            success, message = self.tts_manager.initialize_default()
+        if not success:
+            QMessageBox.warning(self, "Error", f"Failed to apply connection settings:\n{message}")
+    
+    def _apply_hedging_settings(self, settings: AppSettings) -> None:
+        """Configure request hedging on the TTS service"""
+        if not settings.hedging_enabled:
+            self.tts_manager.hedge_policy = None
+            return
+        self.tts_manager.hedge_policy = HedgePolicy(
+            percentile=settings.hedging_percentile,
+            max_extra_ratio=settings.hedging_max_extra_percent / 100.0
+        )
+    
     def _convert_text_to_speech(self) -> None:
         """Convert text to speech using logic managers"""
         if not self.tts_manager.is_available:
@@ -248,7 +450,7 @@ class MainWindow(QMainWindow):
                 "Please configure your Google Cloud credentials in the Settings tab."
             )
             # Switch to settings tab
-            self.tab_widget.setCurrentIndex(1)
+            self.tab_widget.setCurrentWidget(self.settings_component)
             return
 
         # Validate Content
@@ -297,58 +499,170 @@ class MainWindow(QMainWindow):
         self._start_conversion(request)
     
     def _start_conversion(self, request: TTSRequest) -> None:
-        """Start TTS conversion using worker thread"""
-        self.convert_button.setEnabled(False)
+        """Queue TTS conversion on the job scheduler"""
+        priority = self.job_queue_component.get_selected_priority()
+        deadline = self.settings_manager.get_settings().job_deadline_seconds
+        job_id = self.job_scheduler.submit(request, priority, deadline_seconds=deadline)
+        
+        if self.play_while_converting_checkbox.isChecked():
+            # Only the newest job plays progressively
+            self._stop_audio()
+            self._playback_job_id = job_id
+        
+        job = self.job_scheduler.get_job(job_id)
+        if job.status == JobStatus.WAITING:
+            self.statusBar().showMessage(
+                f"Offline: {job.display_name} will be converted once the connection is back", 5000
+            )
+        else:
+            self.statusBar().showMessage(f"Queued {job.display_name}", 5000)
+        self._update_overall_progress()
+    
+    def _update_overall_progress(self, job_id: str = None) -> None:
+        """Show the combined progress of all active jobs"""
+        active_jobs = self.job_scheduler.active_jobs
+        if not active_jobs:
+            self.progress_bar.setVisible(False)
+            return
+        
         self.progress_bar.setVisible(True)
-        self.progress_bar.setValue(0)
-        
-        # Create and start worker with logic manager
-        self.worker = TTSWorker(request, self.tts_manager)
-        self.worker.progress_updated.connect(self.progress_bar.setValue)
-        self.worker.conversion_finished.connect(self._on_conversion_finished)
-        self.worker.conversion_failed.connect(self._on_conversion_failed)
-        self.worker.start()
-    
-    def _on_conversion_finished(self, output_path: str) -> None:
-        """Handle successful conversion"""
-        self.convert_button.setEnabled(True)
-        self.progress_bar.setVisible(False)
-        self.play_button.setEnabled(True)
-        self._current_audio_path = output_path
+        self.progress_bar.setValue(sum(job.progress for job in active_jobs) // len(active_jobs))
         
-        QMessageBox.information(
-            self, "Success",
-            f"Audio file saved successfully as:\n{output_path}"
-        )
+        # The queue is done when its slowest running job is
+        etas = [job.progress_detail.eta_seconds for job in active_jobs
+                if job.status == JobStatus.RUNNING and job.progress_detail]
+        if etas and None not in etas:
+            self.progress_bar.setFormat(f"%p% ({format_eta(max(etas))})")
+        else:
+            self.progress_bar.setFormat("%p%")
     
-    def _on_conversion_failed(self, error_message: str) -> None:
-        """Handle conversion failure"""
-        self.convert_button.setEnabled(True)
-        self.progress_bar.setVisible(False)
+    def _on_queue_changed(self, active_count: int) -> None:
+        """Show the number of active jobs in the queue tab title"""
+        index = self.tab_widget.indexOf(self.job_queue_component)
+        title = f"Queue ({active_count})" if active_count else "Queue"
+        self.tab_widget.setTabText(index, title)
+    
+    def _on_job_chunk_ready(self, job_id: str, index: int, total: int,
+                            audio_content: bytes, audio_format: str) -> None:
+        """Forward chunks of the job being played progressively"""
+        if job_id == self._playback_job_id:
+            self._on_chunk_ready(index, total, audio_content, audio_format)
+    
+    def _on_job_audio_ready(self, job_id: str, audio_content: bytes, audio_format: str) -> None:
+        """Hold a job's audio in memory until the job finishes"""
+        self._job_audio[job_id] = (audio_content, audio_format)
+    
+    def _on_chunk_ready(self, index: int, total: int, audio_content: bytes, audio_format: str) -> None:
+        """Queue a synthesized chunk for progressive playback"""
+        if not self.playback_timer.isActive():
+            if not self.audio_manager.start_queue(total):
+                return
+            self.playback_timer.start()
+            self.stop_button.setEnabled(True)
+            self.pause_button.setEnabled(True)
+            self.pause_button.setText("Pause")
+        
+        self.audio_manager.enqueue_chunk(index, audio_content, audio_format)
+    
+    def _update_playback_queue(self) -> None:
+        """Advance the playback queue and show buffering state"""
+        state = self.audio_manager.update_queue()
+        played, total = self.audio_manager.queue_progress
+        
+        if state == PlaybackQueueState.BUFFERING:
+            self.playback_status_label.setText(f"Buffering... waiting for chunk {played + 1} of {total}")
+            self.playback_status_label.setVisible(True)
+        elif state == PlaybackQueueState.PLAYING:
+            self.playback_status_label.setText(f"Playing chunk {played} of {total}")
+            self.playback_status_label.setVisible(True)
+        else:
+            self.playback_timer.stop()
+            self.playback_status_label.setVisible(False)
+            self.stop_button.setEnabled(False)
+            self.pause_button.setEnabled(False)
+    
+    def _on_job_finished(self, job_id: str) -> None:
+        """Handle a job reaching a terminal state"""
+        job = self.job_scheduler.get_job(job_id)
+        audio = self._job_audio.pop(job_id, None)
+        if job_id == self._playback_job_id:
+            self._playback_job_id = None
+        if job is None:
+            return
         
-        QMessageBox.critical(self, "Error", f"Conversion failed:\n{error_message}")
+        if job.status == JobStatus.COMPLETED:
+            self.play_button.setEnabled(True)
+            self._current_audio_path = job.request.output_path
+            self._current_audio = audio
+            self.statusBar().showMessage(f"Audio file saved as: {job.request.output_path}", 10000)
+        elif job.status == JobStatus.CANCELLED:
+            self.statusBar().showMessage(f"Conversion of {job.display_name} was cancelled", 10000)
+        else:
+            self.statusBar().showMessage(
+                f"Conversion of {job.display_name} failed: {job.error_message} (see Queue tab)", 10000
+            )
+        
+        self._update_overall_progress()
     
     def _play_audio(self) -> None:
         """Play the generated audio using audio manager"""
-        if not self._current_audio_path:
+        if not self._current_audio and not self._current_audio_path:
             QMessageBox.warning(self, "Warning", "No audio file to play!")
             return
         
-        if self.audio_manager.load_file(self._current_audio_path):
+        # Prefer the in-memory copy and fall back to re-reading the file
+        loaded = False
+        if self._current_audio:
+            loaded = self.audio_manager.load_bytes(*self._current_audio)
+        if not loaded and self._current_audio_path:
+            loaded = self.audio_manager.load_file(self._current_audio_path)
+        
+        if loaded:
             if self.audio_manager.play():
                 self.stop_button.setEnabled(True)
+                self.pause_button.setEnabled(True)
+                self.pause_button.setText("Pause")
             else:
                 QMessageBox.critical(self, "Error", "Could not play audio file!")
         else:
             QMessageBox.critical(self, "Error", "Could not load audio file!")
     
+    def _toggle_pause_audio(self) -> None:
+        """Pause or resume playback using audio manager"""
+        if self.audio_manager.is_paused:
+            self.audio_manager.resume()
+            self.pause_button.setText("Pause")
+        else:
+            self.audio_manager.pause()
+            self.pause_button.setText("Resume")
+    
     def _stop_audio(self) -> None:
         """Stop audio playback using audio manager"""
         self.audio_manager.stop()
+        self.playback_timer.stop()
+        self.playback_status_label.setVisible(False)
         self.stop_button.setEnabled(False)
+        self.pause_button.setEnabled(False)
+        self.pause_button.setText("Pause")
     
     def closeEvent(self, event) -> None:
         """Handle application close event"""
+        # Confirm before abandoning queued or running jobs
+        if self.job_scheduler.active_jobs:
+            reply = QMessageBox.question(
+                self, "Jobs in Progress",
+                "Some conversions are still queued or running. Quit anyway?\n\n"
+                "Unfinished jobs will resume the next time the application starts.",
+                QMessageBox.Yes | QMessageBox.No,
+                QMessageBox.No
+            )
+            if reply != QMessageBox.Yes:
+                event.ignore()
+                return
+            self.job_scheduler.shutdown(resumable=True)
+        
+        self.tts_manager.health_monitor.stop()
+        
         # Save settings before closing
         self._save_current_settings()
         event.accept()
@@ -0,0 +1,129 @@
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
+from typing import List, Optional
+import json
+
+from tts_app.models.tts_config import TTSRequest, VoiceConfig, AudioConfig
+
+# Name of the build configuration file at the root of a project directory
+BUILD_CONFIG_FILENAME = "speechgen.json"
+
+# File extension of each output format
+FORMAT_EXTENSIONS = {'MP3': ".mp3", 'WAV': ".wav", 'OGG': ".ogg"}
+
+def glob_matches(path: str, pattern: str) -> bool:
+    """Match a relative path against a glob, where a leading **/ also matches the top level"""
+    path = path.replace("\\", "/")
+    if fnmatch(path, pattern):
+        return True
+    return pattern.startswith("**/") and fnmatch(path, pattern[3:])
+
+@dataclass
+class BuildRule:
+    """Voice and audio settings for the sources matching a glob
+
+    Settings are partial: only the keys given override what earlier rules
+    and the project defaults set.
+    """
+    pattern: str
+    voice_config: dict = field(default_factory=dict)
+    audio_config: dict = field(default_factory=dict)
+
+    def matches(self, source_path: str) -> bool:
+        """Check if a source path, relative to the project, matches the rule"""
+        return glob_matches(source_path, self.pattern)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization"""
+        return {
+            'pattern': self.pattern,
+            'voice_config': dict(self.voice_config),
+            'audio_config': dict(self.audio_config)
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'BuildRule':
+        """Create from dictionary"""
+        return cls(
+            pattern=data['pattern'],
+            voice_config=dict(data.get('voice_config', {})),
+            audio_config=dict(data.get('audio_config', {}))
+        )
+
+@dataclass
+class BuildConfig:
+    """Configuration of an SSML/text project built into audio files
+
+    Every source matching one of the source globs is built into output_dir
+    under the same relative path, with the extension of its audio format.
+    Rules are applied in order, so later rules override earlier ones.
+    """
+    sources: List[str] = field(default_factory=lambda: ["**/*.ssml", "**/*.txt"])
+    output_dir: str = "build"
+    voice_config: dict = field(default_factory=dict)
+    audio_config: dict = field(default_factory=dict)
+    rules: List[BuildRule] = field(default_factory=list)
+
+    def settings_for(self, source_path: str) -> tuple[VoiceConfig, AudioConfig]:
+        """Voice and audio settings of a source path, relative to the project"""
+        voice = dict(self.voice_config)
+        audio = dict(self.audio_config)
+        for rule in self.rules:
+            if rule.matches(source_path):
+                voice.update(rule.voice_config)
+                audio.update(rule.audio_config)
+        return VoiceConfig.from_dict(voice), AudioConfig.from_dict(audio)
+
+    def is_source(self, source_path: str) -> bool:
+        """Check if a path, relative to the project, is one of its sources"""
+        return any(glob_matches(source_path, pattern) for pattern in self.sources)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization"""
+        return {
+            'sources': list(self.sources),
+            'output_dir': self.output_dir,
+            'voice_config': dict(self.voice_config),
+            'audio_config': dict(self.audio_config),
+            'rules': [rule.to_dict() for rule in self.rules]
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'BuildConfig':
+        """Create from dictionary"""
+        defaults = cls()
+        return cls(
+            sources=list(data.get('sources', defaults.sources)),
+            output_dir=data.get('output_dir', defaults.output_dir),
+            voice_config=dict(data.get('voice_config', {})),
+            audio_config=dict(data.get('audio_config', {})),
+            rules=[BuildRule.from_dict(rule) for rule in data.get('rules', [])]
+        )
+
+    @classmethod
+    def load(cls, config_path: str) -> 'BuildConfig':
+        """Load a build configuration file"""
+        with open(config_path, "r", encoding="utf-8") as config_file:
+            try:
+                return cls.from_dict(json.load(config_file))
+            except (json.JSONDecodeError, KeyError, TypeError) as e:
+                raise ValueError(f"{config_path}: invalid build configuration: {e}")
+
+@dataclass
+class BuildTarget:
+    """One source file and the request that builds its audio"""
+    source_path: str   # relative to the project directory
+    request: TTSRequest
+    fingerprint: str   # of everything the output depends on
+    stale_reason: Optional[str] = None  # None when the output is up to date
+    error: Optional[str] = None         # why the target cannot be built at all, such as an unreadable source
+
+    @property
+    def output_path(self) -> str:
+        """Where the audio is built"""
+        return self.request.output_path
+
+    @property
+    def is_stale(self) -> bool:
+        """Check if the output needs to be built"""
+        return self.stale_reason is not None
@@ -0,0 +1,28 @@
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Optional
+import time
+
+class HealthState(Enum):
+    """Connectivity of the TTS service as last observed"""
+    UNKNOWN = "Unknown"
+    ONLINE = "Online"
+    OFFLINE = "Offline"
+
+@dataclass
+class HealthStatus:
+    """Cached result of the last health check"""
+    state: HealthState = HealthState.UNKNOWN
+    message: str = "Not checked yet"
+    checked_at: float = field(default_factory=time.time)
+    latency_ms: Optional[float] = None
+
+    @property
+    def is_online(self) -> bool:
+        """Check if the service was reachable"""
+        return self.state == HealthState.ONLINE
+
+    @property
+    def age_seconds(self) -> float:
+        """Seconds since the status was observed"""
+        return time.time() - self.checked_at
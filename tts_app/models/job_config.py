@@ -0,0 +1,68 @@
+from dataclasses import dataclass, field
+from enum import Enum, IntEnum
+from typing import Optional
+import os
+import time
+
+from tts_app.models.tts_config import TTSRequest
+
+class JobStatus(Enum):
+    """Lifecycle state of a queued TTS job"""
+    QUEUED = "Queued"
+    WAITING = "Waiting for Connection"
+    RUNNING = "Running"
+    COMPLETED = "Completed"
+    FAILED = "Failed"
+    CANCELLED = "Cancelled"
+    EXPIRED = "Deadline Exceeded"
+
+    @property
+    def is_finished(self) -> bool:
+        """Check if the job has reached a terminal state"""
+        return self in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED, JobStatus.EXPIRED)
+
+@dataclass
+class ProgressSnapshot:
+    """Measured progress of a running job"""
+    percent: int = 0
+    completed_chars: int = 0
+    total_chars: int = 0
+    completed_chunks: int = 0
+    total_chunks: int = 0
+    bytes_written: int = 0
+    elapsed_seconds: float = 0.0
+    eta_seconds: Optional[float] = None
+
+class JobPriority(IntEnum):
+    """Scheduling priority, higher values run first"""
+    LOW = 0
+    NORMAL = 1
+    HIGH = 2
+
+@dataclass
+class TTSJob:
+    """A TTS request tracked by the job scheduler"""
+    job_id: str
+    request: TTSRequest
+    priority: JobPriority = JobPriority.NORMAL
+    status: JobStatus = JobStatus.QUEUED
+    progress: int = 0
+    progress_detail: Optional[ProgressSnapshot] = None
+    error_message: Optional[str] = None
+    deadline_seconds: Optional[float] = None  # Measured from when the job starts running
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    @property
+    def display_name(self) -> str:
+        """Short name for the job shown in the UI"""
+        return os.path.basename(self.request.output_path) or self.request.output_path
+
+    @property
+    def elapsed_seconds(self) -> Optional[float]:
+        """Seconds the job has been (or was) running"""
+        if self.started_at is None:
+            return None
+        end = self.finished_at if self.finished_at is not None else time.time()
+        return end - self.started_at
@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import List, Optional
 
 @dataclass
 class GoogleCredentialsConfig:
@@ -8,6 +8,14 @@ class GoogleCredentialsConfig:
     project_id: Optional[str] = None
     service_account_email: Optional[str] = None
     is_valid: bool = False
+    additional_credentials_paths: List[str] = field(default_factory=list)
+    requests_per_minute: int = 0  # per service account, 0 means unlimited
+    
+    @property
+    def all_credentials_paths(self) -> List[str]:
+        """Primary and additional key files, in pool order"""
+        paths = [self.credentials_path] if self.credentials_path else []
+        return paths + [path for path in self.additional_credentials_paths if path not in paths]
     
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization"""
@@ -15,7 +23,9 @@ class GoogleCredentialsConfig:
             'credentials_path': self.credentials_path,
             'project_id': self.project_id,
             'service_account_email': self.service_account_email,
-            'is_valid': self.is_valid
+            'is_valid': self.is_valid,
+            'additional_credentials_paths': list(self.additional_credentials_paths),
+            'requests_per_minute': self.requests_per_minute
         }
     
     @classmethod
@@ -25,7 +35,45 @@ class GoogleCredentialsConfig:
             credentials_path=data.get('credentials_path'),
             project_id=data.get('project_id'),
             service_account_email=data.get('service_account_email'),
-            is_valid=data.get('is_valid', False)
+            is_valid=data.get('is_valid', False),
+            additional_credentials_paths=list(data.get('additional_credentials_paths', [])),
+            requests_per_minute=data.get('requests_per_minute', 0)
+        )
+
+@dataclass
+class TransportConfig:
+    """Configuration for the gRPC channels used to reach the TTS service"""
+    channel_count: int = 2
+    keepalive_time_ms: int = 30000
+    keepalive_timeout_ms: int = 10000
+    keepalive_without_calls: bool = True
+    max_receive_message_mb: int = 64  # long LINEAR16 responses exceed gRPC's 4 MB default
+    max_send_message_mb: int = 8
+    compression: str = "none"  # none, gzip or deflate
+    
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization"""
+        return {
+            'channel_count': self.channel_count,
+            'keepalive_time_ms': self.keepalive_time_ms,
+            'keepalive_timeout_ms': self.keepalive_timeout_ms,
+            'keepalive_without_calls': self.keepalive_without_calls,
+            'max_receive_message_mb': self.max_receive_message_mb,
+            'max_send_message_mb': self.max_send_message_mb,
+            'compression': self.compression
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'TransportConfig':
+        """Create from dictionary"""
+        return cls(
+            channel_count=data.get('channel_count', 2),
+            keepalive_time_ms=data.get('keepalive_time_ms', 30000),
+            keepalive_timeout_ms=data.get('keepalive_timeout_ms', 10000),
+            keepalive_without_calls=data.get('keepalive_without_calls', True),
+            max_receive_message_mb=data.get('max_receive_message_mb', 64),
+            max_send_message_mb=data.get('max_send_message_mb', 8),
+            compression=data.get('compression', "none")
         )
 
 @dataclass
@@ -34,13 +82,27 @@ class AppSettings:
     google_credentials: GoogleCredentialsConfig
     last_output_directory: Optional[str] = None
     remember_settings: bool = True
+    max_parallel_jobs: int = 2
+    job_deadline_seconds: int = 0  # 0 disables the deadline
+    hedging_enabled: bool = False
+    hedging_percentile: int = 95
+    hedging_max_extra_percent: int = 5
+    transport: TransportConfig = field(default_factory=TransportConfig)
+    audio_cache_mb: int = 512  # 0 disables the offline audio cache
     
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization"""
         return {
             'google_credentials': self.google_credentials.to_dict(),
             'last_output_directory': self.last_output_directory,
-            'remember_settings': self.remember_settings
+            'remember_settings': self.remember_settings,
+            'max_parallel_jobs': self.max_parallel_jobs,
+            'job_deadline_seconds': self.job_deadline_seconds,
+            'hedging_enabled': self.hedging_enabled,
+            'hedging_percentile': self.hedging_percentile,
+            'hedging_max_extra_percent': self.hedging_max_extra_percent,
+            'transport': self.transport.to_dict(),
+            'audio_cache_mb': self.audio_cache_mb
         }
     
     @classmethod
@@ -51,7 +113,14 @@ class AppSettings:
                 data.get('google_credentials', {})
             ),
             last_output_directory=data.get('last_output_directory'),
-            remember_settings=data.get('remember_settings', True)
+            remember_settings=data.get('remember_settings', True),
+            max_parallel_jobs=data.get('max_parallel_jobs', 2),
+            job_deadline_seconds=data.get('job_deadline_seconds', 0),
+            hedging_enabled=data.get('hedging_enabled', False),
+            hedging_percentile=data.get('hedging_percentile', 95),
+            hedging_max_extra_percent=data.get('hedging_max_extra_percent', 5),
+            transport=TransportConfig.from_dict(data.get('transport', {})),
+            audio_cache_mb=data.get('audio_cache_mb', 512)
         )
     
     @classmethod
@@ -1,6 +1,12 @@
 from dataclasses import dataclass, field
-from typing import Optional
-from google.cloud import texttospeech
+from typing import List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Loaded lazily: the Google client library is only needed to synthesize
+    from google.cloud import texttospeech
+
+# Longer documents are split into API-sized chunks before synthesis
+MAX_DOCUMENT_CHARACTERS = 100000
 
 @dataclass
 class VoiceConfig:
@@ -8,12 +14,29 @@ class VoiceConfig:
     language_code: str = "en-US"
     voice_name: str = "en-AU-Chirp3-HD-Achird"
     
-    def to_google_voice(self) -> texttospeech.VoiceSelectionParams:
+    def to_google_voice(self) -> 'texttospeech.VoiceSelectionParams':
         """Convert to Google TTS VoiceSelectionParams"""
+        from google.cloud import texttospeech
+
         return texttospeech.VoiceSelectionParams(
             language_code=self.language_code,
             name=self.voice_name
         )
+    
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization"""
+        return {
+            'language_code': self.language_code,
+            'voice_name': self.voice_name
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'VoiceConfig':
+        """Create from dictionary"""
+        return cls(
+            language_code=data.get('language_code', "en-US"),
+            voice_name=data.get('voice_name', "en-AU-Chirp3-HD-Achird")
+        )
 
 @dataclass
 class AudioConfig:
@@ -23,8 +46,10 @@ class AudioConfig:
     pitch: float = 0.0
     effects_profile_id: list = field(default_factory=list)
     
-    def to_google_audio_config(self) -> texttospeech.AudioConfig:
+    def to_google_audio_config(self) -> 'texttospeech.AudioConfig':
         """Convert to Google TTS AudioConfig"""
+        from google.cloud import texttospeech
+
         format_mapping = {
             'MP3': texttospeech.AudioEncoding.MP3,
             'WAV': texttospeech.AudioEncoding.LINEAR16,
@@ -37,6 +62,25 @@ class AudioConfig:
             pitch=self.pitch,
             effects_profile_id=self.effects_profile_id
         )
+    
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization"""
+        return {
+            'format': self.format,
+            'speaking_rate': self.speaking_rate,
+            'pitch': self.pitch,
+            'effects_profile_id': list(self.effects_profile_id)
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'AudioConfig':
+        """Create from dictionary"""
+        return cls(
+            format=data.get('format', "MP3"),
+            speaking_rate=data.get('speaking_rate', 1.0),
+            pitch=data.get('pitch', 0.0),
+            effects_profile_id=list(data.get('effects_profile_id', []))
+        )
 
 @dataclass
 class SSMLConfig:
@@ -53,6 +97,21 @@ class SSMLConfig:
             return False, "SSML is enabled but no content provided"
         
         return True, None
+    
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization"""
+        return {
+            'enabled': self.enabled,
+            'ssml_text': self.ssml_text
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'SSMLConfig':
+        """Create from dictionary"""
+        return cls(
+            enabled=data.get('enabled', False),
+            ssml_text=data.get('ssml_text', "")
+        )
 
 @dataclass
 class TTSRequest:
@@ -77,12 +136,12 @@ class TTSRequest:
                     return False, "SSML content cannot be empty"
                 
                 # For SSML, we count the spoken characters
-                from logic.ssml_manager import SSMLManager
+                from tts_app.logic.ssml_manager import SSMLManager
                 ssml_manager = SSMLManager()
                 spoken_chars = ssml_manager.get_character_count(self.ssml_config.ssml_text, count_markup=False)
                 
-                if spoken_chars > 5000:
-                    return False, f"SSML spoken text exceeds 5000 character limit ({spoken_chars} characters)"
+                if spoken_chars > MAX_DOCUMENT_CHARACTERS:
+                    return False, f"SSML spoken text exceeds {MAX_DOCUMENT_CHARACTERS} character limit ({spoken_chars} characters)"
                 
                 # Validate SSML syntax
                 is_valid, error_msg = ssml_manager.validate_ssml(self.ssml_config.ssml_text)
@@ -99,17 +158,62 @@ class TTSRequest:
         if not self.text.strip():
             return False, "Text cannot be empty"
         
-        if len(self.text) > 5000:
-            return False, "Text exceeds 5000 character limit"
+        if len(self.text) > MAX_DOCUMENT_CHARACTERS:
+            return False, f"Text exceeds {MAX_DOCUMENT_CHARACTERS} character limit"
         
         if not self.output_path.strip():
             return False, "Output path cannot be empty"
         
         return True, None
     
-    def get_synthesis_input(self) -> texttospeech.SynthesisInput:
+    def get_synthesis_input(self) -> 'texttospeech.SynthesisInput':
         """Get the appropriate synthesis input (text or SSML)"""
+        from google.cloud import texttospeech
+
         if self.ssml_config and self.ssml_config.enabled:
             return texttospeech.SynthesisInput(ssml=self.ssml_config.ssml_text)
         else:
             return texttospeech.SynthesisInput(text=self.text)
+    
+    @property
+    def is_ssml(self) -> bool:
+        """Check if the request synthesizes SSML rather than plain text"""
+        return bool(self.ssml_config and self.ssml_config.enabled)
+    
+    def get_chunks(self) -> List[str]:
+        """Split the request content into API-sized chunks"""
+        from tts_app.logic.text_chunker import TextChunker
+        
+        if self.is_ssml:
+            return TextChunker().split(self.ssml_config.ssml_text, is_ssml=True)
+        return TextChunker().split(self.text)
+    
+    def get_synthesis_inputs(self) -> 'List[texttospeech.SynthesisInput]':
+        """Get the synthesis inputs for each API-sized chunk of the request"""
+        from google.cloud import texttospeech
+
+        if self.is_ssml:
+            return [texttospeech.SynthesisInput(ssml=chunk) for chunk in self.get_chunks()]
+        return [texttospeech.SynthesisInput(text=chunk) for chunk in self.get_chunks()]
+    
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization"""
+        return {
+            'text': self.text,
+            'voice_config': self.voice_config.to_dict(),
+            'audio_config': self.audio_config.to_dict(),
+            'output_path': self.output_path,
+            'ssml_config': self.ssml_config.to_dict() if self.ssml_config else None
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'TTSRequest':
+        """Create from dictionary"""
+        ssml_data = data.get('ssml_config')
+        return cls(
+            text=data.get('text', ""),
+            voice_config=VoiceConfig.from_dict(data.get('voice_config', {})),
+            audio_config=AudioConfig.from_dict(data.get('audio_config', {})),
+            output_path=data.get('output_path', ""),
+            ssml_config=SSMLConfig.from_dict(ssml_data) if ssml_data else None
+        )
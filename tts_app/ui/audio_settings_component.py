@@ -1,7 +1,7 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                            QComboBox, QSlider, QGroupBox)
 from PyQt5.QtCore import Qt
-from models.tts_config import AudioConfig
+from tts_app.models.tts_config import AudioConfig
 
 class AudioProfiles:
     Profiles = {
@@ -0,0 +1,229 @@
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox,
+                           QGroupBox, QPushButton, QTableWidget, QTableWidgetItem,
+                           QProgressBar, QHeaderView, QAbstractItemView)
+from PyQt5.QtCore import pyqtSignal, Qt, QTimer
+from PyQt5.QtGui import QColor
+from typing import Dict, List
+
+from tts_app.logic.job_scheduler import JobScheduler
+from tts_app.models.job_config import JobPriority, JobStatus, TTSJob
+from tts_app.logic.progress_tracker import format_eta
+
+class JobQueueComponent(QWidget):
+    """UI component listing queued, running and finished TTS jobs"""
+
+    # Signals
+    queue_changed = pyqtSignal(int)  # number of active jobs
+
+    COLUMNS = ["Output", "Priority", "Status", "Progress", "Details"]
+
+    STATUS_COLORS = {
+        JobStatus.QUEUED: "#666666",
+        JobStatus.WAITING: "#f57c00",
+        JobStatus.RUNNING: "#2196F3",
+        JobStatus.COMPLETED: "#388e3c",
+        JobStatus.FAILED: "#d32f2f",
+        JobStatus.CANCELLED: "#9e9e9e",
+        JobStatus.EXPIRED: "#f57c00"
+    }
+
+    def __init__(self, scheduler: JobScheduler, parent=None):
+        super().__init__(parent)
+        self.scheduler = scheduler
+        self._rows: Dict[str, int] = {}  # job_id -> table row
+        self._setup_ui()
+        self._setup_connections()
+
+    def _setup_ui(self) -> None:
+        """Setup the user interface"""
+        layout = QVBoxLayout(self)
+
+        # Create group box
+        group_box = QGroupBox("Job Queue")
+        group_layout = QVBoxLayout(group_box)
+
+        # Priority for new jobs
+        priority_layout = QHBoxLayout()
+        priority_layout.addWidget(QLabel("Priority:"))
+        self.priority_combo = QComboBox()
+        for priority in JobPriority:
+            self.priority_combo.addItem(priority.name.title(), priority)
+        self.priority_combo.setCurrentIndex(int(JobPriority.NORMAL))
+        priority_layout.addWidget(self.priority_combo)
+
+        self.apply_priority_button = QPushButton("Apply to Selected")
+        self.apply_priority_button.clicked.connect(self._apply_priority_to_selected)
+        priority_layout.addWidget(self.apply_priority_button)
+        priority_layout.addStretch()
+
+        self.summary_label = QLabel("No jobs")
+        self.summary_label.setStyleSheet("color: #666; font-size: 11px;")
+        priority_layout.addWidget(self.summary_label)
+        group_layout.addLayout(priority_layout)
+
+        # Job table
+        self.job_table = QTableWidget(0, len(self.COLUMNS))
+        self.job_table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.job_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.job_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.job_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.job_table.verticalHeader().setVisible(False)
+        group_layout.addWidget(self.job_table)
+
+        # Actions
+        button_layout = QHBoxLayout()
+        self.cancel_button = QPushButton("Cancel Selected")
+        self.cancel_button.clicked.connect(self._cancel_selected)
+        button_layout.addWidget(self.cancel_button)
+
+        self.clear_finished_button = QPushButton("Clear Finished")
+        self.clear_finished_button.clicked.connect(self._clear_finished)
+        button_layout.addWidget(self.clear_finished_button)
+        button_layout.addStretch()
+        
+        # Adaptive concurrency limit, refreshed while the tab is visible
+        self.concurrency_label = QLabel()
+        self.concurrency_label.setStyleSheet("color: #666; font-size: 11px;")
+        button_layout.addWidget(self.concurrency_label)
+        group_layout.addLayout(button_layout)
+        
+        self.concurrency_timer = QTimer(self)
+        self.concurrency_timer.setInterval(1000)
+        self.concurrency_timer.timeout.connect(self._update_concurrency)
+        self.concurrency_timer.start()
+        self._update_concurrency()
+
+        layout.addWidget(group_box)
+
+    def _setup_connections(self) -> None:
+        """Setup signal connections to the scheduler"""
+        self.scheduler.job_added.connect(self._on_job_added)
+        self.scheduler.job_updated.connect(self._on_job_updated)
+
+    def get_selected_priority(self) -> JobPriority:
+        """Get the priority chosen for new jobs"""
+        return self.priority_combo.currentData()
+
+    def _on_job_added(self, job_id: str) -> None:
+        """Add a row for a new job"""
+        job = self.scheduler.get_job(job_id)
+        if job is None:
+            return
+
+        row = self.job_table.rowCount()
+        self.job_table.insertRow(row)
+        self._rows[job_id] = row
+
+        name_item = QTableWidgetItem(job.display_name)
+        name_item.setData(Qt.UserRole, job_id)
+        name_item.setToolTip(job.request.output_path)
+        self.job_table.setItem(row, 0, name_item)
+        self.job_table.setItem(row, 1, QTableWidgetItem())
+        self.job_table.setItem(row, 2, QTableWidgetItem())
+
+        progress_bar = QProgressBar()
+        progress_bar.setRange(0, 100)
+        self.job_table.setCellWidget(row, 3, progress_bar)
+        self.job_table.setItem(row, 4, QTableWidgetItem())
+
+        self._update_row(job)
+        self._update_summary()
+
+    def _on_job_updated(self, job_id: str) -> None:
+        """Refresh the row of an updated job"""
+        job = self.scheduler.get_job(job_id)
+        if job is None or job_id not in self._rows:
+            return
+        self._update_row(job)
+        self._update_summary()
+
+    def _update_row(self, job: TTSJob) -> None:
+        """Show the current state of a job in its row"""
+        row = self._rows[job.job_id]
+
+        self.job_table.item(row, 1).setText(job.priority.name.title())
+
+        status_item = self.job_table.item(row, 2)
+        status_item.setText(job.status.value)
+        status_item.setForeground(QColor(self.STATUS_COLORS.get(job.status, "#666666")))
+        status_item.setToolTip(job.error_message or "")
+
+        self.job_table.cellWidget(row, 3).setValue(job.progress)
+        self.job_table.item(row, 4).setText(self._format_details(job))
+
+    def _format_details(self, job: TTSJob) -> str:
+        """Describe measured progress: chunks, bytes and ETA"""
+        detail = job.progress_detail
+        if detail is None:
+            return ""
+
+        text = f"{detail.completed_chunks}/{detail.total_chunks} chunks, {detail.bytes_written / 1024:.0f} KB"
+        if job.status == JobStatus.RUNNING:
+            text += f", {format_eta(detail.eta_seconds)}"
+        elif job.elapsed_seconds is not None:
+            text += f", took {job.elapsed_seconds:.1f}s"
+        return text
+
+    def _update_summary(self) -> None:
+        """Update the queue summary label"""
+        jobs = self.scheduler.get_jobs()
+        active = self.scheduler.active_jobs
+        running = self.scheduler.running_count
+
+        if not jobs:
+            self.summary_label.setText("No jobs")
+        else:
+            self.summary_label.setText(
+                f"{running} running, {len(active) - running} queued, {len(jobs) - len(active)} finished"
+            )
+        self.queue_changed.emit(len(active))
+
+    def _update_concurrency(self) -> None:
+        """Show the synthesis concurrency limit the service has converged to"""
+        if not self.isVisible():
+            return
+        limiter = self.scheduler.tts_service.concurrency_limiter
+        if limiter is None:
+            self.concurrency_label.setText("")
+            return
+        metrics = limiter.metrics()
+        text = f"Concurrency limit: {metrics['limit']} ({metrics['in_flight']} in flight)"
+        if metrics['recent_latency'] is not None:
+            text += f", latency {metrics['recent_latency']:.2f}s"
+        saved = self.scheduler.tts_service.coalescer.total_saved
+        if saved:
+            text += f", {saved} duplicate call(s) saved"
+        self.concurrency_label.setText(text)
+    
+    def _selected_job_ids(self) -> List[str]:
+        """Get the ids of the selected jobs"""
+        job_ids = []
+        for index in self.job_table.selectionModel().selectedRows():
+            item = self.job_table.item(index.row(), 0)
+            if item is not None:
+                job_ids.append(item.data(Qt.UserRole))
+        return job_ids
+
+    def _apply_priority_to_selected(self) -> None:
+        """Change the priority of the selected queued jobs"""
+        priority = self.get_selected_priority()
+        for job_id in self._selected_job_ids():
+            self.scheduler.set_priority(job_id, priority)
+
+    def _cancel_selected(self) -> None:
+        """Cancel the selected queued or running jobs"""
+        for job_id in self._selected_job_ids():
+            self.scheduler.cancel(job_id)
+
+    def _clear_finished(self) -> None:
+        """Remove finished jobs from the scheduler and the table"""
+        self.scheduler.clear_finished()
+        self._rebuild_table()
+
+    def _rebuild_table(self) -> None:
+        """Recreate all rows from the scheduler state"""
+        self.job_table.setRowCount(0)
+        self._rows.clear()
+        for job in self.scheduler.get_jobs():
+            self._on_job_added(job.job_id)
+        self._update_summary()
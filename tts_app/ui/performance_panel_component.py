@@ -0,0 +1,195 @@
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel,
+                           QGroupBox, QPushButton, QProgressBar)
+from PyQt5.QtCore import QTimer
+from typing import Optional
+
+from tts_app.logic.job_scheduler import JobScheduler
+from tts_app.logic.performance_monitor import PerformanceMonitor, PerformanceSnapshot
+
+class PerformancePanelComponent(QWidget):
+    """UI component showing live latency, throughput, quota and cache metrics"""
+
+    # Milliseconds between updates while the panel is visible
+    UPDATE_INTERVAL_MS = 1000
+
+    # Catalogs older than this are shown as stale
+    STALE_CATALOG_SECONDS = 7 * 24 * 3600
+
+    def __init__(self, monitor: PerformanceMonitor, scheduler: JobScheduler, parent=None):
+        super().__init__(parent)
+        self.monitor = monitor
+        self.scheduler = scheduler
+        self._setup_ui()
+
+        # Only polls while shown, so a hidden panel costs nothing
+        self.update_timer = QTimer(self)
+        self.update_timer.setInterval(self.UPDATE_INTERVAL_MS)
+        self.update_timer.timeout.connect(self.refresh)
+
+    def _setup_ui(self) -> None:
+        """Setup the user interface"""
+        layout = QVBoxLayout(self)
+
+        # RPC latency over the window
+        latency_group = QGroupBox("RPC Latency")
+        latency_layout = QGridLayout(latency_group)
+        self.latency_labels = {}
+        for column, name in enumerate(("p50", "p95", "p99")):
+            latency_layout.addWidget(QLabel(name), 0, column)
+            self.latency_labels[name] = QLabel("—")
+            self.latency_labels[name].setStyleSheet("font-size: 16px; font-weight: bold;")
+            latency_layout.addWidget(self.latency_labels[name], 1, column)
+        layout.addWidget(latency_group)
+
+        # Request and character rates against the credential pool's quota
+        throughput_group = QGroupBox("Throughput")
+        throughput_layout = QGridLayout(throughput_group)
+        throughput_layout.addWidget(QLabel("Requests per minute:"), 0, 0)
+        self.requests_label = QLabel("0")
+        throughput_layout.addWidget(self.requests_label, 0, 1)
+        throughput_layout.addWidget(QLabel("Quota used:"), 1, 0)
+        self.quota_bar = QProgressBar()
+        self.quota_bar.setRange(0, 100)
+        throughput_layout.addWidget(self.quota_bar, 1, 1)
+        throughput_layout.addWidget(QLabel("Characters per minute:"), 2, 0)
+        self.characters_label = QLabel("0")
+        throughput_layout.addWidget(self.characters_label, 2, 1)
+        throughput_layout.addWidget(QLabel("Errors / retries per minute:"), 3, 0)
+        self.errors_label = QLabel("0 / 0")
+        throughput_layout.addWidget(self.errors_label, 3, 1)
+        layout.addWidget(throughput_group)
+
+        # What is running now
+        load_group = QGroupBox("Load")
+        load_layout = QGridLayout(load_group)
+        load_layout.addWidget(QLabel("RPCs in flight:"), 0, 0)
+        self.concurrency_bar = QProgressBar()
+        self.concurrency_bar.setFormat("%v of %m")
+        load_layout.addWidget(self.concurrency_bar, 0, 1)
+        load_layout.addWidget(QLabel("Jobs running / queued:"), 1, 0)
+        self.jobs_label = QLabel("0 / 0")
+        load_layout.addWidget(self.jobs_label, 1, 1)
+        layout.addWidget(load_group)
+
+        # Local data
+        cache_group = QGroupBox("Cache and Catalog")
+        cache_layout = QGridLayout(cache_group)
+        cache_layout.addWidget(QLabel("Cache hit rate:"), 0, 0)
+        self.hit_rate_label = QLabel("—")
+        cache_layout.addWidget(self.hit_rate_label, 0, 1)
+        cache_layout.addWidget(QLabel("Audio cache size:"), 1, 0)
+        self.cache_bar = QProgressBar()
+        cache_layout.addWidget(self.cache_bar, 1, 1)
+        cache_layout.addWidget(QLabel("Voice catalog age:"), 2, 0)
+        self.catalog_label = QLabel("—")
+        cache_layout.addWidget(self.catalog_label, 2, 1)
+        layout.addWidget(cache_group)
+
+        footer_layout = QHBoxLayout()
+        self.window_label = QLabel()
+        self.window_label.setStyleSheet("color: #666; font-size: 11px;")
+        footer_layout.addWidget(self.window_label)
+        footer_layout.addStretch()
+        self.reset_button = QPushButton("Reset Window")
+        self.reset_button.clicked.connect(self._reset_window)
+        footer_layout.addWidget(self.reset_button)
+        layout.addLayout(footer_layout)
+
+        layout.addStretch()
+
+    def showEvent(self, event) -> None:
+        """Start updating when the panel is shown"""
+        super().showEvent(event)
+        self.refresh()
+        self.update_timer.start()
+
+    def hideEvent(self, event) -> None:
+        """Stop updating while the panel is hidden"""
+        super().hideEvent(event)
+        self.update_timer.stop()
+
+    def refresh(self) -> None:
+        """Sample the metrics and show them"""
+        snapshot = self.monitor.sample()
+
+        for name in ("p50", "p95", "p99"):
+            self.latency_labels[name].setText(self._format_seconds(getattr(snapshot, f"latency_{name}")))
+
+        self.requests_label.setText(f"{snapshot.rpcs_per_minute:.0f}")
+        self._show_quota(snapshot)
+        self.characters_label.setText(f"{snapshot.characters_per_minute:,.0f}")
+        self.errors_label.setText(f"{snapshot.errors_per_minute:.0f} / {snapshot.retries_per_minute:.0f}")
+
+        limit = max(1, snapshot.concurrency_limit)
+        self.concurrency_bar.setRange(0, limit)
+        self.concurrency_bar.setValue(min(snapshot.rpcs_in_flight, limit))
+        self._set_bar_color(self.concurrency_bar, snapshot.rpcs_in_flight / limit)
+        running = self.scheduler.running_count
+        self.jobs_label.setText(f"{running} / {len(self.scheduler.active_jobs) - running}")
+
+        self.hit_rate_label.setText(
+            "—" if snapshot.cache_hit_rate is None else f"{snapshot.cache_hit_rate:.0%}"
+        )
+        self._show_cache_size(snapshot)
+        self._show_catalog_age(snapshot.catalog_age_seconds)
+
+        self.window_label.setText(f"Rates over the last {snapshot.window_seconds:.0f}s")
+
+    def _show_quota(self, snapshot: PerformanceSnapshot) -> None:
+        """Show request quota use, or that requests are unlimited"""
+        utilization = snapshot.quota_utilization
+        if utilization is None:
+            self.quota_bar.setValue(0)
+            self.quota_bar.setFormat("No limit set")
+            self._set_bar_color(self.quota_bar, 0.0)
+            return
+        self.quota_bar.setValue(min(100, int(round(utilization * 100))))
+        self.quota_bar.setFormat(f"%p% of {snapshot.quota_per_minute:.0f}/min")
+        self._set_bar_color(self.quota_bar, utilization)
+
+    def _show_cache_size(self, snapshot: PerformanceSnapshot) -> None:
+        """Show how full the audio cache is"""
+        if snapshot.cache_size_bytes is None or not snapshot.cache_max_bytes:
+            self.cache_bar.setValue(0)
+            self.cache_bar.setFormat("Disabled")
+            return
+        size_mb = snapshot.cache_size_bytes / 1024 / 1024
+        max_mb = snapshot.cache_max_bytes / 1024 / 1024
+        self.cache_bar.setValue(min(100, int(round(size_mb / max_mb * 100))))
+        self.cache_bar.setFormat(f"{size_mb:.1f} of {max_mb:.0f} MB")
+
+    def _show_catalog_age(self, age_seconds: Optional[float]) -> None:
+        """Show how old the stored voice catalog is"""
+        if age_seconds is None:
+            self.catalog_label.setText("No catalog stored")
+            self.catalog_label.setStyleSheet("color: #666;")
+            return
+        if age_seconds < 3600:
+            text = f"{int(age_seconds // 60)} min"
+        elif age_seconds < 2 * 24 * 3600:
+            text = f"{age_seconds / 3600:.0f} h"
+        else:
+            text = f"{age_seconds / 86400:.0f} days"
+        stale = age_seconds > self.STALE_CATALOG_SECONDS
+        self.catalog_label.setText(f"{text} (refresh voices to update)" if stale else text)
+        self.catalog_label.setStyleSheet("color: #f57c00;" if stale else "")
+
+    def _reset_window(self) -> None:
+        """Forget the samples taken so far"""
+        self.monitor.reset()
+        self.refresh()
+
+    @staticmethod
+    def _format_seconds(seconds: Optional[float]) -> str:
+        """Latency for display"""
+        if seconds is None:
+            return "—"
+        if seconds < 1:
+            return f"{seconds * 1000:.0f} ms"
+        return f"{seconds:.2f} s"
+
+    @staticmethod
+    def _set_bar_color(bar: QProgressBar, utilization: float) -> None:
+        """Color a bar by how close to saturation it is"""
+        color = "#d32f2f" if utilization >= 0.9 else "#f57c00" if utilization >= 0.7 else "#4CAF50"
+        bar.setStyleSheet(f"QProgressBar::chunk {{ background-color: {color}; }}")
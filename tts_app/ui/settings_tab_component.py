@@ -1,22 +1,27 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                            QLineEdit, QPushButton, QTextEdit, QGroupBox,
-                           QFileDialog, QMessageBox, QCheckBox, QFrame)
+                           QFileDialog, QMessageBox, QCheckBox, QFrame, QSpinBox,
+                           QListWidget, QComboBox)
 from PyQt5.QtCore import pyqtSignal, Qt
 from PyQt5.QtGui import QFont
 import json
 import os
 
+from tts_app.models.settings_config import TransportConfig
+
 class SettingsTabComponent(QWidget):
     """UI component for settings tab with Google credentials and app configuration"""
     
     # Signals
     credentials_updated = pyqtSignal(str)  # credentials_path
+    credential_pool_changed = pyqtSignal()
     settings_changed = pyqtSignal()
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self._setup_ui()
         self._current_credentials_path = None
+        self._transport_config = TransportConfig()
     
     def _setup_ui(self) -> None:
         """Setup the settings UI"""
@@ -91,6 +96,29 @@ class SettingsTabComponent(QWidget):
         status_layout.addStretch()
         creds_layout.addLayout(status_layout)
         
+        # Extra service accounts that share the synthesis load
+        creds_layout.addWidget(QLabel("Additional Service Accounts:"))
+        self.additional_credentials_list = QListWidget()
+        self.additional_credentials_list.setMaximumHeight(80)
+        creds_layout.addWidget(self.additional_credentials_list)
+        
+        pool_layout = QHBoxLayout()
+        self.add_credentials_button = QPushButton("Add...")
+        self.add_credentials_button.clicked.connect(self._add_additional_credentials)
+        pool_layout.addWidget(self.add_credentials_button)
+        
+        self.remove_credentials_button = QPushButton("Remove")
+        self.remove_credentials_button.clicked.connect(self._remove_additional_credentials)
+        pool_layout.addWidget(self.remove_credentials_button)
+        pool_layout.addStretch()
+        
+        pool_layout.addWidget(QLabel("Requests per Minute per Account:"))
+        self.requests_per_minute_spin = QSpinBox()
+        self.requests_per_minute_spin.setRange(0, 10000)
+        self.requests_per_minute_spin.setSpecialValueText("Unlimited")
+        pool_layout.addWidget(self.requests_per_minute_spin)
+        creds_layout.addLayout(pool_layout)
+        
         layout.addWidget(creds_group)
     
     def _setup_app_settings_section(self, layout: QVBoxLayout) -> None:
@@ -117,6 +145,72 @@ class SettingsTabComponent(QWidget):
         
         app_layout.addLayout(output_layout)
         
+        # Number of conversions running at once
+        parallel_layout = QHBoxLayout()
+        parallel_layout.addWidget(QLabel("Parallel Conversions:"))
+        self.max_parallel_jobs_spin = QSpinBox()
+        self.max_parallel_jobs_spin.setRange(1, 16)
+        self.max_parallel_jobs_spin.setValue(2)
+        parallel_layout.addWidget(self.max_parallel_jobs_spin)
+        parallel_layout.addStretch()
+        app_layout.addLayout(parallel_layout)
+        
+        # Deadline for each conversion
+        deadline_layout = QHBoxLayout()
+        deadline_layout.addWidget(QLabel("Conversion Deadline:"))
+        self.job_deadline_spin = QSpinBox()
+        self.job_deadline_spin.setRange(0, 3600)
+        self.job_deadline_spin.setSuffix(" s")
+        self.job_deadline_spin.setSpecialValueText("None")
+        deadline_layout.addWidget(self.job_deadline_spin)
+        deadline_layout.addStretch()
+        app_layout.addLayout(deadline_layout)
+        
+        # Rendered audio kept on disk for offline playback
+        cache_layout = QHBoxLayout()
+        cache_layout.addWidget(QLabel("Offline Audio Cache:"))
+        self.audio_cache_spin = QSpinBox()
+        self.audio_cache_spin.setRange(0, 65536)
+        self.audio_cache_spin.setSingleStep(128)
+        self.audio_cache_spin.setValue(512)
+        self.audio_cache_spin.setSuffix(" MB")
+        self.audio_cache_spin.setSpecialValueText("Disabled")
+        cache_layout.addWidget(self.audio_cache_spin)
+        cache_layout.addStretch()
+        app_layout.addLayout(cache_layout)
+        
+        # Duplicate slow requests to cut tail latency
+        hedging_layout = QHBoxLayout()
+        self.hedging_checkbox = QCheckBox("Hedge slow requests after")
+        hedging_layout.addWidget(self.hedging_checkbox)
+        self.hedging_percentile_spin = QSpinBox()
+        self.hedging_percentile_spin.setRange(50, 99)
+        self.hedging_percentile_spin.setValue(95)
+        self.hedging_percentile_spin.setPrefix("p")
+        hedging_layout.addWidget(self.hedging_percentile_spin)
+        hedging_layout.addWidget(QLabel("latency, at most"))
+        self.hedging_budget_spin = QSpinBox()
+        self.hedging_budget_spin.setRange(1, 50)
+        self.hedging_budget_spin.setValue(5)
+        self.hedging_budget_spin.setSuffix("% extra requests")
+        hedging_layout.addWidget(self.hedging_budget_spin)
+        hedging_layout.addStretch()
+        app_layout.addLayout(hedging_layout)
+        
+        # Connection pooling and compression for the TTS service
+        transport_layout = QHBoxLayout()
+        transport_layout.addWidget(QLabel("Connections:"))
+        self.channel_count_spin = QSpinBox()
+        self.channel_count_spin.setRange(1, 16)
+        self.channel_count_spin.setValue(2)
+        transport_layout.addWidget(self.channel_count_spin)
+        transport_layout.addWidget(QLabel("Compression:"))
+        self.compression_combo = QComboBox()
+        self.compression_combo.addItems(["none", "gzip", "deflate"])
+        transport_layout.addWidget(self.compression_combo)
+        transport_layout.addStretch()
+        app_layout.addLayout(transport_layout)
+        
         layout.addWidget(app_group)
     
     def _setup_connection_test_section(self, layout: QVBoxLayout) -> None:
@@ -258,6 +352,45 @@ class SettingsTabComponent(QWidget):
                 f"An error occurred while loading the credentials file:\n{str(e)}"
             )
     
+    def _add_additional_credentials(self) -> None:
+        """Add another service account key file to the pool"""
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Select Additional Service Account Key",
+            "",
+            "JSON Files (*.json);;All Files (*)"
+        )
+        
+        if not file_path or file_path in self.get_additional_credentials_paths():
+            return
+        
+        try:
+            with open(file_path, 'r') as f:
+                creds = json.load(f)
+        except (json.JSONDecodeError, FileNotFoundError):
+            QMessageBox.critical(self, "Invalid File", "The selected file is not a valid JSON file.")
+            return
+        
+        if 'private_key' not in creds or 'client_email' not in creds:
+            QMessageBox.warning(self, "Invalid Credentials File",
+                                "The selected file is not a service account key.")
+            return
+        
+        self.additional_credentials_list.addItem(file_path)
+        self.credential_pool_changed.emit()
+    
+    def _remove_additional_credentials(self) -> None:
+        """Remove the selected service account from the pool"""
+        row = self.additional_credentials_list.currentRow()
+        if row >= 0:
+            self.additional_credentials_list.takeItem(row)
+            self.credential_pool_changed.emit()
+    
+    def get_additional_credentials_paths(self) -> list:
+        """Get the additional service account key files"""
+        return [self.additional_credentials_list.item(row).text()
+                for row in range(self.additional_credentials_list.count())]
+    
     def _browse_output_directory(self) -> None:
         """Browse for default output directory"""
         directory = QFileDialog.getExistingDirectory(
@@ -280,14 +413,15 @@ class SettingsTabComponent(QWidget):
         
         try:
             # Import here to avoid circular imports
-            from logic.tts_service_manager import TTSServiceManager
+            from tts_app.logic.tts_service_manager import TTSServiceManager
             
             manager = TTSServiceManager()
+            manager.transport_config = self.get_transport_config()
             success, message = manager.initialize_with_credentials(self._current_credentials_path)
             
             if success:
                 # Test actual connection
-                test_success, test_message = manager.test_connection()
+                test_success, test_message = manager.test_connection(force=True)
                 if test_success:
                     self.test_results.setPlainText(f"✓ {test_message}")
                     self.test_results.setStyleSheet("color: #388e3c;")
@@ -324,6 +458,17 @@ class SettingsTabComponent(QWidget):
             self.credentials_info.clear()
             self.output_dir_input.clear()
             self.remember_settings_checkbox.setChecked(True)
+            self.max_parallel_jobs_spin.setValue(2)
+            self.job_deadline_spin.setValue(0)
+            self.audio_cache_spin.setValue(512)
+            self.hedging_checkbox.setChecked(False)
+            self.hedging_percentile_spin.setValue(95)
+            self.hedging_budget_spin.setValue(5)
+            self.channel_count_spin.setValue(2)
+            self.compression_combo.setCurrentText("none")
+            self._transport_config = TransportConfig()
+            self.additional_credentials_list.clear()
+            self.requests_per_minute_spin.setValue(0)
             self.test_results.clear()
             
             self.status_label.setText("Status: Not configured")
@@ -336,6 +481,11 @@ class SettingsTabComponent(QWidget):
     
     def load_settings_data(self, settings) -> None:
         """Load settings data into the UI"""
+        # Pool settings first, so the credentials signal sees the whole pool
+        self.additional_credentials_list.clear()
+        self.additional_credentials_list.addItems(settings.google_credentials.additional_credentials_paths)
+        self.requests_per_minute_spin.setValue(settings.google_credentials.requests_per_minute)
+        
         if settings.google_credentials.credentials_path:
             self._load_credentials_file(settings.google_credentials.credentials_path)
         
@@ -343,12 +493,37 @@ class SettingsTabComponent(QWidget):
             self.output_dir_input.setText(settings.last_output_directory)
         
         self.remember_settings_checkbox.setChecked(settings.remember_settings)
+        self.max_parallel_jobs_spin.setValue(settings.max_parallel_jobs)
+        self.job_deadline_spin.setValue(settings.job_deadline_seconds)
+        self.audio_cache_spin.setValue(settings.audio_cache_mb)
+        self.hedging_checkbox.setChecked(settings.hedging_enabled)
+        self.hedging_percentile_spin.setValue(settings.hedging_percentile)
+        self.hedging_budget_spin.setValue(settings.hedging_max_extra_percent)
+        self._transport_config = settings.transport
+        self.channel_count_spin.setValue(settings.transport.channel_count)
+        self.compression_combo.setCurrentText(settings.transport.compression)
+    
+    def get_transport_config(self) -> TransportConfig:
+        """Get the transport settings, with the fields edited in the UI applied"""
+        config = TransportConfig.from_dict(self._transport_config.to_dict())
+        config.channel_count = self.channel_count_spin.value()
+        config.compression = self.compression_combo.currentText()
+        return config
     
     def get_settings_data(self) -> dict:
         """Get current settings data from UI"""
         return {
             'credentials_path': self._current_credentials_path,
+            'additional_credentials_paths': self.get_additional_credentials_paths(),
+            'requests_per_minute': self.requests_per_minute_spin.value(),
             'output_directory': self.output_dir_input.text(),
-            'remember_settings': self.remember_settings_checkbox.isChecked()
+            'remember_settings': self.remember_settings_checkbox.isChecked(),
+            'max_parallel_jobs': self.max_parallel_jobs_spin.value(),
+            'job_deadline_seconds': self.job_deadline_spin.value(),
+            'audio_cache_mb': self.audio_cache_spin.value(),
+            'hedging_enabled': self.hedging_checkbox.isChecked(),
+            'hedging_percentile': self.hedging_percentile_spin.value(),
+            'hedging_max_extra_percent': self.hedging_budget_spin.value(),
+            'transport': self.get_transport_config()
         }
     
\ No newline at end of file
@@ -5,7 +5,8 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
 from PyQt5.QtCore import pyqtSignal, Qt
 from PyQt5.QtGui import QFont, QSyntaxHighlighter, QTextCharFormat, QColor
 import re
-from logic.ssml_manager import SSMLManager
+from tts_app.logic.ssml_manager import SSMLManager
+from tts_app.models.tts_config import MAX_DOCUMENT_CHARACTERS
 from typing import Optional, Tuple
 
 class SSMLSyntaxHighlighter(QSyntaxHighlighter):
@@ -308,8 +309,8 @@ class SSMLEditorComponent(QWidget):
                         font-size: 11px;
                     }
                 """)
-            elif len(text) > 5000:
-                self.validation_label.setText(f"✗ Text too long: {len(text)}/5000 characters")
+            elif len(text) > MAX_DOCUMENT_CHARACTERS:
+                self.validation_label.setText(f"✗ Text too long: {len(text)}/{MAX_DOCUMENT_CHARACTERS} characters")
                 self.validation_label.setStyleSheet("""
                     QLabel {
                         padding: 5px;
@@ -381,8 +382,8 @@ class SSMLEditorComponent(QWidget):
                 """)
         else:
             # Treat as plain text in SSML mode
-            if len(text) > 5000:
-                self.validation_label.setText(f"✗ Text too long: {len(text)}/5000 characters")
+            if len(text) > MAX_DOCUMENT_CHARACTERS:
+                self.validation_label.setText(f"✗ Text too long: {len(text)}/{MAX_DOCUMENT_CHARACTERS} characters")
                 self.validation_label.setStyleSheet("""
                     QLabel {
                         padding: 5px;
@@ -557,8 +558,8 @@ class SSMLEditorComponent(QWidget):
         
         if not self._is_ssml_supported:
             # Plain text validation
-            if len(text) > 5000:
-                return False, f"Text is too long: {len(text)}/5000 characters"
+            if len(text) > MAX_DOCUMENT_CHARACTERS:
+                return False, f"Text is too long: {len(text)}/{MAX_DOCUMENT_CHARACTERS} characters"
             return True, "Valid text"
         
         # SSML mode validation
@@ -570,12 +571,12 @@ class SSMLEditorComponent(QWidget):
             
             # Check spoken character count
             spoken_chars = self.ssml_manager.get_character_count(text, count_markup=False)
-            if spoken_chars > 5000:
-                return False, f"SSML spoken text is too long: {spoken_chars}/5000 characters"
+            if spoken_chars > MAX_DOCUMENT_CHARACTERS:
+                return False, f"SSML spoken text is too long: {spoken_chars}/{MAX_DOCUMENT_CHARACTERS} characters"
             
             return True, "Valid SSML"
         else:
             # Plain text in SSML mode
-            if len(text) > 5000:
-                return False, f"Text is too long: {len(text)}/5000 characters"
+            if len(text) > MAX_DOCUMENT_CHARACTERS:
+                return False, f"Text is too long: {len(text)}/{MAX_DOCUMENT_CHARACTERS} characters"
             return True, "Valid text"
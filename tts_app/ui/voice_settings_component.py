@@ -1,9 +1,12 @@
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QGroupBox, QPushButton
 from PyQt5.QtCore import pyqtSignal, QThread
-from models.tts_config import VoiceConfig
-from logic.voice_data_manager import VoiceDataManager, VoiceInfo
-from logic.tts_service_manager import TTSServiceManager
+from tts_app.models.tts_config import VoiceConfig
+from tts_app.logic.voice_data_manager import VoiceDataManager, VoiceInfo
+from tts_app.logic.tts_service_manager import TTSServiceManager
 from typing import List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
 
 class VoiceSettingsComponent(QWidget):
     """UI component for voice configuration settings with dynamic loading"""
@@ -76,7 +79,7 @@ class VoiceSettingsComponent(QWidget):
                 self.language_combo.addItem(name, code)
                     
         except Exception as e:
-            print(f"Failed to populate languages: {e}")
+            logger.warning("Failed to populate languages: %s", e)
             # Add fallback option
             self.language_combo.addItem("English (US)", "en-US")
     
@@ -134,7 +137,7 @@ class VoiceSettingsComponent(QWidget):
         self.voice_combo.clear()
         self.voice_combo.addItem("Failed to load voices")
         self.voice_combo.setEnabled(False)
-        print(f"Voice loading failed: {error_message}")
+        logger.warning("Voice loading failed: %s", error_message)
     
     def _on_voice_changed(self) -> None:
         """Handle voice selection change"""
@@ -181,14 +184,15 @@ class VoiceSettingsComponent(QWidget):
         
         try:
             # TODO: REMAKE THIS! alr have tts_manager in voice_manager
-            print("REfresh btn pressed")
-            # Test for internet
+            logger.debug("Refreshing voice data")
+            # Test for internet; offline the stored voice catalog is shown instead
             is_connected, connection_msg = self.tts_manager.test_connection()
-            if not is_connected:
-                raise Exception(connection_msg)
-            print("Is connected to internet")
-            # Clear cache and reload
-            self.voice_manager.refresh_data()
+            if is_connected:
+                logger.debug("Connected, fetching voice data from Google")
+                # Clear cache and reload
+                self.voice_manager.refresh_data()
+            else:
+                logger.warning("Offline, using stored voice catalog: %s", connection_msg)
             self._populate_languages()
             # Reload voices for current language
             current_language = self.language_combo.currentData()
@@ -196,7 +200,7 @@ class VoiceSettingsComponent(QWidget):
                 self._load_voices_for_language(current_language)
                
         except Exception as e:
-            print(f"Failed to refresh data: {e}")
+            logger.warning("Failed to refresh voice data: %s", e)
         finally:
             self.refresh_button.setEnabled(True)
             self.refresh_button.setText("Refresh")